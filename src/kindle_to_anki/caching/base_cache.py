@@ -1,9 +1,30 @@
+from contextlib import contextmanager
 from pathlib import Path
+import hashlib
 import json
+import pickle
+import threading
+import unicodedata
 
 from kindle_to_anki.util.paths import get_cache_dir
 
 
+# One lock per cache file, shared by every cache instance pointing at it
+_file_locks: dict[Path, threading.Lock] = {}
+_file_locks_guard = threading.Lock()
+
+# Caches with this suffix are only replayed by the test suite and are never read by hand
+TEST_CACHE_SUFFIX = "_test"
+
+# Parsed test caches shared by every LLMCache instance in the process: file -> (mtime_ns, cache)
+_shared_test_caches: dict[Path, tuple[int | None, dict]] = {}
+
+
+def _get_file_lock(cache_file: Path) -> threading.Lock:
+    with _file_locks_guard:
+        return _file_locks.setdefault(cache_file.resolve(), threading.Lock())
+
+
 class BaseCache:
     """Base class for simple caches without runtime/model/prompt keying."""
 
@@ -12,19 +33,60 @@ class BaseCache:
             cache_dir = get_cache_dir()
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file = self.cache_dir / f"{cache_name}_{cache_suffix}.json"
-        self.cache = self._load_cache()
+        # Test caches are stored pickled: replaying them skips JSON parsing entirely
+        self._binary = cache_suffix.endswith(TEST_CACHE_SUFFIX)
+        extension = "pkl" if self._binary else "json"
+        self.cache_file = self.cache_dir / f"{cache_name}_{cache_suffix}.{extension}"
+        self._lock = _get_file_lock(self.cache_file)
+        self.cache = self._initial_cache()
+
+    def _initial_cache(self):
+        return self._load_cache()
+
+    def _file_mtime_ns(self):
+        try:
+            return self.cache_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
 
     def _load_cache(self):
-        if self.cache_file.exists():
+        if self._binary:
+            if self.cache_file.exists():
+                return self._load_pickle(self.cache_file)
+            # Test caches written before they were pickled; the next save writes the .pkl file
+            return self._load_json(self.cache_file.with_suffix(".json"))
+        return self._load_json(self.cache_file)
+
+    @staticmethod
+    def _load_json(path: Path):
+        if path.exists():
             try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
+                with open(path, "r", encoding="utf-8") as f:
                     return json.load(f)
             except (json.JSONDecodeError, FileNotFoundError):
                 pass
         return {}
 
+    @staticmethod
+    def _load_pickle(path: Path):
+        # A truncated or stale pickle (e.g. from an interrupted run) is treated like a missing cache
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError, TypeError, ValueError, FileNotFoundError):
+            return {}
+
     def _save_cache(self):
+        # Several instances (e.g. concurrent evaluation runs) may share one file
+        with self._lock:
+            self._write_cache()
+
+    def _write_cache(self):
+        """Write the in-memory cache to the file; the caller holds the file lock."""
+        if self._binary:
+            with open(self.cache_file, "wb") as f:
+                pickle.dump(self.cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            return
         with open(self.cache_file, "w", encoding="utf-8") as f:
             json.dump(self.cache, f, ensure_ascii=False, indent=2)
 
@@ -34,6 +96,42 @@ class LLMCache(BaseCache):
 
     def __init__(self, cache_name: str, cache_dir=None, cache_suffix='default'):
         super().__init__(cache_name, cache_dir, cache_suffix)
+        self._deferred_depth = 0
+        self._dirty = False
+
+    def _initial_cache(self):
+        """
+        Test caches are parsed once per process: runtimes open a fresh cache on every call,
+        so later instances reuse the parsed dict unless the file changed on disk meanwhile.
+        Concurrent evaluation runs therefore write through one shared dict and never drop
+        each other's entries.
+        """
+        if not self._binary:
+            return self._load_cache()
+        with self._lock:
+            cache_key = self.cache_file.resolve()
+            mtime_ns = self._file_mtime_ns()
+            shared = _shared_test_caches.get(cache_key)
+            if shared is not None and shared[0] == mtime_ns:
+                return shared[1]
+            cache = self._load_cache()
+            _shared_test_caches[cache_key] = (mtime_ns, cache)
+            return cache
+
+    def _write_cache(self):
+        super()._write_cache()
+        if self._binary:
+            _shared_test_caches[self.cache_file.resolve()] = (self._file_mtime_ns(), self.cache)
+
+    @staticmethod
+    def _content_uid(*parts: str) -> str:
+        """
+        Cache UID hashed from the input text, shared by every note UID with the same input.
+        Text is NFC-normalized first, so decomposed diacritics (e.g. from pasted text) hash like composed ones.
+        """
+        text = unicodedata.normalize("NFC", "|".join(parts))
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"content_{digest[:16]}"
 
     def _make_key(self, runtime: str, model: str, prompt: str) -> str:
         return f"{runtime}|{model}|{prompt}"
@@ -49,13 +147,36 @@ class LLMCache(BaseCache):
             return entry["data"]
         return None
 
-    def set(self, uid: str, runtime: str, model: str, prompt: str, result, timestamp=None):
-        """Set cached result for UID with specific runtime/model/prompt combination."""
-        if uid not in self.cache:
-            self.cache[uid] = {}
+    def set(self, uid: str, runtime: str, model: str, prompt: str, result, timestamp=None, aliases=()):
+        """
+        Set cached result for UID with specific runtime/model/prompt combination.
+        The same entry is also stored under every alias UID, in a single save.
+        """
         key = self._make_key(runtime, model, prompt)
-        self.cache[uid][key] = {
+        entry = {
             "data": result,
             "timestamp": timestamp
         }
-        self._save_cache()
+        # Mutate under the file lock: test caches share one dict between instances
+        with self._lock:
+            for entry_uid in (uid, *aliases):
+                self.cache.setdefault(entry_uid, {})[key] = entry
+            if self._deferred_depth:
+                self._dirty = True
+            else:
+                self._write_cache()
+
+    @contextmanager
+    def deferred_writes(self):
+        """
+        Hold back file writes from set() until the block exits, then write the file once.
+        Use around a loop of set() calls, e.g. caching every result of one batch.
+        """
+        self._deferred_depth += 1
+        try:
+            yield self
+        finally:
+            self._deferred_depth -= 1
+            if not self._deferred_depth and self._dirty:
+                self._dirty = False
+                self._save_cache()
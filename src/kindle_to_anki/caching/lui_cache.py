@@ -1,6 +1,22 @@
+import re
+
 from kindle_to_anki.caching.base_cache import LLMCache
 
+# Dashes, ellipses and quote marks around a clipping vary between highlights of the same sentence
+_SENTENCE_EDGE_PUNCTUATION = re.compile(r"^[\s\-–—…\"'„”“«»]+|[\s\-–—…\"'„”“«»]+$")
+
 
 class LUICache(LLMCache):
     def __init__(self, cache_dir=None, cache_suffix='default'):
         super().__init__("lui_cache", cache_dir, cache_suffix)
+
+    @staticmethod
+    def content_uid(word: str, sentence: str) -> str:
+        """
+        Cache UID derived from the input text, so the same word in the same sentence
+        hits the cache even when it arrives under a different note UID.
+        Whitespace runs in the sentence are collapsed and leading/trailing dashes, ellipses
+        and quotes are dropped; the word is kept verbatim.
+        """
+        sentence = _SENTENCE_EDGE_PUNCTUATION.sub("", " ".join(sentence.split()))
+        return LLMCache._content_uid(word, sentence)
@@ -4,3 +4,8 @@ from kindle_to_anki.caching.base_cache import LLMCache
 class UsageLevelCache(LLMCache):
     def __init__(self, cache_dir=None, cache_suffix='default'):
         super().__init__("usage_level_cache", cache_dir, cache_suffix)
+
+    @staticmethod
+    def content_uid(word: str, lemma: str, pos: str, sentence: str, definition: str) -> str:
+        """Cache UID derived from the input fields, with whitespace runs in the sentence collapsed."""
+        return LLMCache._content_uid(word, lemma, pos, " ".join(sentence.split()), definition)
@@ -1,3 +1,5 @@
+import threading
+
 from kindle_to_anki.platforms.platform_registry import PlatformRegistry
 from kindle_to_anki.platforms.openai_platform import OpenAIPlatform
 from kindle_to_anki.platforms.grok_platform import GrokPlatform
@@ -10,16 +12,20 @@ from kindle_to_anki.core.models.model_loader import load_models_from_yaml
 from kindle_to_anki.core.runtimes.runtime_registry import RuntimeRegistry
 from kindle_to_anki.tasks.lui.runtime_chat_completion import ChatCompletionLUI
 from kindle_to_anki.tasks.translation.runtime_chat_completion import ChatCompletionTranslation
+from kindle_to_anki.tasks.translation.runtime_chat_completion_batch import ChatCompletionTranslationBatch
 from kindle_to_anki.tasks.translation.runtime_deepl import DeepLTranslation
 from kindle_to_anki.tasks.translation.runtime_polish_local import PolishLocalTranslation
 from kindle_to_anki.tasks.wsd.runtime_chat_completion import ChatCompletionWSD
+from kindle_to_anki.tasks.wsd.runtime_chat_completion_batch import ChatCompletionWSDBatch
 from kindle_to_anki.tasks.hint.runtime_chat_completion import ChatCompletionHint
 from kindle_to_anki.tasks.cloze_scoring.runtime_chat_completion import ChatCompletionClozeScoring
 from kindle_to_anki.tasks.usage_level.runtime_chat_completion import ChatCompletionUsageLevel
+from kindle_to_anki.tasks.usage_level.runtime_chat_completion_batch import ChatCompletionUsageLevelBatch
 from kindle_to_anki.tasks.collocation.runtime_chat_completion import ChatCompletionCollocation
 from kindle_to_anki.tasks.collect_candidates.runtime_kindle import KindleCandidateRuntime
 
 _bootstrapped = False
+_bootstrap_lock = threading.Lock()
 
 
 def bootstrap_platform_registry():
@@ -45,13 +51,22 @@ def bootstrap_runtime_registry():
     RuntimeRegistry.register(ChatCompletionCollocation())
     RuntimeRegistry.register(PolishLocalTranslation())
     RuntimeRegistry.register(KindleCandidateRuntime())
+    # Batch API runtimes are opt-in via the task's runtime setting; registered last so
+    # the synchronous runtimes stay the default (first) choice for each task
+    RuntimeRegistry.register(ChatCompletionTranslationBatch())
+    RuntimeRegistry.register(ChatCompletionWSDBatch())
+    RuntimeRegistry.register(ChatCompletionUsageLevelBatch())
 
 
 def bootstrap_all():
     global _bootstrapped
     if _bootstrapped:
         return
-    bootstrap_platform_registry()
-    bootstrap_model_registry()
-    bootstrap_runtime_registry()
-    _bootstrapped = True
+    # UI background threads may race to bootstrap; only the first one registers
+    with _bootstrap_lock:
+        if _bootstrapped:
+            return
+        bootstrap_platform_registry()
+        bootstrap_model_registry()
+        bootstrap_runtime_registry()
+        _bootstrapped = True
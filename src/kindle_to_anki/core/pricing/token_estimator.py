@@ -1,4 +1,4 @@
-import tiktoken
+from functools import lru_cache
 
 from kindle_to_anki.core.models.modelspec import ModelSpec
 
@@ -10,19 +10,28 @@ except ImportError:
     TIKTOKEN_AVAILABLE = False
 
 
+@lru_cache(maxsize=None)
+def _get_encoding(encoding_name: str):
+    return tiktoken.get_encoding(encoding_name)
+
+
+@lru_cache(maxsize=1024)
+def _count_encoded_tokens(text: str, encoding_name: str) -> int:
+    # Static prompt parts and repeated sentences are counted many times per run
+    return len(_get_encoding(encoding_name).encode(text))
+
 
 def count_tokens(text: str, model: ModelSpec):
     """Count exact tokens using tiktoken when available, fallback to estimation"""
     if not text:
         return 0
 
-    try:
-        encoding_name = model.encoding
-        encoding = tiktoken.get_encoding(encoding_name)
-        return len(encoding.encode(text))
-    except Exception:
-        # Fallback to ratio estimation if tiktoken fails
-        pass
+    if TIKTOKEN_AVAILABLE:
+        try:
+            return _count_encoded_tokens(text, model.encoding)
+        except Exception:
+            # Fallback to ratio estimation if tiktoken fails
+            pass
 
     # Fallback: use model-specific character-to-token ratio
     ratio = 4.0
@@ -29,6 +29,8 @@ class PromptSpec:
         self.id = spec.get("id", "unknown")
         self.version = spec.get("version", "0.0")
         self.supported_source_language = spec.get("supported_source_language", "all")
+        # Prompts whose output is JSON only can use the platform's JSON mode
+        self.json_only = spec.get("constraints", {}).get("json_only", False)
 
     def supports_language(self, language_code: str) -> bool:
         """Check if this prompt supports the given source language."""
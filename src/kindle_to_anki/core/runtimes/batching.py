@@ -0,0 +1,97 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Tuple, TypeVar
+
+from kindle_to_anki.logging import get_logger
+from kindle_to_anki.core.runtimes.batch_call_result import BatchCallResult
+from kindle_to_anki.util.cancellation import CancellationToken, CancelledException, NONE_TOKEN
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def make_length_bucketed_batches(items: List[T], batch_size: int, item_length: Callable[[T], int], max_batch_length: int) -> List[List[T]]:
+    """
+    Split items into batches of similar length for packed prompts.
+    Items are sorted by item_length and packed greedily, closing a batch once it holds
+    batch_size items or adding the next item would exceed max_batch_length. An item longer
+    than max_batch_length gets a batch of its own. Callers map results back by UID.
+    """
+    batches = []
+    batch = []
+    batch_length = 0
+
+    for item in sorted(items, key=item_length):
+        length = item_length(item)
+        if batch and (len(batch) >= batch_size or batch_length + length > max_batch_length):
+            batches.append(batch)
+            batch = []
+            batch_length = 0
+        batch.append(item)
+        batch_length += length
+
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def run_batches_concurrently(batches: List[List[T]], call_batch: Callable[[int, List[T]], R], max_concurrent_batches: int) -> Iterator[Tuple[List[T], R]]:
+    """
+    Run call_batch(batch_num, batch) for every batch on up to max_concurrent_batches threads.
+    Yields (batch, result) pairs in batch order, so callers apply results on their own thread
+    while later calls are still in flight. batch_num is 1-based.
+    If a call or the consumer raises (or the consumer stops early), batches not yet
+    started are cancelled instead of being sent.
+    """
+    if not batches:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(max_concurrent_batches, len(batches)))
+    try:
+        futures = [executor.submit(call_batch, batch_num, batch) for batch_num, batch in enumerate(batches, 1)]
+
+        for batch, future in zip(batches, futures):
+            yield batch, future.result()
+    except BaseException:
+        # GeneratorExit included: do not wait on or start paid API calls after a failure
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+
+def run_batch_job(platform, model_id: str, batches: List[List[T]], build_prompt: Callable[[List[T]], str], parse_response: Callable[[str], BatchCallResult], job_name: str, cancellation_token: CancellationToken = NONE_TOKEN, json_response: bool = False) -> List[Tuple[List[T], BatchCallResult]]:
+    """
+    Submit every batch as one platform batch job (e.g. the OpenAI Batch API) and
+    return (batch, result) pairs in batch order; job_name labels the log lines.
+    A batch missing from the job's output, or every batch when the job itself
+    fails, gets an unsuccessful BatchCallResult; cancellation is re-raised.
+    """
+    logger = get_logger()
+    prompts = {f"batch_{batch_num}": build_prompt(batch) for batch_num, batch in enumerate(batches, 1)}
+
+    logger.info(f"Submitting {len(batches)} {job_name} batches ({sum(len(batch) for batch in batches)} inputs) as one batch job...")
+
+    start_time = time.time()
+
+    try:
+        responses = platform.call_api_batch(model_id, prompts, cancellation_token=cancellation_token, json_response=json_response)
+    except CancelledException:
+        raise
+    except Exception as e:
+        logger.error(f"Batch job failed: {e}")
+        return [(batch, BatchCallResult(success=False, error=str(e))) for batch in batches]
+
+    elapsed = time.time() - start_time
+    logger.info(f"Batch job completed in {elapsed:.2f}s ({len(responses)}/{len(batches)} batches returned)")
+
+    results = []
+    for custom_id, batch in zip(prompts, batches):
+        if custom_id not in responses:
+            logger.warning(f"no response for {custom_id} in batch job")
+            results.append((batch, BatchCallResult(success=False, error=f"no response for {custom_id}")))
+            continue
+
+        logger.debug(f"Full response for {custom_id}:\n{responses[custom_id]}")
+        results.append((batch, parse_response(responses[custom_id])))
+
+    return results
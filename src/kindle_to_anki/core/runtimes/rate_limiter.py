@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from kindle_to_anki.core.models.modelspec import ModelSpec
+
+
+class RateLimiter:
+    """
+    Token-bucket throttle for a model's requests-per-minute and tokens-per-minute limits.
+    Callers block in acquire() until both buckets can afford the request, instead of
+    sending it and waiting out a rate-limit error. Safe to share between threads.
+    """
+
+    def __init__(self, rpm_limit: Optional[int] = None, tpm_limit: Optional[int] = None):
+        self.rpm_limit = rpm_limit
+        self.tpm_limit = tpm_limit
+        self._request_allowance = float(rpm_limit or 0)
+        self._token_allowance = float(tpm_limit or 0)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.rpm_limit:
+            self._request_allowance = min(self.rpm_limit, self._request_allowance + elapsed * self.rpm_limit / 60)
+        if self.tpm_limit:
+            self._token_allowance = min(self.tpm_limit, self._token_allowance + elapsed * self.tpm_limit / 60)
+
+    def acquire(self, tokens: int = 0):
+        """Block until one request of the given token cost fits within both limits, then spend it."""
+        # A single request larger than the whole minute budget can never fit; let it through on a full bucket
+        if self.tpm_limit:
+            tokens = min(tokens, self.tpm_limit)
+
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                wait = 0.0
+                if self.rpm_limit and self._request_allowance < 1:
+                    wait = max(wait, (1 - self._request_allowance) * 60 / self.rpm_limit)
+                if self.tpm_limit and self._token_allowance < tokens:
+                    wait = max(wait, (tokens - self._token_allowance) * 60 / self.tpm_limit)
+                if wait == 0.0:
+                    if self.rpm_limit:
+                        self._request_allowance -= 1
+                    if self.tpm_limit:
+                        self._token_allowance -= tokens
+                    return
+            time.sleep(wait)
+
+
+# One limiter per (platform, model): every runtime calling the model draws from the same budget
+_rate_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+_rate_limiters_guard = threading.Lock()
+
+
+def get_rate_limiter(model: ModelSpec) -> Optional[RateLimiter]:
+    """Return the shared limiter for the model, or None if the model declares no limits."""
+    if not model.rpm_limit and not model.tpm_limit:
+        return None
+    with _rate_limiters_guard:
+        key = (model.platform_id, model.id)
+        if key not in _rate_limiters:
+            _rate_limiters[key] = RateLimiter(model.rpm_limit, model.tpm_limit)
+        return _rate_limiters[key]
@@ -6,11 +6,20 @@ class ChatCompletionPlatform(ABC):
     Abstract base class for chat-completion style APIs.
     """
 
+    # Platforms that can run many prompts as one asynchronous, discounted job set this
+    # and implement call_api_batch
+    supports_batch_api: bool = False
+
+    # Retries the SDK client makes on rate-limit (429), server (5xx) and connection errors,
+    # with exponential backoff and jitter, before a call fails its whole batch
+    max_retries: int = 5
+
     @abstractmethod
-    def call_api(self, model: str, messages: list[dict], **kwargs) -> str:
+    def call_api(self, model: str, messages: list[dict], json_response: bool = False, **kwargs) -> str:
         """
         Sends messages to the platform and returns a string response.
         messages: list of dicts, e.g. [{"role": "user", "content": "..."}]
+        json_response: constrain the model to emit a single JSON object (the platform's JSON mode)
         kwargs: optional platform-specific parameters
         """
         pass
@@ -21,3 +30,10 @@ class ChatCompletionPlatform(ABC):
         Optional: verify that API keys or auth are set correctly.
         """
         pass
+
+    def call_api_batch(self, model: str, prompts: dict[str, str], **kwargs) -> dict[str, str]:
+        """
+        Optional: run many prompts as one batch job and return responses keyed like prompts.
+        Only available when supports_batch_api is True.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batch jobs")
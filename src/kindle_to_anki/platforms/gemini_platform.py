@@ -1,8 +1,10 @@
 # platforms/gemini_platform.py
 import os
+import threading
 import time
 from kindle_to_anki.logging import get_logger
 from google import genai
+from google.genai import types
 
 from .chat_completion_platform import ChatCompletionPlatform
 
@@ -18,6 +20,7 @@ class GeminiPlatform(ChatCompletionPlatform):
     def __init__(self, api_key: str = None):
         self._api_key = api_key
         self._client = None
+        self._client_lock = threading.Lock()
         self._credentials_valid = None
 
     @property
@@ -28,8 +31,13 @@ class GeminiPlatform(ChatCompletionPlatform):
 
     @property
     def client(self):
+        # Batches call concurrently; build one client so every call shares its connection pool
         if self._client is None and self.api_key:
-            self._client = genai.Client(api_key=self.api_key)
+            with self._client_lock:
+                if self._client is None:
+                    # attempts counts the first try as well as the retries
+                    retry_options = types.HttpRetryOptions(attempts=self.max_retries + 1)
+                    self._client = genai.Client(api_key=self.api_key, http_options=types.HttpOptions(retry_options=retry_options))
         return self._client
 
     def _wait_for_rate_limit(self, model: str):
@@ -43,12 +51,15 @@ class GeminiPlatform(ChatCompletionPlatform):
                 time.sleep(remaining)
             del _rate_limit_tracker[model]
 
-    def call_api(self, model: str, prompt: str, **kwargs) -> str:
+    def call_api(self, model: str, prompt: str, json_response: bool = False, **kwargs) -> str:
         """
         Call Gemini API.
+        json_response: request an application/json response, so the reply is always parseable JSON
         """
         if not self.client:
             raise RuntimeError("Gemini client not initialized - API key missing")
+        if json_response:
+            kwargs.setdefault("config", types.GenerateContentConfig(response_mime_type="application/json"))
 
         self._wait_for_rate_limit(model)
 
@@ -1,5 +1,6 @@
 # platforms/grok_platform.py
 import os
+import threading
 from openai import OpenAI
 
 from .chat_completion_platform import ChatCompletionPlatform
@@ -12,6 +13,7 @@ class GrokPlatform(ChatCompletionPlatform):
     def __init__(self, api_key: str = None):
         self._api_key = api_key
         self._client = None
+        self._client_lock = threading.Lock()
         self._credentials_valid = None
 
     @property
@@ -22,17 +24,23 @@ class GrokPlatform(ChatCompletionPlatform):
 
     @property
     def client(self):
+        # Batches call concurrently; build one client so every call shares its connection pool
         if self._client is None and self.api_key:
-            self._client = OpenAI(api_key=self.api_key, base_url="https://api.x.ai/v1")
+            with self._client_lock:
+                if self._client is None:
+                    self._client = OpenAI(api_key=self.api_key, base_url="https://api.x.ai/v1", max_retries=self.max_retries)
         return self._client
 
-    def call_api(self, model: str, prompt: str, **kwargs) -> str:
+    def call_api(self, model: str, prompt: str, json_response: bool = False, **kwargs) -> str:
         """
         Call Grok ChatCompletion API.
+        json_response: use JSON mode, so the reply is always one parseable JSON object
         """
         if not self.client:
             raise RuntimeError("Grok client not initialized - API key missing")
         messages = [{"role": "user", "content": prompt}]
+        if json_response:
+            kwargs.setdefault("response_format", {"type": "json_object"})
 
         response = self.client.chat.completions.create(
             model=model, 
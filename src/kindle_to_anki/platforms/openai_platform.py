@@ -1,17 +1,25 @@
 # platforms/openai_platform.py
+import json
 import os
+import threading
+import time
 from openai import OpenAI
 
+from kindle_to_anki.util.cancellation import CancellationToken, NONE_TOKEN
 from .chat_completion_platform import ChatCompletionPlatform
 
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
 
 class OpenAIPlatform(ChatCompletionPlatform):
     id = "openai"
     name = "OpenAI"
+    supports_batch_api = True
 
     def __init__(self, api_key: str = None):
         self._api_key = api_key
         self._client = None
+        self._client_lock = threading.Lock()
         self._credentials_valid = None
 
     @property
@@ -22,19 +30,25 @@ class OpenAIPlatform(ChatCompletionPlatform):
 
     @property
     def client(self):
+        # Batches call concurrently; build one client so every call shares its connection pool
         if self._client is None and self.api_key:
-            self._client = OpenAI(api_key=self.api_key)
+            with self._client_lock:
+                if self._client is None:
+                    self._client = OpenAI(api_key=self.api_key, max_retries=self.max_retries)
         return self._client
 
-    def call_api(self, model: str, prompt: str, **kwargs) -> str:
+    def call_api(self, model: str, prompt: str, json_response: bool = False, **kwargs) -> str:
         """
         Call OpenAI ChatCompletion API.
         messages: list of dicts [{"role": "user", "content": "..."}]
+        json_response: use JSON mode, so the reply is always one parseable JSON object
         kwargs: optional OpenAI parameters (temperature, max_tokens, etc.)
         """
         if not self.client:
             raise RuntimeError("OpenAI client not initialized - API key missing")
         messages = [{"role": "user", "content": prompt}]
+        if json_response:
+            kwargs.setdefault("response_format", {"type": "json_object"})
 
         response = self.client.chat.completions.create(
             model=model, 
@@ -43,6 +57,62 @@ class OpenAIPlatform(ChatCompletionPlatform):
         )
         return response.choices[0].message.content
 
+    def call_api_batch(self, model: str, prompts: dict[str, str], poll_interval: float = 30.0, initial_poll_interval: float = 5.0, cancellation_token: CancellationToken = NONE_TOKEN, json_response: bool = False, **kwargs) -> dict[str, str]:
+        """
+        Run prompts through the OpenAI Batch API: half the price of call_api, but the
+        job may take up to 24h to complete, so this blocks while polling.
+        prompts: dict mapping a caller-chosen custom_id to its prompt
+        Polling starts at initial_poll_interval and doubles up to poll_interval.
+        Returns a dict mapping custom_id to response content; failed requests are omitted.
+        """
+        if not self.client:
+            raise RuntimeError("OpenAI client not initialized - API key missing")
+        if json_response:
+            kwargs.setdefault("response_format", {"type": "json_object"})
+
+        lines = []
+        for custom_id, prompt in prompts.items():
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"model": model, "messages": [{"role": "user", "content": prompt}], **kwargs},
+            }, ensure_ascii=False))
+
+        input_file = self.client.files.create(
+            file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+        delay = min(initial_poll_interval, poll_interval)
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            if cancellation_token.is_cancelled:
+                self.client.batches.cancel(batch.id)
+                cancellation_token.raise_if_cancelled()
+            time.sleep(delay)
+            delay = min(delay * 2, poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status '{batch.status}'")
+
+        responses = {}
+        if batch.output_file_id:
+            output_text = self.client.files.content(batch.output_file_id).text
+            for line in output_text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    responses[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        return responses
+
     def validate_credentials(self):
         """
         Verify that API key is set correctly by making a simple test call.
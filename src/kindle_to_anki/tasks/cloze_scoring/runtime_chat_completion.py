@@ -197,12 +197,14 @@ class ChatCompletionClozeScoring:
                 failing_inputs.extend(batch)
                 continue
 
-            for input_item in batch:
-                if input_item.uid in result.results:
-                    cache.set(input_item.uid, self.id, result.model_id, runtime_config.prompt_id, result.results[input_item.uid], result.timestamp)
-                    logger.trace(f"scored {input_item.word}")
-                else:
-                    logger.warning(f"no result for {input_item.word}")
-                    failing_inputs.append(input_item)
+            # The cache file is written once for the whole batch, not once per result
+            with cache.deferred_writes():
+                for input_item in batch:
+                    if input_item.uid in result.results:
+                        cache.set(input_item.uid, self.id, result.model_id, runtime_config.prompt_id, result.results[input_item.uid], result.timestamp)
+                        logger.trace(f"scored {input_item.word}")
+                    else:
+                        logger.warning(f"no result for {input_item.word}")
+                        failing_inputs.append(input_item)
 
         return failing_inputs
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClozeScoringInput:
     uid: str
     word: str
@@ -10,6 +10,6 @@ class ClozeScoringInput:
     sentence: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClozeScoringOutput:
     cloze_deletion_score: int
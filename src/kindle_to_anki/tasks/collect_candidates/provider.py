@@ -1,5 +1,5 @@
 # tasks/collect_candidates/provider.py
-from typing import List, Dict, Tuple
+from typing import Dict, Iterable, List, Tuple
 from datetime import datetime
 
 from kindle_to_anki.logging import get_logger
@@ -37,12 +37,8 @@ class CollectCandidatesProvider:
             # Pick default runtime (first in dict)
             runtime = next(iter(self.runtimes.values()))
 
-        # Collect candidate data using the runtime
-        candidate_outputs: List[CandidateOutput] = runtime.collect_candidates()
-
-        if not candidate_outputs:
-            get_logger().info("No candidate data collected")
-            return {}, 0
+        # Collect candidate data using the runtime; outputs are streamed, so consume them once
+        candidate_outputs: Iterable[CandidateOutput] = runtime.collect_candidates()
 
         # Convert CandidateOutput objects to AnkiNote objects and group by language
         notes_by_language = {}
@@ -71,4 +67,8 @@ class CollectCandidatesProvider:
                 if latest_timestamp is None or candidate_output.timestamp > latest_timestamp:
                     latest_timestamp = candidate_output.timestamp
 
+        if not notes_by_language:
+            get_logger().info("No candidate data collected")
+            return {}, 0
+
         return notes_by_language, latest_timestamp
@@ -1,8 +1,9 @@
 import sqlite3
 import unicodedata
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Iterator
 
 from kindle_to_anki.logging import get_logger
 from kindle_to_anki.core.pricing.usage_breakdown import UsageBreakdown
@@ -13,6 +14,36 @@ from .schema import CandidateOutput
 from kindle_to_anki.metadata.metdata_manager import MetadataManager
 
 
+# Read-only tuning for scanning vocab.db: memory-map up to 256 MB, use a 64 MB page cache
+# and keep the temporary b-tree for ORDER BY timestamp in memory
+_READ_PRAGMAS = (
+    "PRAGMA query_only = 1",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+)
+
+_VOCAB_COUNT_QUERY = """
+SELECT COUNT(*) FROM LOOKUPS
+JOIN WORDS ON LOOKUPS.word_key = WORDS.id
+WHERE WORDS.stem IS NOT NULL
+"""
+
+_NEW_VOCAB_COUNT_QUERY = _VOCAB_COUNT_QUERY + "AND LOOKUPS.timestamp > ?\n"
+
+_VOCAB_SELECT = """
+SELECT WORDS.word, WORDS.stem, LOOKUPS.usage, WORDS.lang,
+       BOOK_INFO.title, LOOKUPS.pos, LOOKUPS.timestamp
+FROM LOOKUPS
+JOIN WORDS ON LOOKUPS.word_key = WORDS.id
+LEFT JOIN BOOK_INFO ON LOOKUPS.book_key = BOOK_INFO.id
+"""
+
+_VOCAB_QUERY = _VOCAB_SELECT + "ORDER BY LOOKUPS.timestamp;"
+
+_NEW_VOCAB_QUERY = _VOCAB_SELECT + "WHERE LOOKUPS.timestamp > ?\nORDER BY LOOKUPS.timestamp;"
+
+
 class KindleCandidateRuntime:
     """
     Runtime for candidate collection from Kindle vocab.db files.
@@ -33,9 +64,12 @@ class KindleCandidateRuntime:
         self.INPUTS_DIR = get_inputs_dir()
         self.OUTPUTS_DIR = get_outputs_dir()
 
-    def collect_candidates(self) -> List[CandidateOutput]:
+    def collect_candidates(self) -> Iterator[CandidateOutput]:
         """
         Collect candidate data from Kindle database.
+
+        Candidates are yielded as rows are read, so callers can start
+        consuming before the whole vocab.db scan has finished.
         """
         logger = get_logger()
         logger.info("Starting Kindle candidate collection...")
@@ -48,41 +82,37 @@ class KindleCandidateRuntime:
         # Collect all candidates - per-deck timestamp filtering happens in the preview/export step
         _, total_count = self._get_kindle_vocab_count(db_path)
         logger.info(f"Collecting all {total_count} candidates...")
-        vocab_data = self._read_vocab_from_db(db_path)
-
-        if not vocab_data:
-            logger.info("No new candidates to collect.")
-            return []
 
-        # Convert raw data to CandidateOutput objects
-        candidate_outputs = []
-        total_words = len([row for row in vocab_data if row[1]])  # Count words with stems
         processed_count = 0
 
-        for word, stem, usage, lang, book_title, pos, timestamp in vocab_data:
-            if stem:  # Only process words with stems
-                processed_count += 1
-
-                # Generate UID using Kindle-specific formula
-                uid = self._generate_uid(word, book_title, pos)
-
-                # Convert epoch ms to datetime
-                lookup_time = datetime.fromtimestamp(timestamp / 1000) if timestamp else None
-
-                candidate_output = CandidateOutput(
-                    uid=uid,
-                    word=word,
-                    usage=usage,
-                    stem=stem,
-                    language=lang,
-                    book_title=book_title,
-                    position=pos,
-                    timestamp=lookup_time
-                )
-                candidate_outputs.append(candidate_output)
+        # Closing the row stream closes its connection, even if the caller stops early
+        with closing(self._read_vocab_from_db(db_path)) as rows:
+            for word, stem, usage, lang, book_title, pos, timestamp in rows:
+                if stem:  # Only process words with stems
+                    processed_count += 1
+
+                    # Generate UID using Kindle-specific formula
+                    uid = self._generate_uid(word, book_title, pos)
+
+                    # Convert epoch ms to datetime
+                    lookup_time = datetime.fromtimestamp(timestamp / 1000) if timestamp else None
+
+                    yield CandidateOutput(
+                        uid=uid,
+                        word=word,
+                        usage=usage,
+                        stem=stem,
+                        language=lang,
+                        book_title=book_title,
+                        position=pos,
+                        timestamp=lookup_time
+                    )
+
+        if not processed_count:
+            logger.info("No new candidates to collect.")
+            return
 
-        logger.info(f"Kindle candidate collection completed. Collected {len(candidate_outputs)} candidates.")
-        return candidate_outputs
+        logger.info(f"Kindle candidate collection completed. Collected {processed_count} candidates.")
 
     def _generate_uid(self, word: str, book_title: str, position: str) -> str:
         """Generate unique ID for Kindle vocabulary entry based on word, book, and location."""
@@ -134,31 +164,36 @@ class KindleCandidateRuntime:
         logger.error(f"vocab.db not found at {db_path}")
         raise FileNotFoundError(f"vocab.db not found at {db_path}. Please provide a valid vocab.db file.")
 
+    def _connect(self, db_path) -> sqlite3.Connection:
+        """
+        Open a read-only connection to db_path. Callers close it when done: an open
+        (memory-mapped) vocab.db cannot be replaced on Windows by the next import.
+        """
+        db_path = Path(db_path).resolve()
+        # Rows stay plain tuples (the default row factory) and are unpacked positionally;
+        # autocommit avoids the module's implicit transaction bookkeeping for pure reads
+        conn = sqlite3.connect(
+            f"{db_path.as_uri()}?mode=ro",
+            uri=True,
+            detect_types=0,
+            isolation_level=None,
+        )
+        for pragma in _READ_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
     def _get_kindle_vocab_count(self, db_path, timestamp=None):
         """Get count of kindle vocab builder entries available for import"""
-        conn = sqlite3.connect(db_path)
-        cur = conn.cursor()
-
-        if timestamp:
-            query = """
-            SELECT COUNT(*) FROM LOOKUPS
-            JOIN WORDS ON LOOKUPS.word_key = WORDS.id
-            WHERE WORDS.stem IS NOT NULL AND LOOKUPS.timestamp > ?
-            """
-            timestamp_ms = int(timestamp.timestamp() * 1000)
-            new_count = cur.execute(query, (timestamp_ms,)).fetchone()[0]
-        else:
-            new_count = None
-
-        # Get total count
-        total_query = """
-        SELECT COUNT(*) FROM LOOKUPS
-        JOIN WORDS ON LOOKUPS.word_key = WORDS.id
-        WHERE WORDS.stem IS NOT NULL
-        """
-        total_count = cur.execute(total_query).fetchone()[0]
+        with closing(self._connect(db_path)) as conn:
+            if timestamp:
+                timestamp_ms = int(timestamp.timestamp() * 1000)
+                new_count = conn.execute(_NEW_VOCAB_COUNT_QUERY, (timestamp_ms,)).fetchone()[0]
+            else:
+                new_count = None
+
+            # Get total count
+            total_count = conn.execute(_VOCAB_COUNT_QUERY).fetchone()[0]
 
-        conn.close()
         return new_count, total_count
 
     def _handle_incremental_import(self, db_path, last_timestamp: datetime):
@@ -174,32 +209,10 @@ class KindleCandidateRuntime:
         logger.info("Collecting only new kindle vocab builder entries...")
         return self._read_vocab_from_db(db_path, timestamp_ms)
 
-    def _read_vocab_from_db(self, db_path, timestamp=None):
-        """Read vocabulary data from the Kindle database"""
-        conn = sqlite3.connect(db_path)
-        cur = conn.cursor()
-
-        if timestamp:
-            query = """
-            SELECT WORDS.word, WORDS.stem, LOOKUPS.usage, WORDS.lang, 
-                   BOOK_INFO.title, LOOKUPS.pos, LOOKUPS.timestamp
-            FROM LOOKUPS
-            JOIN WORDS ON LOOKUPS.word_key = WORDS.id
-            LEFT JOIN BOOK_INFO ON LOOKUPS.book_key = BOOK_INFO.id
-            WHERE LOOKUPS.timestamp > ?
-            ORDER BY LOOKUPS.timestamp;
-            """
-            rows = cur.execute(query, (timestamp,)).fetchall()
-        else:
-            query = """
-            SELECT WORDS.word, WORDS.stem, LOOKUPS.usage, WORDS.lang, 
-                   BOOK_INFO.title, LOOKUPS.pos, LOOKUPS.timestamp
-            FROM LOOKUPS
-            JOIN WORDS ON LOOKUPS.word_key = WORDS.id
-            LEFT JOIN BOOK_INFO ON LOOKUPS.book_key = BOOK_INFO.id
-            ORDER BY LOOKUPS.timestamp;
-            """
-            rows = cur.execute(query).fetchall()
-
-        conn.close()
-        return rows
+    def _read_vocab_from_db(self, db_path, timestamp=None) -> Iterator[tuple]:
+        """Stream vocabulary rows from the Kindle database; the connection closes with the stream"""
+        with closing(self._connect(db_path)) as conn:
+            if timestamp:
+                yield from conn.execute(_NEW_VOCAB_QUERY, (timestamp,))
+            else:
+                yield from conn.execute(_VOCAB_QUERY)
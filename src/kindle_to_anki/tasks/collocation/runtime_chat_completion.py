@@ -243,21 +243,23 @@ class ChatCompletionCollocation:
                 failing_inputs.extend(batch)
                 continue
 
-            for input_item in batch:
-                if input_item.uid in result.results:
-                    collocation_data = result.results[input_item.uid]
-
-                    # Create collocation result for caching
-                    collocation_result = {
-                        "collocations": collocation_data.get("collocations", [])
-                    }
-
-                    # Save to cache
-                    cache.set(input_item.uid, self.id, result.model_id, runtime_config.prompt_id, collocation_result, result.timestamp)
-
-                    logger.trace(f"found collocations for {input_item.lemma}")
-                else:
-                    logger.warning(f"no collocation result for {input_item.lemma}")
-                    failing_inputs.append(input_item)
+            # The cache file is written once for the whole batch, not once per result
+            with cache.deferred_writes():
+                for input_item in batch:
+                    if input_item.uid in result.results:
+                        collocation_data = result.results[input_item.uid]
+
+                        # Create collocation result for caching
+                        collocation_result = {
+                            "collocations": collocation_data.get("collocations", [])
+                        }
+
+                        # Save to cache
+                        cache.set(input_item.uid, self.id, result.model_id, runtime_config.prompt_id, collocation_result, result.timestamp)
+
+                        logger.trace(f"found collocations for {input_item.lemma}")
+                    else:
+                        logger.warning(f"no collocation result for {input_item.lemma}")
+                        failing_inputs.append(input_item)
 
         return failing_inputs
@@ -2,13 +2,13 @@ from dataclasses import dataclass
 from typing import List
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CollocationInput:
     uid: str
     lemma: str
     pos: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CollocationOutput:
     collocations: List[str]
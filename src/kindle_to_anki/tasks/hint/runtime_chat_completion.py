@@ -91,6 +91,10 @@ class ChatCompletionHint:
             cached_count = 0
             for hint_input in hint_inputs:
                 cached_result = cache.get(hint_input.uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
+                if not cached_result:
+                    # Fall back to a result for the same input stored under another UID
+                    content_uid = HintCache.content_uid(hint_input.word, hint_input.lemma, hint_input.pos, hint_input.sentence)
+                    cached_result = cache.get(content_uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
                 if cached_result:
                     cached_count += 1
                     outputs.append(HintOutput(hint=cached_result.get('hint', '')))
@@ -106,9 +110,18 @@ class ChatCompletionHint:
             logger.info(f"Hint generation completed (all from cache).")
             return [output for output in outputs if output is not None]
 
+        # Identical inputs under different UIDs need one call; the others read its result by content UID
+        inputs_by_content: Dict[str, HintInput] = {}
+        for hint_input in inputs_needing_generation:
+            inputs_by_content.setdefault(HintCache.content_uid(hint_input.word, hint_input.lemma, hint_input.pos, hint_input.sentence), hint_input)
+        unique_inputs = list(inputs_by_content.values())
+
+        if len(unique_inputs) < len(inputs_needing_generation):
+            logger.info(f"{len(inputs_needing_generation) - len(unique_inputs)} inputs duplicate another input and reuse its result")
+
         MAX_RETRIES = 1
         retries = 0
-        failing_inputs = self._process_batches(inputs_needing_generation, cache, source_language_name, runtime_config, cancellation_token)
+        failing_inputs = self._process_batches(unique_inputs, cache, source_language_name, runtime_config, cancellation_token)
 
         while len(failing_inputs) > 0:
             cancellation_token.raise_if_cancelled()
@@ -121,7 +134,9 @@ class ChatCompletionHint:
         for i, output in enumerate(outputs):
             if output is None:
                 hint_input = hint_inputs[i]
-                cached_result = cache.get(hint_input.uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
+                # Looked up by content UID, which also covers inputs deduplicated above
+                content_uid = HintCache.content_uid(hint_input.word, hint_input.lemma, hint_input.pos, hint_input.sentence)
+                cached_result = cache.get(content_uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
                 if cached_result:
                     hint_outputs.append(HintOutput(hint=cached_result.get('hint', '')))
                 else:
@@ -179,6 +194,7 @@ class ChatCompletionHint:
         return BatchCallResult(success=True, results=parsed_results, model_id=runtime_config.model_id, timestamp=processing_timestamp)
 
     def _process_batches(self, inputs_needing_generation: List[HintInput], cache: HintCache, source_language_name: str, runtime_config: RuntimeConfig, cancellation_token: CancellationToken = NONE_TOKEN) -> List[HintInput]:
+        """Process inputs in batches; each result is cached under the input's UID and content UID."""
         logger = get_logger()
         processing_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
         total_batches = (len(inputs_needing_generation) + runtime_config.batch_size - 1) // runtime_config.batch_size
@@ -197,12 +213,15 @@ class ChatCompletionHint:
                 failing_inputs.extend(batch)
                 continue
 
-            for input_item in batch:
-                if input_item.uid in result.results:
-                    cache.set(input_item.uid, self.id, result.model_id, runtime_config.prompt_id, result.results[input_item.uid], result.timestamp)
-                    logger.trace(f"generated hint for {input_item.word}")
-                else:
-                    logger.warning(f"no result for {input_item.word}")
-                    failing_inputs.append(input_item)
+            # The cache file is written once for the whole batch, not once per result
+            with cache.deferred_writes():
+                for input_item in batch:
+                    if input_item.uid in result.results:
+                        content_uid = HintCache.content_uid(input_item.word, input_item.lemma, input_item.pos, input_item.sentence)
+                        cache.set(input_item.uid, self.id, result.model_id, runtime_config.prompt_id, result.results[input_item.uid], result.timestamp, aliases=(content_uid,))
+                        logger.trace(f"generated hint for {input_item.word}")
+                    else:
+                        logger.warning(f"no result for {input_item.word}")
+                        failing_inputs.append(input_item)
 
         return failing_inputs
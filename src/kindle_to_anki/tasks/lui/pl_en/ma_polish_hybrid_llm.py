@@ -2,11 +2,58 @@ import json
 import time
 from typing import List, Dict, Any
 
+from kindle_to_anki.core.models.registry import ModelRegistry
+from kindle_to_anki.core.pricing.token_estimator import count_tokens
 from kindle_to_anki.core.runtimes.batch_call_result import BatchCallResult
+from kindle_to_anki.core.runtimes.batching import run_batches_concurrently
+from kindle_to_anki.core.runtimes.rate_limiter import get_rate_limiter
 from kindle_to_anki.anki.anki_note import AnkiNote
 from kindle_to_anki.caching.lui_cache import LUICache
+from kindle_to_anki.util.json_utils import strip_markdown_code_block
 from .ma_polish_sgjp_helper import morfeusz_tag_to_pos_string
 
+# Batch calls are I/O-bound, so this many are kept in flight at once
+MAX_CONCURRENT_BATCHES = 4
+
+# Each result is a small {"candidate_index", "absorb_się"} object
+ESTIMATED_OUTPUT_TOKENS_PER_ITEM = 20
+
+# Static prompt text is kept byte-identical across batches and placed before the items,
+# so platforms with prefix caching can reuse it between calls
+SYSTEM_PROMPT = (
+    "You are a linguistic disambiguation engine. "
+    "You must output valid JSON only. "
+    "No explanations, no extra text."
+)
+
+INSTRUCTION = (
+    "For each item, select exactly ONE lemma from the morfeusz_options by providing its index.\n"
+    "Also determine whether 'się' should be absorbed with the token.\n\n"
+    "CRITICAL: Only absorb 'się' if ALL of these conditions are met:\n"
+    "1. The token is a VERB (check the sgjp_tag - must be a verb form)\n"
+    "2. 'się' appears adjacent to the token in the sentence (can be separated by 'nie')\n"
+    "3. 'się' is syntactically bound to THIS SPECIFIC verb token (not to another verb in the sentence)\n"
+    "4. 'się' is semantically essential to the verb's meaning (reflexive/reciprocal verbs)\n\n"
+    "Do NOT absorb 'się' if:\n"
+    "- The token is a noun, adjective, adverb, or any non-verb part of speech\n"
+    "- 'się' belongs to a different verb in the sentence\n"
+    "- 'się' is just a voice alternation (removing it preserves the core meaning)\n"
+    "- 'się' appears near the token but is not syntactically related to it\n\n"
+    "Examples:\n"
+    "- 'uczy się' → absorb_się: true (reflexive verb)\n"
+    "- 'się nie boi' → absorb_się: true (reflexive verb with negation)\n"
+    "- 'nie boi się' → absorb_się: true (reflexive verb with negation)\n"
+    "- 'nie boi' (without się) → absorb_się: false (no się to absorb)\n"
+    "- 'pozbyłem się zjawy' → for token 'zjawy': absorb_się: false (noun, się belongs to 'pozbyłem')\n"
+    "- 'zatrzymał się' → absorb_się: true (reflexive verb)\n\n"
+    "Prefer the analysis that best fits syntactic role, argument structure, "
+    "and idiomatic or lexicalized usage.\n\n"
+    "Return results as a JSON object where keys are the UIDs and values are the analysis objects:\n"
+    "{\"uid1\": {\"candidate_index\": 0, \"absorb_się\": true}, \"uid2\": {\"candidate_index\": 1, \"absorb_się\": false}}\n"
+    "where candidate_index is the 0-based index of the selected option from morfeusz_options "
+    "and absorb_się is a boolean indicating whether 'się' should be absorbed."
+)
+
 
 def disambiguate_lemma_pos(
     platform,
@@ -25,60 +72,33 @@ def disambiguate_lemma_pos(
         }
     """
 
-    system_prompt = (
-        "You are a linguistic disambiguation engine. "
-        "You must output valid JSON only. "
-        "No explanations, no extra text."
-    )
-
     user_prompt = {
-        "instruction": (
-            "For each item, select exactly ONE lemma from the morfeusz_options by providing its index.\n"
-            "Also determine whether 'się' should be absorbed with the token.\n\n"
-            "CRITICAL: Only absorb 'się' if ALL of these conditions are met:\n"
-            "1. The token is a VERB (check the sgjp_tag - must be a verb form)\n"
-            "2. 'się' appears adjacent to the token in the sentence (can be separated by 'nie')\n"
-            "3. 'się' is syntactically bound to THIS SPECIFIC verb token (not to another verb in the sentence)\n"
-            "4. 'się' is semantically essential to the verb's meaning (reflexive/reciprocal verbs)\n\n"
-            "Do NOT absorb 'się' if:\n"
-            "- The token is a noun, adjective, adverb, or any non-verb part of speech\n"
-            "- 'się' belongs to a different verb in the sentence\n"
-            "- 'się' is just a voice alternation (removing it preserves the core meaning)\n"
-            "- 'się' appears near the token but is not syntactically related to it\n\n"
-            "Examples:\n"
-            "- 'uczy się' → absorb_się: true (reflexive verb)\n"
-            "- 'się nie boi' → absorb_się: true (reflexive verb with negation)\n"
-            "- 'nie boi się' → absorb_się: true (reflexive verb with negation)\n"
-            "- 'nie boi' (without się) → absorb_się: false (no się to absorb)\n"
-            "- 'pozbyłem się zjawy' → for token 'zjawy': absorb_się: false (noun, się belongs to 'pozbyłem')\n"
-            "- 'zatrzymał się' → absorb_się: true (reflexive verb)\n\n"
-            "Prefer the analysis that best fits syntactic role, argument structure, "
-            "and idiomatic or lexicalized usage.\n\n"
-            "Return results as a JSON object where keys are the UIDs and values are the analysis objects:\n"
-            "{\"uid1\": {\"candidate_index\": 0, \"absorb_się\": true}, \"uid2\": {\"candidate_index\": 1, \"absorb_się\": false}}\n"
-            "where candidate_index is the 0-based index of the selected option from morfeusz_options "
-            "and absorb_się is a boolean indicating whether 'się' should be absorbed."
-        ),
+        "instruction": INSTRUCTION,
         "items": items,
     }
 
+    # Serialized in one json.dumps call, so quotes and newlines in sentences are escaped
+    prompt = SYSTEM_PROMPT + "\n\n" + json.dumps(user_prompt, ensure_ascii=False, indent=2)
+
+    # Wait for rate-limit headroom up front rather than failing the batch on a 429
+    model_spec = ModelRegistry.get(model)
+    rate_limiter = get_rate_limiter(model_spec)
+    if rate_limiter:
+        rate_limiter.acquire(count_tokens(prompt, model_spec) + len(items) * ESTIMATED_OUTPUT_TOKENS_PER_ITEM)
+
     print("\nSending LLM disambiguation request...")
 
     try:
-        response = platform.generate_chat_completion(
-            model=model,
-            prompt=user_prompt
-        )
+        # JSON mode: the reply is always one parseable object, so stray prose cannot fail the batch
+        response_text = platform.call_api(model, prompt, json_response=True)
     except Exception as e:
         print(f"  API call failed: {e}")
         return BatchCallResult(success=False, error=str(e))
 
-    content = response.choices[0].message.content
-
     print("Sending LLM disambiguation request completed.")
 
     try:
-        parsed_results = json.loads(content)
+        parsed_results = json.loads(strip_markdown_code_block(response_text))
     except json.JSONDecodeError as e:
         print(f"  Failed to parse API response as JSON: {e}")
         return BatchCallResult(success=False, error=f"JSON parse error: {e}")
@@ -110,29 +130,15 @@ def perform_wsd_on_lemma_and_pos(notes: list[AnkiNote], platform, model: str) ->
     return disambiguate_lemma_pos(platform, model, items)
 
 
-def process_notes_in_batches(notes: list[AnkiNote], cache: LUICache, platform, model: str):
+def apply_batch_results(batch: list[AnkiNote], result: BatchCallResult, cache: LUICache, model: str, processing_timestamp: str) -> list[AnkiNote]:
+    """Cache one batch's results and apply them to its notes. Returns the notes that failed."""
+    if not result.success:
+        print(f"  BATCH FAILED - {result.error}")
+        return list(batch)
 
-    # Capture timestamp at the start of MA processing
-    processing_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-
-    # Process in batches
-    batch_size = 20
-    total_batches = (len(notes) + batch_size - 1) // batch_size
     failing_notes = []
-
-    for i in range(0, len(notes), batch_size):
-        batch = notes[i:i + batch_size]
-        batch_num = (i // batch_size) + 1
-
-        print(f"\nProcessing batch {batch_num}/{total_batches} ({len(batch)} notes)")
-
-        result = perform_wsd_on_lemma_and_pos(batch, platform, model)
-
-        if not result.success:
-            print(f"  BATCH FAILED - {result.error}")
-            failing_notes.extend(batch)
-            continue
-
+    # The cache file is written once for the whole batch, not once per note
+    with cache.deferred_writes():
         for note in batch:
             if note.uid in result.results:
                 disamb_result = result.results[note.uid]
@@ -166,8 +172,9 @@ def process_notes_in_batches(notes: list[AnkiNote], cache: LUICache, platform, m
                     "aspect": aspect
                 }
 
-                # Save to cache
-                cache.set(note.uid, "polish_hybrid_llm_lui", model, "", ma_result, processing_timestamp)
+                # Save to cache, also under the content UID so duplicates of this note can read it
+                content_uid = LUICache.content_uid(note.source_word, note.source_usage)
+                cache.set(note.uid, "polish_hybrid_llm_lui", model, "", ma_result, processing_timestamp, aliases=(content_uid,))
 
                 # Update note with normal MA fields
                 note.morfeusz_tag = tag
@@ -183,6 +190,36 @@ def process_notes_in_batches(notes: list[AnkiNote], cache: LUICache, platform, m
     return failing_notes
 
 
+def apply_cached_result(note: AnkiNote, cached_result: Dict[str, Any]):
+    """Update note with the MA fields of a cached result."""
+    note.morfeusz_tag = cached_result['morfeusz_tag']
+    note.morfeusz_lemma = cached_result['morfeusz_lemma']
+    note.part_of_speech = cached_result['part_of_speech']
+    note.aspect = cached_result['aspect']
+
+
+def process_notes_in_batches(notes: list[AnkiNote], cache: LUICache, platform, model: str):
+
+    # Capture timestamp at the start of MA processing
+    processing_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+
+    # Process in batches
+    batch_size = 20
+    batches = [notes[i:i + batch_size] for i in range(0, len(notes), batch_size)]
+    total_batches = len(batches)
+    failing_notes = []
+
+    def call_batch(batch_num: int, batch: list[AnkiNote]) -> BatchCallResult:
+        print(f"\nProcessing batch {batch_num}/{total_batches} ({len(batch)} notes)")
+        return perform_wsd_on_lemma_and_pos(batch, platform, model)
+
+    # API calls run concurrently; results are cached and applied on this thread in batch order
+    for batch, result in run_batches_concurrently(batches, call_batch, MAX_CONCURRENT_BATCHES):
+        failing_notes.extend(apply_batch_results(batch, result, cache, model, processing_timestamp))
+
+    return failing_notes
+
+
 def update_notes_with_llm(notes, cache_suffix='pl', ignore_cache=False, platform=None, model=None):
     """Process morphological analysis for all notes"""
 
@@ -200,13 +237,14 @@ def update_notes_with_llm(notes, cache_suffix='pl', ignore_cache=False, platform
 
         for note in notes:
             cached_result = cache.get(note.uid, "polish_hybrid_llm_lui", model, "")
+            if not cached_result:
+                # Fall back to a result for the same word and sentence stored under another UID
+                content_uid = LUICache.content_uid(note.source_word, note.source_usage)
+                cached_result = cache.get(content_uid, "polish_hybrid_llm_lui", model, "")
             if cached_result:
                 cached_count += 1
                 # Apply cached MA result
-                note.morfeusz_tag = cached_result['morfeusz_tag']
-                note.morfeusz_lemma = cached_result['morfeusz_lemma']
-                note.part_of_speech = cached_result['part_of_speech']
-                note.aspect = cached_result['aspect']
+                apply_cached_result(note, cached_result)
             else:
                 notes_needing_llm.append(note)
 
@@ -219,8 +257,17 @@ def update_notes_with_llm(notes, cache_suffix='pl', ignore_cache=False, platform
         print("LLM MA processing completed.")
         return
 
-    if len(notes_needing_llm) > 200:
-        result = input(f"\nDo you want to proceed with LLM MA processing for {len(notes_needing_llm)} notes? [y/n]: ").strip().lower()
+    # Identical word+sentence pairs under different UIDs need one call; the others read its result by content UID
+    notes_by_content: Dict[str, list[AnkiNote]] = {}
+    for note in notes_needing_llm:
+        notes_by_content.setdefault(LUICache.content_uid(note.source_word, note.source_usage), []).append(note)
+    unique_notes = [group[0] for group in notes_by_content.values()]
+
+    if len(unique_notes) < len(notes_needing_llm):
+        print(f"{len(notes_needing_llm) - len(unique_notes)} notes duplicate another note and reuse its result")
+
+    if len(unique_notes) > 200:
+        result = input(f"\nDo you want to proceed with LLM MA processing for {len(unique_notes)} notes? [y/n]: ").strip().lower()
         if result != 'y' and result != 'yes':
             print("LLM MA processing aborted by user.")
             exit()
@@ -228,7 +275,7 @@ def update_notes_with_llm(notes, cache_suffix='pl', ignore_cache=False, platform
     # Phase 2: Process notes in batches with retry logic
     MAX_RETRIES = 1
     retries = 0
-    failing_notes = process_notes_in_batches(notes_needing_llm, cache, platform, model)
+    failing_notes = process_notes_in_batches(unique_notes, cache, platform, model)
 
     while len(failing_notes) > 0:
         print(f"{len(failing_notes)} notes failed LLM MA processing.")
@@ -242,4 +289,11 @@ def update_notes_with_llm(notes, cache_suffix='pl', ignore_cache=False, platform
             print(f"Retrying {len(failing_notes)} failed notes (attempt {retries} of {MAX_RETRIES})...")
             failing_notes = process_notes_in_batches(failing_notes, cache, platform, model)
 
+    # Duplicates take the result of the note that was sent in their place
+    for content_uid, group in notes_by_content.items():
+        if len(group) > 1:
+            cached_result = cache.get(content_uid, "polish_hybrid_llm_lui", model, "")
+            for note in group[1:]:
+                apply_cached_result(note, cached_result)
+
     print("LLM MA processing completed.")
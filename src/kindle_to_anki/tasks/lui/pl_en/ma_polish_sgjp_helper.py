@@ -1,3 +1,6 @@
+import re
+
+
 def morfeusz_tag_to_pos_string(morf_tag: str) -> tuple[str, str]:
     """
     Convert a full Morfeusz tag string into a learner-facing POS label and aspect.
@@ -68,36 +71,22 @@ def morfeusz_tag_to_pos_string(morf_tag: str) -> tuple[str, str]:
     return (pos, "")
 
 
+# Extended list of adjectival suffixes to handle more inflected forms, plus a bare
+# "i" which becomes "y" unless the stem keeps it (like after k, g).
+# Anchored at the end and matched leftmost, so the longest suffix wins.
+_ADJ_SUFFIX_RE = re.compile(r"(?:iego|ego|emu|ymi|ych|ym|ich|ej|em|e|a|ą|i)$")
+
+# Stems ending in these consonants take 'i' instead of 'y'
+_SOFTENING_STEM_ENDINGS = ("k", "g")
+
+
 def normalize_adj_to_masc_sg(surface: str) -> str:
-    # Stems ending in these consonants take 'i' instead of 'y'
-    hard_consonants = ("k", "g")
-
-    def choose_suffix(stem: str) -> str:
-        # Check if stem ends with any hard consonant
-        for consonant in hard_consonants:
-            if stem.endswith(consonant):
-                return "i"
-        return "y"
-
-    # Extended list of adjectival suffixes to handle more inflected forms
-    for suffix in (
-        "iego", "ego", "emu", "ymi", "ych", "ym", "ich", "ej", "e", "a", "ą", "em"
-    ):
-        if surface.endswith(suffix):
-            stem = surface[: -len(suffix)]
-            return stem + choose_suffix(stem)
-
-    # Special case: if the adjective ends with "i", it might need to be changed to "y"
-    # but only if it's not a stem that should end with "i" (like after k, g)
-    if surface.endswith("i"):
-        stem = surface[:-1]
-        # Check if stem should keep 'i' (ends with hard consonant)
-        for consonant in hard_consonants:
-            if stem.endswith(consonant):
-                return surface  # Keep the original 'i'
-        return stem + "y"
-
-    return surface  # fallback
+    match = _ADJ_SUFFIX_RE.search(surface)
+    if not match:
+        return surface  # fallback
+
+    stem = surface[: match.start()]
+    return stem + ("i" if stem.endswith(_SOFTENING_STEM_ENDINGS) else "y")
 
 
 def normalize_lemma(
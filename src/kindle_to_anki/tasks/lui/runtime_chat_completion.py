@@ -6,6 +6,8 @@ from typing_extensions import runtime
 from kindle_to_anki.logging import get_logger, LogLevel
 from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
 from kindle_to_anki.core.runtimes.batch_call_result import BatchCallResult
+from kindle_to_anki.core.runtimes.batching import make_length_bucketed_batches, run_batches_concurrently
+from kindle_to_anki.core.runtimes.rate_limiter import get_rate_limiter
 from kindle_to_anki.core.pricing.usage_scope import UsageScope
 from kindle_to_anki.core.pricing.usage_dimension import UsageDimension
 from kindle_to_anki.core.pricing.usage_breakdown import UsageBreakdown
@@ -32,6 +34,10 @@ class ChatCompletionLUI:
     supported_tasks = ["lui"]
     supported_model_families = ["chat_completion"]
     supports_batching: bool = True
+    # Batch calls are I/O-bound, so this many are kept in flight at once
+    max_concurrent_batches: int = 4
+    # Sentences are packed into one prompt per batch; this caps the packed sentence characters
+    max_batch_chars: int = 12000
 
     def _estimate_output_tokens_per_item(self, runtime_config: RuntimeConfig) -> int:
         if runtime_config.source_language_code == "pl":
@@ -50,6 +56,14 @@ class ChatCompletionLUI:
             return prompt.build(items_json=items_json, language_name=language_name)
         return prompt.build(items_json=items_json)
 
+    def _build_items_json(self, batch_inputs: List[LUIInput]) -> str:
+        # One item per line; json.dumps escapes quotes in sentences that would otherwise break the packed array
+        items_list = []
+        for lui_input in batch_inputs:
+            items_list.append(json.dumps({"uid": lui_input.uid, "word": lui_input.word, "sentence": lui_input.sentence}, ensure_ascii=False))
+
+        return "[\n  " + ",\n  ".join(items_list) + "\n]"
+
     def estimate_usage(self, items_count: int, runtime_config: RuntimeConfig) -> UsageBreakdown:
         model = ModelRegistry.get(runtime_config.model_id)
         language_name = get_language_name_in_english(runtime_config.source_language_code)
@@ -104,6 +118,10 @@ class ChatCompletionLUI:
 
             for lui_input in lui_inputs:
                 cached_result = cache.get(lui_input.uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
+                if not cached_result:
+                    # Fall back to a result for the same word and sentence stored under another UID
+                    content_uid = LUICache.content_uid(lui_input.word, lui_input.sentence)
+                    cached_result = cache.get(content_uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
                 if cached_result:
                     cached_count += 1
                     lui_output = LUIOutput(
@@ -157,24 +175,39 @@ class ChatCompletionLUI:
         # Capture timestamp at the start of LUI processing
         processing_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
 
-        total_batches = (len(lui_inputs) + runtime_config.batch_size - 1) // runtime_config.batch_size
+        batches = self._make_batches(lui_inputs, runtime_config)
+        total_batches = len(batches)
         failing_inputs = []
         outputs_by_uid: Dict[str, LUIOutput] = {}
 
-        for i in range(0, len(lui_inputs), runtime_config.batch_size):
+        def call_batch(batch_num: int, batch: List[LUIInput]) -> BatchCallResult:
             cancellation_token.raise_if_cancelled()
+            logger.info(f"Processing lexical unit identification batch {batch_num}/{total_batches} ({len(batch)} inputs)")
+            return self._make_batch_lui_call(batch, processing_timestamp, language_name, language_code, runtime_config)
 
-            batch = lui_inputs[i:i + runtime_config.batch_size]
-            batch_num = (i // runtime_config.batch_size) + 1
+        # API calls run concurrently; results are validated and cached on this thread in batch order
+        for batch, result in run_batches_concurrently(batches, call_batch, self.max_concurrent_batches):
+            batch_outputs_by_uid, batch_failing_inputs = self._collect_batch_results(batch, result, cache, runtime_config)
+            outputs_by_uid.update(batch_outputs_by_uid)
+            failing_inputs.extend(batch_failing_inputs)
 
-            logger.info(f"Processing lexical unit identification batch {batch_num}/{total_batches} ({len(batch)} inputs)")
+        return outputs_by_uid, failing_inputs
 
-            result = self._make_batch_lui_call(batch, processing_timestamp, language_name, language_code, runtime_config)
+    def _make_batches(self, lui_inputs: List[LUIInput], runtime_config: RuntimeConfig) -> List[List[LUIInput]]:
+        """Group inputs of similar sentence length so one long sentence does not inflate every batch."""
+        return make_length_bucketed_batches(lui_inputs, runtime_config.batch_size, lambda lui_input: len(lui_input.sentence), self.max_batch_chars)
 
-            if not result.success:
-                failing_inputs.extend(batch)
-                continue
+    def _collect_batch_results(self, batch: List[LUIInput], result: BatchCallResult, cache: LUICache, runtime_config: RuntimeConfig) -> Tuple[Dict[str, LUIOutput], List[LUIInput]]:
+        """Validate and cache the results of one batch call. Returns outputs keyed by UID and the inputs that failed."""
+        logger = get_logger()
+        failing_inputs = []
+        outputs_by_uid: Dict[str, LUIOutput] = {}
 
+        if not result.success:
+            return outputs_by_uid, list(batch)
+
+        # The cache file is written once for the whole batch, not once per result
+        with cache.deferred_writes():
             for lui_input in batch:
                 if lui_input.uid in result.results:
                     lui_data = result.results[lui_input.uid]
@@ -196,7 +229,8 @@ class ChatCompletionLUI:
                     }
 
                     # Save to cache
-                    cache.set(lui_input.uid, self.id, result.model_id, runtime_config.prompt_id, lui_result, result.timestamp)
+                    content_uid = LUICache.content_uid(lui_input.word, lui_input.sentence)
+                    cache.set(lui_input.uid, self.id, result.model_id, runtime_config.prompt_id, lui_result, result.timestamp, aliases=(content_uid,))
 
                     # Create LUIOutput
                     lui_output = LUIOutput(
@@ -223,12 +257,7 @@ class ChatCompletionLUI:
         model = ModelRegistry.get(runtime_config.model_id)
         platform = PlatformRegistry.get(model.platform_id)
 
-        items_list = []
-        for lui_input in batch_inputs:
-            items_list.append(f'{{"uid": "{lui_input.uid}", "word": "{lui_input.word}", "sentence": "{lui_input.sentence}"}}')
-
-        items_json = "[\n  " + ",\n  ".join(items_list) + "\n]"
-
+        items_json = self._build_items_json(batch_inputs)
         prompt = self._build_prompt(items_json, language_code, language_name, runtime_config.prompt_id)
 
         input_chars = len(prompt)
@@ -243,6 +272,11 @@ class ChatCompletionLUI:
         logger.info(f"Making batch LUI API call for {len(batch_inputs)} inputs (in: {input_tokens} tokens, out: ~{estimated_output_tokens} tokens, est. cost: {estimated_cost_str})...")
         logger.debug(f"Full prompt:\n{prompt}")
 
+        # Wait for rate-limit headroom up front rather than failing the batch on a 429
+        rate_limiter = get_rate_limiter(model)
+        if rate_limiter:
+            rate_limiter.acquire(input_tokens + estimated_output_tokens)
+
         start_time = time.time()
 
         try:
@@ -261,6 +295,12 @@ class ChatCompletionLUI:
         logger.info(f"Batch LUI API call completed in {elapsed:.2f}s (in: {input_tokens} tokens, out: {output_tokens} tokens, cost: {actual_cost_str})")
         logger.debug(f"Full response:\n{output_text}")
 
+        return self._parse_response(output_text, processing_timestamp, runtime_config)
+
+    def _parse_response(self, output_text: str, processing_timestamp: str, runtime_config: RuntimeConfig) -> BatchCallResult:
+        """Parse a batch response into a BatchCallResult keyed by UID."""
+        logger = get_logger()
+
         try:
             parsed_results = json.loads(strip_markdown_code_block(output_text))
         except json.JSONDecodeError as e:
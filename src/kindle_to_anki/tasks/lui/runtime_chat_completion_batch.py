@@ -0,0 +1,55 @@
+import time
+from typing import List, Tuple, Dict
+
+from kindle_to_anki.logging import get_logger
+from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
+from kindle_to_anki.core.runtimes.batching import run_batch_job
+from kindle_to_anki.core.models.registry import ModelRegistry
+from kindle_to_anki.platforms.platform_registry import PlatformRegistry
+
+from .runtime_chat_completion import ChatCompletionLUI
+from .schema import LUIInput, LUIOutput
+from kindle_to_anki.caching.lui_cache import LUICache
+from kindle_to_anki.util.cancellation import CancellationToken, NONE_TOKEN
+
+
+class ChatCompletionLUIBatch(ChatCompletionLUI):
+    """
+    Runtime for Lexical Unit Identification that submits every batch as a single
+    platform batch job (e.g. the OpenAI Batch API) instead of one call per batch.
+    Batch jobs are billed at a discount but may take hours to complete, so this
+    runtime is meant for latency-insensitive work such as evaluation sweeps.
+    Models on platforms without batch jobs fall back to synchronous calls.
+    """
+    id: str = "chat_completion_lui_batch"
+    display_name: str = "Chat Completion LUI Runtime (Batch API)"
+
+    def _process_lui_batches(self, lui_inputs: List[LUIInput], cache: LUICache, language_name: str, language_code: str, runtime_config: RuntimeConfig, cancellation_token: CancellationToken = NONE_TOKEN) -> Tuple[Dict[str, LUIOutput], List[LUIInput]]:
+        """Submit all batches as one batch job. Returns outputs keyed by UID."""
+        model = ModelRegistry.get(runtime_config.model_id)
+        platform = PlatformRegistry.get(model.platform_id)
+
+        if not platform.supports_batch_api:
+            get_logger().warning(f"{platform.name} does not support batch jobs, falling back to synchronous calls")
+            return super()._process_lui_batches(lui_inputs, cache, language_name, language_code, runtime_config, cancellation_token)
+
+        # Capture timestamp at the start of LUI processing
+        processing_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+
+        failing_inputs = []
+        outputs_by_uid: Dict[str, LUIOutput] = {}
+
+        for batch, result in run_batch_job(
+            platform,
+            runtime_config.model_id,
+            self._make_batches(lui_inputs, runtime_config),
+            build_prompt=lambda batch: self._build_prompt(self._build_items_json(batch), language_code, language_name, runtime_config.prompt_id),
+            parse_response=lambda response_text: self._parse_response(response_text, processing_timestamp, runtime_config),
+            job_name="lexical unit identification",
+            cancellation_token=cancellation_token,
+        ):
+            batch_outputs_by_uid, batch_failing_inputs = self._collect_batch_results(batch, result, cache, runtime_config)
+            outputs_by_uid.update(batch_outputs_by_uid)
+            failing_inputs.extend(batch_failing_inputs)
+
+        return outputs_by_uid, failing_inputs
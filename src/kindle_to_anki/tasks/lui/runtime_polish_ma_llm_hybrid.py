@@ -27,6 +27,8 @@ class PolishMALLMHybridLUI:
     supported_tasks = ["lui"]
     supported_model_families = ["chat_completion"]
     supports_batching: bool = True
+    # Picking one of a few Morfeusz candidates is a well-scoped task; the cheaper model handles it
+    default_model_id: str = "gpt-5-mini"
 
     def __init__(self):
         """
@@ -96,16 +98,15 @@ class PolishMALLMHybridLUI:
         # Process complex cases with LLM
         if len(notes_requiring_llm_ma) > 0:
             # Get model and platform from registries using config
-            # Note: For now assuming OpenAI platform since that's what was used directly before
-            # In the future this could be made more dynamic
             model = None
-            platform = None
             if config and config.model_id:
                 try:
-                    model = ModelRegistry.get("openai", config.model_id)
-                    platform = PlatformRegistry.get(model.platform)
+                    model = ModelRegistry.get(config.model_id)
                 except KeyError:
-                    get_logger().warning(f"Model {config.model_id} not found in registry, falling back to defaults")
+                    get_logger().warning(f"Model {config.model_id} not found in registry, falling back to {self.default_model_id}")
+            if model is None:
+                model = ModelRegistry.get(self.default_model_id)
+            platform = PlatformRegistry.get(model.platform_id)
 
             cache_suffix = 'pl-en_hybrid'
             if use_test_cache:
@@ -117,7 +118,7 @@ class PolishMALLMHybridLUI:
                 cache_suffix=cache_suffix, 
                 ignore_cache=ignore_cache,
                 platform=platform,
-                model=model.id if model else "gpt-5"  # fallback to previous default
+                model=model.id
             )
 
         # Post-process all notes for reflexive verbs and lemma normalization
@@ -140,9 +141,9 @@ class PolishMALLMHybridLUI:
             lui_output = LUIOutput(
                 lemma=note.expression,
                 part_of_speech=note.part_of_speech,
-                aspect=getattr(note, 'aspect', ''),
-                surface_lexical_unit=getattr(note, 'surface_lexical_unit', note.source_word),
-                unit_type=getattr(note, 'unit_type', 'lemma')
+                aspect=note.aspect,
+                surface_lexical_unit=note.surface_lexical_unit,
+                unit_type=note.unit_type
             )
             lui_outputs.append(lui_output)
 
@@ -1,14 +1,14 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LUIInput:
     uid: str
     word: str
     sentence: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LUIOutput:
     lemma: str
     part_of_speech: str
@@ -58,6 +58,12 @@ class TranslationProvider:
             get_logger().info("No notes with context to translate")
             return notes
 
+        # Batch API runtimes name a synchronous counterpart for runs too small to be worth a batch job
+        min_batch_job_inputs = getattr(runtime, "min_batch_job_inputs", 0)
+        if len(translation_inputs) < min_batch_job_inputs and runtime.sync_runtime_id in self.runtimes:
+            get_logger().info(f"Only {len(translation_inputs)} notes to translate (batch job threshold: {min_batch_job_inputs}), using {runtime.sync_runtime_id}")
+            runtime = self.runtimes[runtime.sync_runtime_id]
+
         # Translate using the runtime
         translation_outputs: List[TranslationOutput] = runtime.translate(
             translation_inputs,
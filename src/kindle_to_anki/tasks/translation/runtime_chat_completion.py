@@ -5,6 +5,8 @@ from typing import List, Dict, Any
 from kindle_to_anki.logging import get_logger
 from kindle_to_anki.core.pricing.usage_dimension import UsageDimension
 from kindle_to_anki.core.runtimes.batch_call_result import BatchCallResult
+from kindle_to_anki.core.runtimes.batching import make_length_bucketed_batches, run_batches_concurrently
+from kindle_to_anki.core.runtimes.rate_limiter import get_rate_limiter
 from kindle_to_anki.core.pricing.usage_scope import UsageScope
 from kindle_to_anki.core.pricing.usage_breakdown import UsageBreakdown
 from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
@@ -32,6 +34,10 @@ class ChatCompletionTranslation:
     supported_tasks = ["translation"]
     supported_model_families = ["chat_completion"]
     supports_batching: bool = True
+    # Batch calls are I/O-bound, so this many are kept in flight at once
+    max_concurrent_batches: int = 4
+    # Sentences are packed into one prompt per batch; this caps the packed sentence characters
+    max_batch_chars: int = 12000
 
     def _estimate_output_tokens_per_item(self, config: RuntimeConfig) -> int:
         return 95
@@ -107,6 +113,10 @@ class ChatCompletionTranslation:
 
             for translation_input in translation_inputs:
                 cached_result = cache.get(translation_input.uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
+                if not cached_result:
+                    # Fall back to a result for the same sentence stored under another UID
+                    content_uid = TranslationCache.content_uid(translation_input.context)
+                    cached_result = cache.get(content_uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
                 if cached_result:
                     cached_count += 1
                     translation_output = TranslationOutput(
@@ -127,10 +137,19 @@ class ChatCompletionTranslation:
             logger.info(f"{source_language_name} context translation (LLM) completed (all from cache).")
             return [output for output in outputs if output is not None]
 
+        # Identical sentences under different UIDs need one call; the others read its result by content UID
+        inputs_by_content: Dict[str, TranslationInput] = {}
+        for translation_input in inputs_needing_translation:
+            inputs_by_content.setdefault(TranslationCache.content_uid(translation_input.context), translation_input)
+        unique_inputs = list(inputs_by_content.values())
+
+        if len(unique_inputs) < len(inputs_needing_translation):
+            logger.info(f"{len(inputs_needing_translation) - len(unique_inputs)} inputs duplicate another input and reuse its result")
+
         # Process inputs in batches with retry logic
         MAX_RETRIES = 1
         retries = 0
-        failing_inputs = self._process_translation_batches(inputs_needing_translation, cache, source_language_name, target_language_name, runtime_config, cancellation_token)
+        failing_inputs = self._process_translation_batches(unique_inputs, cache, source_language_name, target_language_name, runtime_config, cancellation_token)
 
         while len(failing_inputs) > 0:
             cancellation_token.raise_if_cancelled()
@@ -150,9 +169,10 @@ class ChatCompletionTranslation:
         input_index = 0
         for i, output in enumerate(outputs):
             if output is None:
-                # This was a non-cached input, get from cache now
+                # This was a non-cached input, get from cache now (by content UID, which covers duplicates)
                 translation_input = translation_inputs[i]
-                cached_result = cache.get(translation_input.uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
+                content_uid = TranslationCache.content_uid(translation_input.context)
+                cached_result = cache.get(content_uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
                 if cached_result:
                     translation_output = TranslationOutput(
                         translation=cached_result.get('context_translation', '')
@@ -170,8 +190,7 @@ class ChatCompletionTranslation:
     def _make_batch_translation_call(self, batch_inputs: List[TranslationInput], processing_timestamp: str, source_language_name: str, target_language_name: str, runtime_config: RuntimeConfig) -> BatchCallResult:
         """Make batch LLM API call for translation. Returns BatchCallResult with success/failure state."""
         logger = get_logger()
-        items_list = [{"uid": input_item.uid, "sentence": input_item.context} for input_item in batch_inputs]
-        items_json = json.dumps(items_list, ensure_ascii=False, indent=2)
+        items_json = self._build_items_json(batch_inputs)
 
         prompt = self._build_prompt(items_json, source_language_name, target_language_name, runtime_config.prompt_id)
 
@@ -180,21 +199,29 @@ class ChatCompletionTranslation:
         platform = PlatformRegistry.get(model.platform_id)
 
         input_chars = len(prompt)
-        input_tokens = count_tokens(prompt, model)
+        # Only the items are tokenized per batch; the instructions are identical for every
+        # batch, so their count is a memoized hit after the first call
+        instruction_tokens = count_tokens(self._build_prompt("", source_language_name, target_language_name, runtime_config.prompt_id), model)
+        items_json_tokens = count_tokens(items_json, model)
+        input_tokens = instruction_tokens + items_json_tokens
         estimated_output_tokens = len(batch_inputs) * self._estimate_output_tokens_per_item(runtime_config)
 
         cost_reporter = RealtimeCostReporter(model)
         estimated_cost_str = cost_reporter.estimate_cost(input_tokens, estimated_output_tokens, len(batch_inputs))
 
-        items_json_tokens = count_tokens(items_json, model)
         logger.trace(f"Prompt contains {input_chars} chars / {input_tokens} tokens; items JSON part contains {items_json_tokens} tokens")
         logger.info(f"Making batch translation API call for {len(batch_inputs)} inputs (in: {input_tokens} tokens, out: ~{estimated_output_tokens} tokens, est. cost: {estimated_cost_str})...")
         logger.debug(f"Full prompt:\n{prompt}")
 
+        # Wait for rate-limit headroom up front rather than failing the batch on a 429
+        rate_limiter = get_rate_limiter(model)
+        if rate_limiter:
+            rate_limiter.acquire(input_tokens + estimated_output_tokens)
+
         start_time = time.time()
 
         try:
-            response_text = platform.call_api(runtime_config.model_id, prompt)
+            response_text = platform.call_api(runtime_config.model_id, prompt, json_response=get_prompt("translation", runtime_config.prompt_id).json_only)
         except Exception as e:
             logger.error(f"API call failed: {e}")
             return BatchCallResult(success=False, error=str(e))
@@ -207,6 +234,20 @@ class ChatCompletionTranslation:
         logger.info(f"Batch translation API call completed in {elapsed:.2f}s (in: {input_tokens} tokens, out: {output_tokens} tokens, cost: {actual_cost_str})")
         logger.debug(f"Full response:\n{response_text}")
 
+        return self._parse_response(response_text, processing_timestamp, runtime_config)
+
+    def _build_items_json(self, batch_inputs: List[TranslationInput]) -> str:
+        # One item per line; json.dumps escapes quotes in sentences that would otherwise break the packed array
+        items_list = []
+        for input_item in batch_inputs:
+            items_list.append(json.dumps({"uid": input_item.uid, "sentence": input_item.context}, ensure_ascii=False))
+
+        return "[\n  " + ",\n  ".join(items_list) + "\n]"
+
+    def _parse_response(self, response_text: str, processing_timestamp: str, runtime_config: RuntimeConfig) -> BatchCallResult:
+        """Parse a batch response into a BatchCallResult keyed by UID."""
+        logger = get_logger()
+
         try:
             parsed_results = json.loads(strip_markdown_code_block(response_text))
         except json.JSONDecodeError as e:
@@ -224,23 +265,35 @@ class ChatCompletionTranslation:
         # Capture timestamp at the start of translation processing
         processing_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
 
-        total_batches = (len(inputs_needing_translation) + runtime_config.batch_size - 1) // runtime_config.batch_size
+        batches = self._make_batches(inputs_needing_translation, runtime_config)
+        total_batches = len(batches)
         failing_inputs = []
 
-        for i in range(0, len(inputs_needing_translation), runtime_config.batch_size):
+        def call_batch(batch_num: int, batch: List[TranslationInput]) -> BatchCallResult:
             cancellation_token.raise_if_cancelled()
+            logger.info(f"Processing translation batch {batch_num}/{total_batches} ({len(batch)} inputs)")
+            return self._make_batch_translation_call(batch, processing_timestamp, source_language_name, target_language_name, runtime_config)
 
-            batch = inputs_needing_translation[i:i + runtime_config.batch_size]
-            batch_num = (i // runtime_config.batch_size) + 1
+        # API calls run concurrently; results are cached on this thread in batch order
+        for batch, result in run_batches_concurrently(batches, call_batch, self.max_concurrent_batches):
+            failing_inputs.extend(self._collect_batch_results(batch, result, cache, runtime_config))
 
-            logger.info(f"Processing translation batch {batch_num}/{total_batches} ({len(batch)} inputs)")
+        return failing_inputs
+
+    def _make_batches(self, inputs: List[TranslationInput], runtime_config: RuntimeConfig) -> List[List[TranslationInput]]:
+        """Group inputs of similar sentence length so one long sentence does not inflate every batch."""
+        return make_length_bucketed_batches(inputs, runtime_config.batch_size, lambda input_item: len(input_item.context), self.max_batch_chars)
 
-            result = self._make_batch_translation_call(batch, processing_timestamp, source_language_name, target_language_name, runtime_config)
+    def _collect_batch_results(self, batch: List[TranslationInput], result: BatchCallResult, cache: TranslationCache, runtime_config: RuntimeConfig) -> List[TranslationInput]:
+        """Cache the results of one batch call. Returns the inputs that failed."""
+        logger = get_logger()
 
-            if not result.success:
-                failing_inputs.extend(batch)
-                continue
+        if not result.success:
+            return list(batch)
 
+        failing_inputs = []
+        # The cache file is written once for the whole batch, not once per result
+        with cache.deferred_writes():
             for input_item in batch:
                 if input_item.uid in result.results:
                     translation_data = result.results[input_item.uid]
@@ -251,7 +304,8 @@ class ChatCompletionTranslation:
                     }
 
                     # Save to cache
-                    cache.set(input_item.uid, self.id, result.model_id, runtime_config.prompt_id, translation_result, result.timestamp)
+                    content_uid = TranslationCache.content_uid(input_item.context)
+                    cache.set(input_item.uid, self.id, result.model_id, runtime_config.prompt_id, translation_result, result.timestamp, aliases=(content_uid,))
 
                     logger.trace(f"translated sentence for UID {input_item.uid}")
                 else:
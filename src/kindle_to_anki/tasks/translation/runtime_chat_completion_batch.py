@@ -0,0 +1,58 @@
+import time
+from typing import List
+
+from kindle_to_anki.logging import get_logger
+from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
+from kindle_to_anki.core.runtimes.batching import run_batch_job
+from kindle_to_anki.core.models.registry import ModelRegistry
+from kindle_to_anki.platforms.platform_registry import PlatformRegistry
+from kindle_to_anki.core.prompts import get_prompt
+
+from .runtime_chat_completion import ChatCompletionTranslation
+from .schema import TranslationInput
+from kindle_to_anki.caching.translation_cache import TranslationCache
+from kindle_to_anki.util.cancellation import CancellationToken, NONE_TOKEN
+
+
+class ChatCompletionTranslationBatch(ChatCompletionTranslation):
+    """
+    Runtime for translation that submits every batch as a single platform batch
+    job (e.g. the OpenAI Batch API) instead of one call per batch.
+    Meant for bulk reruns where turnaround of up to 24h is acceptable.
+    Models on platforms without batch jobs fall back to synchronous calls;
+    TranslationProvider routes runs smaller than min_batch_job_inputs to
+    sync_runtime_id instead.
+    """
+    id: str = "chat_completion_translation_batch"
+    display_name: str = "Chat Completion Translation Runtime (Batch API)"
+    # Below this many inputs the savings do not justify waiting hours for a batch job
+    min_batch_job_inputs: int = 500
+    sync_runtime_id: str = ChatCompletionTranslation.id
+
+    def _process_translation_batches(self, inputs_needing_translation: List[TranslationInput], cache: TranslationCache, source_language_name: str, target_language_name: str, runtime_config: RuntimeConfig, cancellation_token: CancellationToken = NONE_TOKEN) -> List[TranslationInput]:
+        """Submit all batches as one batch job. Returns the inputs that failed."""
+        model = ModelRegistry.get(runtime_config.model_id)
+        platform = PlatformRegistry.get(model.platform_id)
+
+        if not platform.supports_batch_api:
+            get_logger().warning(f"{platform.name} does not support batch jobs, falling back to synchronous calls")
+            return super()._process_translation_batches(inputs_needing_translation, cache, source_language_name, target_language_name, runtime_config, cancellation_token)
+
+        # Capture timestamp at the start of translation processing
+        processing_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+
+        failing_inputs = []
+
+        for batch, result in run_batch_job(
+            platform,
+            runtime_config.model_id,
+            self._make_batches(inputs_needing_translation, runtime_config),
+            build_prompt=lambda batch: self._build_prompt(self._build_items_json(batch), source_language_name, target_language_name, runtime_config.prompt_id),
+            parse_response=lambda response_text: self._parse_response(response_text, processing_timestamp, runtime_config),
+            job_name="translation",
+            cancellation_token=cancellation_token,
+            json_response=get_prompt("translation", runtime_config.prompt_id).json_only,
+        ):
+            failing_inputs.extend(self._collect_batch_results(batch, result, cache, runtime_config))
+
+        return failing_inputs
@@ -138,10 +138,10 @@ class DeepLTranslation:
                 continue
 
             elapsed = time.time() - start_time
-            get_logger().debug(f"  Batch completed in {elapsed:.2f}s")
 
-            for inp, trans in zip(batch, translations):
-                cache.set(inp.uid, self.id, "deepl", "", {"context_translation": trans}, processing_timestamp)
-                get_logger().debug(f"  SUCCESS - translated UID {inp.uid}")
+            with cache.deferred_writes():
+                for inp, trans in zip(batch, translations):
+                    cache.set(inp.uid, self.id, "deepl", "", {"context_translation": trans}, processing_timestamp)
+            get_logger().debug(f"  Batch completed in {elapsed:.2f}s ({len(translations)}/{len(batch)} translated)")
 
         return failing_inputs
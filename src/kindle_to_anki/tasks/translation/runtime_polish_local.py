@@ -1,9 +1,11 @@
 import time
+from functools import lru_cache
 from typing import List
 
 from kindle_to_anki.core.pricing.usage_dimension import UsageDimension
 from kindle_to_anki.core.pricing.usage_scope import UsageScope
 from kindle_to_anki.core.pricing.usage_breakdown import UsageBreakdown
+from kindle_to_anki.core.runtimes.batching import make_length_bucketed_batches
 from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
 from kindle_to_anki.logging import get_logger
 
@@ -11,6 +13,15 @@ from .schema import TranslationInput, TranslationOutput
 from kindle_to_anki.caching.translation_cache import TranslationCache
 
 
+@lru_cache(maxsize=None)
+def _load_marian(model_name: str):
+    """Load the MarianMT tokenizer and model once per process; inference does not modify them."""
+    # Import transformers only when needed
+    from transformers import MarianMTModel, MarianTokenizer
+
+    return MarianTokenizer.from_pretrained(model_name), MarianMTModel.from_pretrained(model_name).eval()
+
+
 class PolishLocalTranslation:
     """
     Runtime for translation using local MarianMT model for Polish to English translation.
@@ -21,6 +32,10 @@ class PolishLocalTranslation:
     supported_tasks = ["translation"]
     supported_model_families = []
     supports_batching: bool = True
+    model_name: str = "Helsinki-NLP/opus-mt-pl-en"
+    batch_size: int = 32
+    # Sentences in one generate() call are padded to the longest; this caps the batch's sentence characters
+    max_batch_chars: int = 6000
 
     def estimate_usage(self, items_count: int, config: RuntimeConfig) -> UsageBreakdown:
         return None
@@ -103,39 +118,42 @@ class PolishLocalTranslation:
         # Capture timestamp at the start of translation processing
         processing_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
 
-        total_batches = (len(inputs_needing_translation) + self.batch_size - 1) // self.batch_size
+        # Similar-length sentences share a batch, so little compute goes to padding tokens.
+        # Results are cached by UID, so the reordering does not affect the outputs.
+        batches = make_length_bucketed_batches(inputs_needing_translation, self.batch_size, lambda input_item: len(input_item.context), self.max_batch_chars)
+        total_batches = len(batches)
 
         get_logger().info(f"Translating {len(inputs_needing_translation)} inputs using local MarianMT model...")
 
-        # Import transformers only when needed
-        from transformers import MarianMTModel, MarianTokenizer
+        import torch
 
-        # Load model and tokenizer
-        tokenizer = MarianTokenizer.from_pretrained(self.model_name)
-        model = MarianMTModel.from_pretrained(self.model_name)
-
-        for i in range(0, len(inputs_needing_translation), self.batch_size):
-            batch = inputs_needing_translation[i:i + self.batch_size]
-            batch_num = (i // self.batch_size) + 1
+        # Loaded on the first run only; later runs in the same process reuse the weights
+        tokenizer, model = _load_marian(self.model_name)
 
+        for batch_num, batch in enumerate(batches, 1):
             get_logger().debug(f"  Processing translation batch {batch_num}/{total_batches} ({len(batch)} inputs)")
 
             # Extract texts for translation
             src_texts = [input_item.context for input_item in batch]
 
-            # Translate batch
-            tokenized = tokenizer(src_texts, return_tensors="pt", padding=True)
-            translated = model.generate(**tokenized)
+            # Translate batch; inputs past the model's length limit are cut rather than failing the batch
+            tokenized = tokenizer(src_texts, return_tensors="pt", padding=True, truncation=True)
+            token_counts = tokenized["attention_mask"].sum(dim=1).tolist()
+            for input_item, token_count in zip(batch, token_counts):
+                if token_count >= tokenizer.model_max_length:
+                    get_logger().warning(f"Context for {input_item.uid} reaches the {tokenizer.model_max_length}-token MarianMT limit; only the truncated text is translated")
+            with torch.inference_mode():
+                translated = model.generate(**tokenized)
             results = tokenizer.batch_decode(translated, skip_special_tokens=True)
 
-            # Save results to cache
-            for input_item, translated_text in zip(batch, results):
-                # Create translation result for caching
-                translation_result = {
-                    "context_translation": translated_text
-                }
-
-                # Save to cache
-                cache.set(input_item.uid, self.id, self.model_name, "", translation_result, processing_timestamp)
-
-                get_logger().debug(f"    SUCCESS - translated sentence for UID {input_item.uid}")
+            # Save results to cache, writing the file once per batch
+            with cache.deferred_writes():
+                for input_item, translated_text in zip(batch, results):
+                    # Create translation result for caching
+                    translation_result = {
+                        "context_translation": translated_text
+                    }
+
+                    # Save to cache
+                    cache.set(input_item.uid, self.id, self.model_name, "", translation_result, processing_timestamp)
+            get_logger().debug(f"    Translated {len(results)} sentences")
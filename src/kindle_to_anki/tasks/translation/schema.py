@@ -1,11 +1,11 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranslationInput:
     uid: str
     context: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranslationOutput:
     translation: str
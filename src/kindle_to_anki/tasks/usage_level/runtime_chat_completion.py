@@ -5,6 +5,8 @@ from typing import List, Dict, Any, Optional
 from kindle_to_anki.logging import get_logger
 from kindle_to_anki.core.pricing.usage_dimension import UsageDimension
 from kindle_to_anki.core.runtimes.batch_call_result import BatchCallResult
+from kindle_to_anki.core.runtimes.batching import run_batches_concurrently
+from kindle_to_anki.core.runtimes.rate_limiter import get_rate_limiter
 from kindle_to_anki.core.pricing.usage_scope import UsageScope
 from kindle_to_anki.core.pricing.usage_breakdown import UsageBreakdown
 from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
@@ -27,6 +29,8 @@ class ChatCompletionUsageLevel:
     supported_tasks = ["usage_level"]
     supported_model_families = ["chat_completion"]
     supports_batching: bool = True
+    # Batch calls are I/O-bound, so this many are kept in flight at once
+    max_concurrent_batches: int = 4
 
     def _estimate_output_tokens_per_item(self, config: RuntimeConfig) -> int:
         return 10
@@ -91,6 +95,10 @@ class ChatCompletionUsageLevel:
             cached_count = 0
             for usage_input in usage_inputs:
                 cached_result = cache.get(usage_input.uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
+                if not cached_result:
+                    # Fall back to a result for the same input stored under another UID
+                    content_uid = UsageLevelCache.content_uid(usage_input.word, usage_input.lemma, usage_input.pos, usage_input.sentence, usage_input.definition)
+                    cached_result = cache.get(content_uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
                 if cached_result:
                     cached_count += 1
                     outputs.append(UsageLevelOutput(usage_level=cached_result.get('usage_level')))
@@ -106,9 +114,18 @@ class ChatCompletionUsageLevel:
             logger.info(f"Usage Level estimation completed (all from cache).")
             return [output for output in outputs if output is not None]
 
+        # Identical inputs under different UIDs need one call; the others read its result by content UID
+        inputs_by_content: Dict[str, UsageLevelInput] = {}
+        for usage_input in inputs_needing_estimation:
+            inputs_by_content.setdefault(UsageLevelCache.content_uid(usage_input.word, usage_input.lemma, usage_input.pos, usage_input.sentence, usage_input.definition), usage_input)
+        unique_inputs = list(inputs_by_content.values())
+
+        if len(unique_inputs) < len(inputs_needing_estimation):
+            logger.info(f"{len(inputs_needing_estimation) - len(unique_inputs)} inputs duplicate another input and reuse its result")
+
         MAX_RETRIES = 1
         retries = 0
-        failing_inputs = self._process_batches(inputs_needing_estimation, cache, source_language_name, runtime_config, cancellation_token)
+        failing_inputs = self._process_batches(unique_inputs, cache, source_language_name, runtime_config, cancellation_token)
 
         while len(failing_inputs) > 0:
             cancellation_token.raise_if_cancelled()
@@ -121,7 +138,9 @@ class ChatCompletionUsageLevel:
         for i, output in enumerate(outputs):
             if output is None:
                 usage_input = usage_inputs[i]
-                cached_result = cache.get(usage_input.uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
+                # Looked up by content UID, which also covers inputs deduplicated above
+                content_uid = UsageLevelCache.content_uid(usage_input.word, usage_input.lemma, usage_input.pos, usage_input.sentence, usage_input.definition)
+                cached_result = cache.get(content_uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
                 if cached_result:
                     usage_outputs.append(UsageLevelOutput(usage_level=cached_result.get('usage_level')))
                 else:
@@ -134,11 +153,7 @@ class ChatCompletionUsageLevel:
 
     def _make_batch_call(self, batch_inputs: List[UsageLevelInput], processing_timestamp: str, source_language_name: str, runtime_config: RuntimeConfig) -> BatchCallResult:
         logger = get_logger()
-        items_list = []
-        for input_item in batch_inputs:
-            items_list.append(f'{{"uid": "{input_item.uid}", "lemma": "{input_item.lemma}", "pos": "{input_item.pos}", "definition": "{input_item.definition}"}}')
-
-        items_json = "[\n  " + ",\n  ".join(items_list) + "\n]"
+        items_json = self._build_items_json(batch_inputs)
         prompt = self._build_prompt(items_json, source_language_name, runtime_config.prompt_id)
 
         model = ModelRegistry.get(runtime_config.model_id)
@@ -153,6 +168,11 @@ class ChatCompletionUsageLevel:
         logger.info(f"Making batch usage level API call for {len(batch_inputs)} inputs (est. cost: {estimated_cost_str})...")
         logger.debug(f"Full prompt:\n{prompt}")
 
+        # Wait for rate-limit headroom up front rather than failing the batch on a 429
+        rate_limiter = get_rate_limiter(model)
+        if rate_limiter:
+            rate_limiter.acquire(input_tokens + estimated_output_tokens)
+
         start_time = time.time()
 
         try:
@@ -168,6 +188,20 @@ class ChatCompletionUsageLevel:
         logger.info(f"Batch call completed in {elapsed:.2f}s (cost: {actual_cost_str})")
         logger.debug(f"Full response:\n{response_text}")
 
+        return self._parse_response(response_text, processing_timestamp, runtime_config)
+
+    def _build_items_json(self, batch_inputs: List[UsageLevelInput]) -> str:
+        # One item per line; json.dumps escapes quotes in definitions that would otherwise break the packed array
+        items_list = []
+        for input_item in batch_inputs:
+            items_list.append(json.dumps({"uid": input_item.uid, "lemma": input_item.lemma, "pos": input_item.pos, "definition": input_item.definition}, ensure_ascii=False))
+
+        return "[\n  " + ",\n  ".join(items_list) + "\n]"
+
+    def _parse_response(self, response_text: str, processing_timestamp: str, runtime_config: RuntimeConfig) -> BatchCallResult:
+        """Parse a batch response into a BatchCallResult keyed by UID."""
+        logger = get_logger()
+
         try:
             parsed_results = json.loads(strip_markdown_code_block(response_text))
         except json.JSONDecodeError as e:
@@ -181,25 +215,38 @@ class ChatCompletionUsageLevel:
     def _process_batches(self, inputs_needing_estimation: List[UsageLevelInput], cache: UsageLevelCache, source_language_name: str, runtime_config: RuntimeConfig, cancellation_token: CancellationToken = NONE_TOKEN) -> List[UsageLevelInput]:
         logger = get_logger()
         processing_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-        total_batches = (len(inputs_needing_estimation) + runtime_config.batch_size - 1) // runtime_config.batch_size
+        batches = self._make_batches(inputs_needing_estimation, runtime_config)
+        total_batches = len(batches)
         failing_inputs = []
 
-        for i in range(0, len(inputs_needing_estimation), runtime_config.batch_size):
+        def call_batch(batch_num: int, batch: List[UsageLevelInput]) -> BatchCallResult:
             cancellation_token.raise_if_cancelled()
-
-            batch = inputs_needing_estimation[i:i + runtime_config.batch_size]
-            batch_num = (i // runtime_config.batch_size) + 1
             logger.info(f"Processing usage level batch {batch_num}/{total_batches} ({len(batch)} inputs)")
+            return self._make_batch_call(batch, processing_timestamp, source_language_name, runtime_config)
+
+        # API calls run concurrently; results are cached on this thread in batch order
+        for batch, result in run_batches_concurrently(batches, call_batch, self.max_concurrent_batches):
+            failing_inputs.extend(self._collect_batch_results(batch, result, cache, runtime_config))
 
-            result = self._make_batch_call(batch, processing_timestamp, source_language_name, runtime_config)
+        return failing_inputs
+
+    def _make_batches(self, inputs: List[UsageLevelInput], runtime_config: RuntimeConfig) -> List[List[UsageLevelInput]]:
+        return [inputs[i:i + runtime_config.batch_size] for i in range(0, len(inputs), runtime_config.batch_size)]
 
-            if not result.success:
-                failing_inputs.extend(batch)
-                continue
+    def _collect_batch_results(self, batch: List[UsageLevelInput], result: BatchCallResult, cache: UsageLevelCache, runtime_config: RuntimeConfig) -> List[UsageLevelInput]:
+        """Cache the results of one batch call. Returns the inputs that failed."""
+        logger = get_logger()
 
+        if not result.success:
+            return list(batch)
+
+        failing_inputs = []
+        # The cache file is written once for the whole batch, not once per result
+        with cache.deferred_writes():
             for input_item in batch:
                 if input_item.uid in result.results:
-                    cache.set(input_item.uid, self.id, result.model_id, runtime_config.prompt_id, result.results[input_item.uid], result.timestamp)
+                    content_uid = UsageLevelCache.content_uid(input_item.word, input_item.lemma, input_item.pos, input_item.sentence, input_item.definition)
+                    cache.set(input_item.uid, self.id, result.model_id, runtime_config.prompt_id, result.results[input_item.uid], result.timestamp, aliases=(content_uid,))
                     logger.trace(f"estimated {input_item.lemma}")
                 else:
                     logger.warning(f"no result for {input_item.lemma}")
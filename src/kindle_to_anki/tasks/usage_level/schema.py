@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UsageLevelInput:
     uid: str
     word: str
@@ -12,6 +12,6 @@ class UsageLevelInput:
     definition: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UsageLevelOutput:
     usage_level: Optional[int]
@@ -5,6 +5,8 @@ from typing import List, Dict, Any
 from kindle_to_anki.logging import get_logger
 from kindle_to_anki.core.pricing.usage_dimension import UsageDimension
 from kindle_to_anki.core.runtimes.batch_call_result import BatchCallResult
+from kindle_to_anki.core.runtimes.batching import run_batches_concurrently
+from kindle_to_anki.core.runtimes.rate_limiter import get_rate_limiter
 from kindle_to_anki.core.pricing.usage_scope import UsageScope
 from kindle_to_anki.core.pricing.usage_breakdown import UsageBreakdown
 from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
@@ -32,6 +34,8 @@ class ChatCompletionWSD:
     supported_tasks = ["wsd"]
     supported_model_families = ["chat_completion"]
     supports_batching: bool = True
+    # Batch calls are I/O-bound, so this many are kept in flight at once
+    max_concurrent_batches: int = 4
 
     def _estimate_output_tokens_per_item(self, config: RuntimeConfig) -> int:
         return 25
@@ -107,6 +111,10 @@ class ChatCompletionWSD:
 
             for wsd_input in wsd_inputs:
                 cached_result = cache.get(wsd_input.uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
+                if not cached_result:
+                    # Fall back to a result for the same input stored under another UID
+                    content_uid = WSDCache.content_uid(wsd_input.word, wsd_input.lemma, wsd_input.pos, wsd_input.sentence)
+                    cached_result = cache.get(content_uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
                 if cached_result:
                     cached_count += 1
                     wsd_output = WSDOutput(
@@ -127,10 +135,19 @@ class ChatCompletionWSD:
             logger.info(f"{source_language_name} Word Sense Disambiguation (LLM) completed (all from cache).")
             return [output for output in outputs if output is not None]
 
+        # Identical inputs under different UIDs need one call; the others read its result by content UID
+        inputs_by_content: Dict[str, WSDInput] = {}
+        for wsd_input in inputs_needing_wsd:
+            inputs_by_content.setdefault(WSDCache.content_uid(wsd_input.word, wsd_input.lemma, wsd_input.pos, wsd_input.sentence), wsd_input)
+        unique_inputs = list(inputs_by_content.values())
+
+        if len(unique_inputs) < len(inputs_needing_wsd):
+            logger.info(f"{len(inputs_needing_wsd) - len(unique_inputs)} inputs duplicate another input and reuse its result")
+
         # Process inputs in batches with retry logic
         MAX_RETRIES = 1
         retries = 0
-        failing_inputs = self._process_wsd_batches(inputs_needing_wsd, cache, source_language_name, target_language_name, runtime_config, cancellation_token)
+        failing_inputs = self._process_wsd_batches(unique_inputs, cache, source_language_name, target_language_name, runtime_config, cancellation_token)
 
         while len(failing_inputs) > 0:
             cancellation_token.raise_if_cancelled()
@@ -149,9 +166,10 @@ class ChatCompletionWSD:
         wsd_outputs = []
         for i, output in enumerate(outputs):
             if output is None:
-                # This was a non-cached input, get from cache now
+                # This was a non-cached input, get from cache now (by content UID, which covers duplicates)
                 wsd_input = wsd_inputs[i]
-                cached_result = cache.get(wsd_input.uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
+                content_uid = WSDCache.content_uid(wsd_input.word, wsd_input.lemma, wsd_input.pos, wsd_input.sentence)
+                cached_result = cache.get(content_uid, self.id, runtime_config.model_id, runtime_config.prompt_id)
                 if cached_result:
                     wsd_output = WSDOutput(
                         definition=cached_result.get('definition', '')
@@ -169,11 +187,7 @@ class ChatCompletionWSD:
     def _make_batch_wsd_call(self, batch_inputs: List[WSDInput], processing_timestamp: str, source_language_name: str, target_language_name: str, runtime_config: RuntimeConfig) -> BatchCallResult:
         """Make batch LLM API call for WSD. Returns BatchCallResult with success/failure state."""
         logger = get_logger()
-        items_list = []
-        for input_item in batch_inputs:
-            items_list.append(f'{{"uid": "{input_item.uid}", "word": "{input_item.word}", "lemma": "{input_item.lemma}", "pos": "{input_item.pos}", "sentence": "{input_item.sentence}"}}')
-
-        items_json = "[\n  " + ",\n  ".join(items_list) + "\n]"
+        items_json = self._build_items_json(batch_inputs)
 
         prompt = self._build_prompt(items_json, source_language_name, target_language_name, runtime_config.prompt_id)
 
@@ -193,6 +207,11 @@ class ChatCompletionWSD:
         logger.info(f"Making batch WSD API call for {len(batch_inputs)} inputs (in: {input_tokens} tokens, out: ~{estimated_output_tokens} tokens, est. cost: {estimated_cost_str})...")
         logger.debug(f"Full prompt:\n{prompt}")
 
+        # Wait for rate-limit headroom up front rather than failing the batch on a 429
+        rate_limiter = get_rate_limiter(model)
+        if rate_limiter:
+            rate_limiter.acquire(input_tokens + estimated_output_tokens)
+
         start_time = time.time()
 
         try:
@@ -209,6 +228,20 @@ class ChatCompletionWSD:
         logger.info(f"Batch WSD API call completed in {elapsed:.2f}s (in: {input_tokens} tokens, out: {output_tokens} tokens, cost: {actual_cost_str})")
         logger.debug(f"Full response:\n{response_text}")
 
+        return self._parse_response(response_text, processing_timestamp, runtime_config)
+
+    def _build_items_json(self, batch_inputs: List[WSDInput]) -> str:
+        # One item per line; json.dumps escapes quotes in sentences that would otherwise break the packed array
+        items_list = []
+        for input_item in batch_inputs:
+            items_list.append(json.dumps({"uid": input_item.uid, "word": input_item.word, "lemma": input_item.lemma, "pos": input_item.pos, "sentence": input_item.sentence}, ensure_ascii=False))
+
+        return "[\n  " + ",\n  ".join(items_list) + "\n]"
+
+    def _parse_response(self, response_text: str, processing_timestamp: str, runtime_config: RuntimeConfig) -> BatchCallResult:
+        """Parse a batch response into a BatchCallResult keyed by UID."""
+        logger = get_logger()
+
         try:
             parsed_results = json.loads(strip_markdown_code_block(response_text))
         except json.JSONDecodeError as e:
@@ -226,29 +259,41 @@ class ChatCompletionWSD:
         # Capture timestamp at the start of WSD processing
         processing_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
 
-        total_batches = (len(inputs_needing_wsd) + runtime_config.batch_size - 1) // runtime_config.batch_size
+        batches = self._make_batches(inputs_needing_wsd, runtime_config)
+        total_batches = len(batches)
         failing_inputs = []
 
-        for i in range(0, len(inputs_needing_wsd), runtime_config.batch_size):
+        def call_batch(batch_num: int, batch: List[WSDInput]) -> BatchCallResult:
             cancellation_token.raise_if_cancelled()
+            logger.info(f"Processing WSD batch {batch_num}/{total_batches} ({len(batch)} inputs)")
+            return self._make_batch_wsd_call(batch, processing_timestamp, source_language_name, target_language_name, runtime_config)
 
-            batch = inputs_needing_wsd[i:i + runtime_config.batch_size]
-            batch_num = (i // runtime_config.batch_size) + 1
+        # API calls run concurrently; results are cached on this thread in batch order
+        for batch, result in run_batches_concurrently(batches, call_batch, self.max_concurrent_batches):
+            failing_inputs.extend(self._collect_batch_results(batch, result, cache, runtime_config))
 
-            logger.info(f"Processing WSD batch {batch_num}/{total_batches} ({len(batch)} inputs)")
+        return failing_inputs
 
-            result = self._make_batch_wsd_call(batch, processing_timestamp, source_language_name, target_language_name, runtime_config)
+    def _make_batches(self, inputs: List[WSDInput], runtime_config: RuntimeConfig) -> List[List[WSDInput]]:
+        return [inputs[i:i + runtime_config.batch_size] for i in range(0, len(inputs), runtime_config.batch_size)]
 
-            if not result.success:
-                failing_inputs.extend(batch)
-                continue
+    def _collect_batch_results(self, batch: List[WSDInput], result: BatchCallResult, cache: WSDCache, runtime_config: RuntimeConfig) -> List[WSDInput]:
+        """Cache the results of one batch call. Returns the inputs that failed."""
+        logger = get_logger()
 
+        if not result.success:
+            return list(batch)
+
+        failing_inputs = []
+        # The cache file is written once for the whole batch, not once per result
+        with cache.deferred_writes():
             for input_item in batch:
                 if input_item.uid in result.results:
                     wsd_data = result.results[input_item.uid]
 
                     # Save to cache
-                    cache.set(input_item.uid, self.id, result.model_id, runtime_config.prompt_id, wsd_data, result.timestamp)
+                    content_uid = WSDCache.content_uid(input_item.word, input_item.lemma, input_item.pos, input_item.sentence)
+                    cache.set(input_item.uid, self.id, result.model_id, runtime_config.prompt_id, wsd_data, result.timestamp, aliases=(content_uid,))
 
                     logger.trace(f"enriched {input_item.word}")
                 else:
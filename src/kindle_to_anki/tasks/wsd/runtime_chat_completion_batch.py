@@ -0,0 +1,51 @@
+import time
+from typing import List
+
+from kindle_to_anki.logging import get_logger
+from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
+from kindle_to_anki.core.runtimes.batching import run_batch_job
+from kindle_to_anki.core.models.registry import ModelRegistry
+from kindle_to_anki.platforms.platform_registry import PlatformRegistry
+
+from .runtime_chat_completion import ChatCompletionWSD
+from .schema import WSDInput
+from kindle_to_anki.caching.wsd_cache import WSDCache
+from kindle_to_anki.util.cancellation import CancellationToken, NONE_TOKEN
+
+
+class ChatCompletionWSDBatch(ChatCompletionWSD):
+    """
+    Runtime for WSD that submits every batch as a single platform batch
+    job (e.g. the OpenAI Batch API) instead of one call per batch.
+    Meant for bulk reruns where turnaround of up to 24h is acceptable.
+    Models on platforms without batch jobs fall back to synchronous calls.
+    """
+    id: str = "chat_completion_wsd_batch"
+    display_name: str = "Chat Completion WSD Runtime (Batch API)"
+
+    def _process_wsd_batches(self, inputs_needing_wsd: List[WSDInput], cache: WSDCache, source_language_name: str, target_language_name: str, runtime_config: RuntimeConfig, cancellation_token: CancellationToken = NONE_TOKEN) -> List[WSDInput]:
+        """Submit all batches as one batch job. Returns the inputs that failed."""
+        model = ModelRegistry.get(runtime_config.model_id)
+        platform = PlatformRegistry.get(model.platform_id)
+
+        if not platform.supports_batch_api:
+            get_logger().warning(f"{platform.name} does not support batch jobs, falling back to synchronous calls")
+            return super()._process_wsd_batches(inputs_needing_wsd, cache, source_language_name, target_language_name, runtime_config, cancellation_token)
+
+        # Capture timestamp at the start of WSD processing
+        processing_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+
+        failing_inputs = []
+
+        for batch, result in run_batch_job(
+            platform,
+            runtime_config.model_id,
+            self._make_batches(inputs_needing_wsd, runtime_config),
+            build_prompt=lambda batch: self._build_prompt(self._build_items_json(batch), source_language_name, target_language_name, runtime_config.prompt_id),
+            parse_response=lambda response_text: self._parse_response(response_text, processing_timestamp, runtime_config),
+            job_name="WSD",
+            cancellation_token=cancellation_token,
+        ):
+            failing_inputs.extend(self._collect_batch_results(batch, result, cache, runtime_config))
+
+        return failing_inputs
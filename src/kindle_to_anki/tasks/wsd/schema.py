@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WSDInput:
     uid: str
     word: str
@@ -10,6 +10,6 @@ class WSDInput:
     sentence: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WSDOutput:
     definition: str
@@ -0,0 +1,32 @@
+"""
+Shared pytest fixtures.
+Runtimes are stateless, so one instance per session serves every test that needs it.
+"""
+
+import pytest
+
+from kindle_to_anki.core.bootstrap import bootstrap_all
+from kindle_to_anki.tasks.lui.runtime_chat_completion import ChatCompletionLUI
+from kindle_to_anki.tasks.translation.runtime_chat_completion import ChatCompletionTranslation
+from kindle_to_anki.tasks.usage_level.runtime_chat_completion import ChatCompletionUsageLevel
+
+
+@pytest.fixture(scope="session", autouse=True)
+def bootstrapped():
+    """Register platforms, models and runtimes once for the whole session, before any test runs."""
+    bootstrap_all()
+
+
+@pytest.fixture(scope="session")
+def lui_runtime(bootstrapped) -> ChatCompletionLUI:
+    return ChatCompletionLUI()
+
+
+@pytest.fixture(scope="session")
+def translation_runtime(bootstrapped) -> ChatCompletionTranslation:
+    return ChatCompletionTranslation()
+
+
+@pytest.fixture(scope="session")
+def usage_level_runtime(bootstrapped) -> ChatCompletionUsageLevel:
+    return ChatCompletionUsageLevel()
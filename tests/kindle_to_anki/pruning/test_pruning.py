@@ -103,13 +103,17 @@ def test_prune_existing_notes_automatically():
     # Test the pruning function with auto_prune=True to skip user input
     pruned_notes = prune_existing_notes_automatically(notes, existing_notes, cache_suffix='pl-en_test')
 
-    # Check results for each test case
+    # Index retained notes once so each test case is a set lookup
+    retained_keys = frozenset(
+        (note.expression, note.part_of_speech, note.definition) for note in pruned_notes
+    )
+
+    # Check results for each test case, collecting the report so it is written in one go
+    lines = []
     for test_case in test_cases:
-        # Find the corresponding note in results
-        note_retained = any(note.expression == test_case['expression'] and 
-                            note.part_of_speech == test_case['part_of_speech'] and
-                            note.definition == test_case['definition']
-                            for note in pruned_notes)
+        note_retained = (
+            test_case['expression'], test_case['part_of_speech'], test_case['definition']
+        ) in retained_keys
 
         if test_case['expected_retained'] == note_retained:
             status = "PASSED"
@@ -119,8 +123,9 @@ def test_prune_existing_notes_automatically():
         action = "retained" if note_retained else "pruned"
         expected_action = "retained" if test_case['expected_retained'] else "pruned"
 
-        print(f"Test {status} for word '{test_case['expression']}' ({test_case['part_of_speech']}): expected {expected_action}, got {action}")
+        lines.append(f"Test {status} for word '{test_case['expression']}' ({test_case['part_of_speech']}): expected {expected_action}, got {action}")
 
+    print("\n".join(lines))
     print(f"\nSummary: {len(notes)} original notes, {len(pruned_notes)} retained after pruning")
 
 
@@ -2,6 +2,7 @@
 """
 Integration test for Kindle candidate collection runtime.
 """
+from itertools import islice
 from pathlib import Path
 
 from kindle_to_anki.tasks.collect_candidates.runtime_kindle import KindleCandidateRuntime
@@ -26,13 +27,14 @@ def test_collect_candidate_runtime_kindle():
     
     # Test candidate collection
     try:
-        outputs = runtime.collect_candidates()
+        # Candidates are streamed; only the first few are needed here
+        outputs = list(islice(runtime.collect_candidates(), 3))
         
-        print(f"Candidate collection completed. Got {len(outputs)} candidates.")
+        print(f"Candidate collection completed. Got {len(outputs)} sample candidates.")
         
         if outputs:
             # Show first few examples
-            for i, output in enumerate(outputs[:3]):
+            for i, output in enumerate(outputs):
                 print(f"\nCandidate {i+1}:")
                 print(f"  Word: {output.word}")
                 print(f"  Stem: {output.stem}")
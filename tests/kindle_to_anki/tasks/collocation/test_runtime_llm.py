@@ -6,10 +6,11 @@ Results are saved to eval_results/ and summarized to console.
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from kindle_to_anki.core.bootstrap import bootstrap_all
 from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
@@ -17,13 +18,14 @@ from kindle_to_anki.core.prompts import list_prompts
 from kindle_to_anki.tasks.collocation.runtime_chat_completion import ChatCompletionCollocation
 from kindle_to_anki.tasks.collocation.schema import CollocationInput
 
-bootstrap_all()
-
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 RESULTS_DIR = Path(__file__).parent / "eval_results"
 
 MODELS = ["gpt-5.1", "gpt-5-mini", "gemini-3-flash-preview"]
 
+# Upper bound on evaluation runs in flight at once, to stay within provider rate limits
+MAX_CONCURRENT_RUNS = 8
+
 
 @dataclass
 class TestCase:
@@ -211,6 +213,45 @@ def print_summary(eval_run: EvalRun):
     print("=" * 80 + "\n")
 
 
+def evaluate_configuration(
+    model_id: str,
+    source_lang: str,
+    prompt_id: Optional[str],
+    session_dir: Path,
+) -> Optional[EvalRun]:
+    """Run one configuration; errors are reported and yield None so other runs continue."""
+    print(f"\n>>> Evaluating: model={model_id}, lang={source_lang}, prompt={prompt_id or 'default'}")
+    try:
+        return run_evaluation(
+            model_id=model_id,
+            source_lang=source_lang,
+            prompt_id=prompt_id,
+            session_dir=session_dir,
+        )
+    except Exception as e:
+        print(f"  ERROR ({model_id}, {source_lang}, prompt={prompt_id or 'default'}): {e}")
+        return None
+
+
+def run_configurations(configurations: List[Tuple[str, str, Optional[str]]], session_dir: Path) -> List[EvalRun]:
+    """Run (model, language, prompt) configurations concurrently; runs keep the given order."""
+    all_runs = []
+
+    # Each configuration is an independent, latency-bound chain of API calls
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_RUNS) as executor:
+        futures = [
+            executor.submit(evaluate_configuration, *configuration, session_dir)
+            for configuration in configurations
+        ]
+        for future in futures:
+            eval_run = future.result()
+            if eval_run is not None:
+                all_runs.append(eval_run)
+                print_summary(eval_run)
+
+    return all_runs
+
+
 def run_matrix_evaluation(
     models: List[str],
     source_langs: Optional[List[str]] = None,
@@ -229,23 +270,13 @@ def run_matrix_evaluation(
     session_dir.mkdir(parents=True, exist_ok=True)
     print(f"\nResults will be saved to: {session_dir}")
 
-    all_runs = []
-
-    for model_id in models:
-        for source_lang in source_langs:
-            for prompt_id in prompt_ids:
-                print(f"\n>>> Evaluating: model={model_id}, lang={source_lang}, prompt={prompt_id or 'default'}")
-                try:
-                    eval_run = run_evaluation(
-                        model_id=model_id,
-                        source_lang=source_lang,
-                        prompt_id=prompt_id,
-                        session_dir=session_dir,
-                    )
-                    all_runs.append(eval_run)
-                    print_summary(eval_run)
-                except Exception as e:
-                    print(f"  ERROR: {e}")
+    configurations = [
+        (model_id, source_lang, prompt_id)
+        for model_id in models
+        for source_lang in source_langs
+        for prompt_id in prompt_ids
+    ]
+    all_runs = run_configurations(configurations, session_dir)
 
     if len(all_runs) > 1:
         print_comparison_table(all_runs)
@@ -430,23 +461,13 @@ def interactive_evaluation():
     print(f"\nResults will be saved to: {session_dir}")
 
     # Run evaluations
-    all_runs = []
-    for model_id in selected_models:
-        for source_lang in source_langs:
-            for prompt_id in selected_prompts:
-                prompt_name = prompt_id or "default"
-                print(f"\n>>> Evaluating: model={model_id}, lang={source_lang}, prompt={prompt_name}")
-                try:
-                    eval_run = run_evaluation(
-                        model_id=model_id,
-                        source_lang=source_lang,
-                        prompt_id=prompt_id,
-                        session_dir=session_dir,
-                    )
-                    all_runs.append(eval_run)
-                    print_summary(eval_run)
-                except Exception as e:
-                    print(f"  ERROR: {e}")
+    configurations = [
+        (model_id, source_lang, prompt_id)
+        for model_id in selected_models
+        for source_lang in source_langs
+        for prompt_id in selected_prompts
+    ]
+    all_runs = run_configurations(configurations, session_dir)
 
     if len(all_runs) > 1:
         print_comparison_table(all_runs)
@@ -482,6 +503,7 @@ def test_matrix_evaluation():
 
 if __name__ == "__main__":
     import sys
+    bootstrap_all()
     if len(sys.argv) > 1 and sys.argv[1] == "matrix":
         test_matrix_evaluation()
     else:
@@ -6,10 +6,13 @@ Results are saved to eval_results/ and summarized to console.
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+import pytest
 
 from kindle_to_anki.core.bootstrap import bootstrap_all
 from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
@@ -17,13 +20,17 @@ from kindle_to_anki.core.prompts import list_prompts
 from kindle_to_anki.tasks.hint.runtime_chat_completion import ChatCompletionHint
 from kindle_to_anki.tasks.hint.schema import HintInput
 
-bootstrap_all()
-
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 RESULTS_DIR = Path(__file__).parent / "eval_results"
 
+# Runtimes are stateless, so a single instance is shared by every evaluation
+RUNTIME = ChatCompletionHint()
+
 MODELS = ["gpt-5.1", "gpt-5-mini", "gemini-3-flash-preview"]
 
+# Upper bound on evaluation runs in flight at once, to stay within provider rate limits
+MAX_CONCURRENT_RUNS = 8
+
 
 @dataclass
 class TestCase:
@@ -107,8 +114,7 @@ def run_evaluation(
     if not test_cases:
         raise ValueError(f"No test cases found for {source_lang} -> {target_lang}")
 
-    # Setup runtime
-    runtime = ChatCompletionHint()
+    # Setup runtime config
     runtime_config = RuntimeConfig(
         model_id=model_id,
         batch_size=30,
@@ -131,7 +137,7 @@ def run_evaluation(
 
     # Run hint generation
     start_time = time.time()
-    hint_outputs = runtime.generate(
+    hint_outputs = RUNTIME.generate(
         hint_inputs,
         runtime_config=runtime_config,
         ignore_cache=False,
@@ -225,6 +231,47 @@ def print_summary(eval_run: EvalRun):
     print("=" * 80 + "\n")
 
 
+def evaluate_configuration(
+    model_id: str,
+    source_lang: str,
+    target_lang: str,
+    prompt_id: Optional[str],
+    session_dir: Path,
+) -> Optional[EvalRun]:
+    """Run one configuration; errors are reported and yield None so other runs continue."""
+    print(f"\n>>> Evaluating: model={model_id}, {source_lang}->{target_lang}, prompt={prompt_id or 'default'}")
+    try:
+        return run_evaluation(
+            model_id=model_id,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            prompt_id=prompt_id,
+            session_dir=session_dir,
+        )
+    except Exception as e:
+        print(f"  ERROR ({model_id}, {source_lang}->{target_lang}, prompt={prompt_id or 'default'}): {e}")
+        return None
+
+
+def run_configurations(configurations: List[Tuple[str, str, str, Optional[str]]], session_dir: Path) -> List[EvalRun]:
+    """Run (model, source, target, prompt) configurations concurrently; runs keep the given order."""
+    all_runs = []
+
+    # Each configuration is an independent, latency-bound chain of API calls
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_RUNS) as executor:
+        futures = [
+            executor.submit(evaluate_configuration, *configuration, session_dir)
+            for configuration in configurations
+        ]
+        for future in futures:
+            eval_run = future.result()
+            if eval_run is not None:
+                all_runs.append(eval_run)
+                print_summary(eval_run)
+
+    return all_runs
+
+
 def run_matrix_evaluation(
     models: List[str],
     source_langs: Optional[List[str]] = None,
@@ -243,29 +290,16 @@ def run_matrix_evaluation(
     session_dir.mkdir(parents=True, exist_ok=True)
     print(f"\nResults will be saved to: {session_dir}")
 
-    all_runs = []
-
+    configurations = []
     for model_id in models:
         for source_lang in source_langs:
             # Load corpus to find target languages for this source
-            test_cases = load_test_corpus(source_lang)
-            target_langs = list(set(tc.target_lang for tc in test_cases))
-
+            target_langs = sorted(set(tc.target_lang for tc in load_test_corpus(source_lang)))
             for target_lang in target_langs:
                 for prompt_id in prompt_ids:
-                    print(f"\n>>> Evaluating: model={model_id}, {source_lang}->{target_lang}, prompt={prompt_id or 'default'}")
-                    try:
-                        eval_run = run_evaluation(
-                            model_id=model_id,
-                            source_lang=source_lang,
-                            target_lang=target_lang,
-                            prompt_id=prompt_id,
-                            session_dir=session_dir,
-                        )
-                        all_runs.append(eval_run)
-                        print_summary(eval_run)
-                    except Exception as e:
-                        print(f"  ERROR: {e}")
+                    configurations.append((model_id, source_lang, target_lang, prompt_id))
+
+    all_runs = run_configurations(configurations, session_dir)
 
     if len(all_runs) > 1:
         print_comparison_table(all_runs)
@@ -466,31 +500,19 @@ def interactive_evaluation():
     print(f"\nResults will be saved to: {session_dir}")
 
     # Run evaluations
-    all_runs = []
+    configurations = []
     for model_id in selected_models:
         for source_lang in source_langs:
-            test_cases = load_test_corpus(source_lang)
-            corpus_target_langs = set(tc.target_lang for tc in test_cases)
+            corpus_target_langs = set(tc.target_lang for tc in load_test_corpus(source_lang))
 
             for target_lang in target_langs:
                 if target_lang not in corpus_target_langs:
                     continue
 
                 for prompt_id in selected_prompts:
-                    prompt_name = prompt_id or "default"
-                    print(f"\n>>> Evaluating: model={model_id}, {source_lang}->{target_lang}, prompt={prompt_name}")
-                    try:
-                        eval_run = run_evaluation(
-                            model_id=model_id,
-                            source_lang=source_lang,
-                            target_lang=target_lang,
-                            prompt_id=prompt_id,
-                            session_dir=session_dir,
-                        )
-                        all_runs.append(eval_run)
-                        print_summary(eval_run)
-                    except Exception as e:
-                        print(f"  ERROR: {e}")
+                    configurations.append((model_id, source_lang, target_lang, prompt_id))
+
+    all_runs = run_configurations(configurations, session_dir)
 
     if len(all_runs) > 1:
         print_comparison_table(all_runs)
@@ -503,16 +525,18 @@ def interactive_evaluation():
 
 # === CLI Entry Points ===
 
-def test_single_evaluation():
-    """Quick test with default settings."""
+@pytest.mark.parametrize("model_id", MODELS)
+def test_single_evaluation(model_id):
+    """Quick test with default settings, one independent case per model."""
     eval_run = run_evaluation(
-        model_id="gpt-5.1",
+        model_id=model_id,
         source_lang="pl",
         target_lang="en",
     )
     print_summary(eval_run)
 
 
+@pytest.mark.compare
 def test_matrix_evaluation():
     """Run matrix evaluation across multiple configurations."""
     hint_prompts = list_prompts("hint")
@@ -527,6 +551,7 @@ def test_matrix_evaluation():
 
 if __name__ == "__main__":
     import sys
+    bootstrap_all()
     if len(sys.argv) > 1 and sys.argv[1] == "matrix":
         test_matrix_evaluation()
     else:
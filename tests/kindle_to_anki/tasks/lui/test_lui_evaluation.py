@@ -4,27 +4,60 @@ LUI Evaluation Harness - Tests Lexical Unit Identification across models, runtim
 Results are saved to eval_results/ (gitignored) and summarized to console.
 """
 
+import hashlib
 import json
+import os
+import re
+import sys
 import time
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from itertools import product
+from typing import List, Dict, Any, Optional, Tuple
 
 from kindle_to_anki.core.bootstrap import bootstrap_all
 from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
 from kindle_to_anki.core.prompts import list_prompts
 from kindle_to_anki.core.models.registry import ModelRegistry
 from kindle_to_anki.tasks.lui.runtime_chat_completion import ChatCompletionLUI
+from kindle_to_anki.tasks.lui.runtime_chat_completion_batch import ChatCompletionLUIBatch
 from kindle_to_anki.tasks.lui.schema import LUIInput, LUIOutput
 
-bootstrap_all()
-
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 RESULTS_DIR = Path(__file__).parent / "eval_results"
+# Matrix sessions append every run, one JSON line each, to this file in the session directory
+SESSION_RUNS_FILENAME = "_runs.jsonl"
+
+# Runtimes selectable by runtime_id; the batch runtime trades latency for cheaper calls
+RUNTIMES = {
+    ChatCompletionLUI.id: ChatCompletionLUI,
+    ChatCompletionLUIBatch.id: ChatCompletionLUIBatch,
+}
+
+# Console rules shared by the report printers
+RULE = "=" * 70
+WIDE_RULE = "=" * 140
+WIDE_THIN_RULE = "─" * 140
+INPUT_CLOSING_RULE = "─" * 120
+
+# Comparison table columns and their widths
+COMPARISON_TABLE_HEADER = ("Model", "Lang", "Prompt", "Cases", "Time")
+COMPARISON_TABLE_WIDTHS = (25, 6, 20, 8, 8)
+
+# Upper bound on evaluation runs in flight at once, to stay within provider rate limits
+MAX_CONCURRENT_RUNS = 8
+
+# LUIOutput fields recorded in each EvalResult.actual
+LUI_OUTPUT_FIELDS = tuple(f.name for f in fields(LUIOutput))
 
+# Comma-separated list of 1-based indices accepted by prompt_selection
+SELECTION_RE = re.compile(r"[0-9]+(?:\s*,\s*[0-9]+)*")
 
-@dataclass
+
+@dataclass(slots=True)
 class TestCase:
     uid: str
     word: str
@@ -32,7 +65,7 @@ class TestCase:
     language: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalResult:
     uid: str
     word: str
@@ -41,7 +74,7 @@ class EvalResult:
     actual: Dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalRun:
     timestamp: str
     runtime_id: str
@@ -53,24 +86,33 @@ class EvalRun:
     results: List[EvalResult]
 
 
-def load_test_corpus(language: Optional[str] = None) -> List[TestCase]:
-    """Load test cases from JSONL corpus file."""
+@lru_cache(maxsize=None)
+def load_test_corpus(language: Optional[str] = None) -> Tuple[TestCase, ...]:
+    """Load test cases from JSONL corpus file (parsed once per language per session)."""
     corpus_path = FIXTURES_DIR / "lui_test_corpus.jsonl"
     cases = []
-    with open(corpus_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            data = json.loads(line)
-            if language is None or data["language"] == language:
-                cases.append(TestCase(
-                    uid=data["uid"],
-                    word=data["word"],
-                    sentence=data["sentence"],
-                    language=data["language"],
-                ))
-    return cases
+    # Read the corpus in one call and split once; json.loads decodes UTF-8 bytes itself
+    for line in corpus_path.read_bytes().splitlines():
+        if not line.strip():
+            continue
+        data = json.loads(line)
+        if language is None or data["language"] == language:
+            cases.append(TestCase(
+                uid=data["uid"],
+                word=data["word"],
+                sentence=data["sentence"],
+                language=data["language"],
+            ))
+    return tuple(cases)
+
+
+def content_uid(tc: TestCase) -> str:
+    """
+    Content-addressed UID for the runtime's cache: an edited corpus line gets a fresh
+    entry instead of a stale hit, and identical inputs share one cached result.
+    """
+    digest = hashlib.sha256(f"{tc.language}|{tc.word}|{tc.sentence}".encode("utf-8")).hexdigest()
+    return f"eval_{digest[:16]}"
 
 
 def run_evaluation(
@@ -89,7 +131,7 @@ def run_evaluation(
         raise ValueError(f"No test cases found for language: {language}")
 
     # Setup runtime
-    runtime = ChatCompletionLUI()
+    runtime = RUNTIMES[runtime_id]()
     runtime_config = RuntimeConfig(
         model_id=model_id,
         batch_size=30,
@@ -98,39 +140,41 @@ def run_evaluation(
         prompt_id=prompt_id,
     )
 
-    # Create inputs
-    lui_inputs = [
-        LUIInput(uid=tc.uid, word=tc.word, sentence=tc.sentence)
-        for tc in test_cases
-    ]
+    # Create inputs; results are cached per model/prompt under a content-derived UID,
+    # so duplicate (word, sentence) rows collapse to one input sent to the model
+    case_uids = [content_uid(tc) for tc in test_cases]
+    lui_inputs_by_uid = {}
+    for tc, uid in zip(test_cases, case_uids):
+        if uid not in lui_inputs_by_uid:
+            lui_inputs_by_uid[uid] = LUIInput(uid=uid, word=tc.word, sentence=tc.sentence)
 
     # Run identification
     start_time = time.time()
     lui_outputs = runtime.identify(
-        lui_inputs,
+        list(lui_inputs_by_uid.values()),
         runtime_config=runtime_config,
         ignore_cache=False,
         use_test_cache=True,
     )
     duration = time.time() - start_time
 
+    # Convert each unique output once, then fan it back out to every test case
+    actual_by_uid = {
+        uid: {name: getattr(output, name) for name in LUI_OUTPUT_FIELDS}
+        for uid, output in zip(lui_inputs_by_uid, lui_outputs)
+    }
+
     # Collect results
-    eval_results = []
-    for tc, output in zip(test_cases, lui_outputs):
-        actual_dict = {
-            "lemma": output.lemma,
-            "part_of_speech": output.part_of_speech,
-            "aspect": output.aspect,
-            "surface_lexical_unit": output.surface_lexical_unit,
-            "unit_type": output.unit_type,
-        }
-        eval_results.append(EvalResult(
+    eval_results = [
+        EvalResult(
             uid=tc.uid,
             word=tc.word,
             sentence=tc.sentence,
             language=tc.language,
-            actual=actual_dict,
-        ))
+            actual=actual_by_uid[uid],
+        )
+        for tc, uid in zip(test_cases, case_uids)
+    ]
 
     eval_run = EvalRun(
         timestamp=datetime.now().isoformat(),
@@ -149,6 +193,13 @@ def run_evaluation(
     return eval_run
 
 
+def encode_dataclass(obj):
+    """json default hook: serialize dataclass instances as a shallow dict of their fields."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def save_eval_run(eval_run: EvalRun, session_dir: Optional[Path] = None):
     """Save evaluation run to JSON file."""
     output_dir = session_dir if session_dir else RESULTS_DIR
@@ -159,155 +210,227 @@ def save_eval_run(eval_run: EvalRun, session_dir: Optional[Path] = None):
 
     filepath = output_dir / filename
 
-    # Convert to serializable dict
-    data = asdict(eval_run)
-
+    # Encode dataclasses field by field as they are reached, without an asdict() deep copy.
+    # Per-run files are written compact; only the session summary is indented for reading.
     with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        json.dump(eval_run, f, ensure_ascii=False, default=encode_dataclass)
 
     print(f"Results saved to: {filepath}")
 
 
+def append_eval_run(eval_run: EvalRun, session_file):
+    """Append evaluation run as one compact JSON line to the open session file."""
+    json.dump(eval_run, session_file, ensure_ascii=False, default=encode_dataclass)
+    session_file.write("\n")
+
+
+def full_reports_enabled() -> bool:
+    """Full console reports are for terminals; LUI_FORCE_PRINT=1 forces them elsewhere."""
+    return sys.stdout.isatty() or os.environ.get("LUI_FORCE_PRINT") == "1"
+
+
 def print_summary(eval_run: EvalRun):
-    """Print evaluation summary to console."""
-    print("\n" + "=" * 70)
-    print("LUI EVALUATION SUMMARY")
-    print("=" * 70)
-    print(f"Runtime:   {eval_run.runtime_id}")
-    print(f"Model:     {eval_run.model_id}")
-    print(f"Prompt:    {eval_run.prompt_id or '(default)'}")
-    print(f"Language:  {eval_run.language}")
-    print(f"Cases:     {eval_run.total_cases}")
-    print(f"Duration:  {eval_run.duration_seconds:.2f}s")
-    print("-" * 70)
+    """
+    Print evaluation summary to console.
+    Skipped when stdout is not a terminal (the full results are on disk) unless
+    LUI_FORCE_PRINT=1 is set.
+    """
+    if not full_reports_enabled():
+        print(f"Summary skipped for {eval_run.model_id} | {eval_run.language} | "
+              f"{eval_run.prompt_id or 'default'} (stdout is not a terminal; set LUI_FORCE_PRINT=1 to print it)")
+        return
+
+    lines = [
+        "\n" + RULE,
+        "LUI EVALUATION SUMMARY",
+        RULE,
+        f"Runtime:   {eval_run.runtime_id}",
+        f"Model:     {eval_run.model_id}",
+        f"Prompt:    {eval_run.prompt_id or '(default)'}",
+        f"Language:  {eval_run.language}",
+        f"Cases:     {eval_run.total_cases}",
+        f"Duration:  {eval_run.duration_seconds:.2f}s",
+        "-" * 70,
+    ]
 
     # Show all results
-    print("\nRESULTS:")
+    lines.append("\nRESULTS:")
     for r in eval_run.results:
-        print(f"\n  [{r.uid}] {r.word}")
-        print(f"    Sentence: \"{r.sentence[:80]}{'...' if len(r.sentence) > 80 else ''}\"")
-        print(f"    Lemma: {r.actual.get('lemma', '')}")
-        print(f"    POS: {r.actual.get('part_of_speech', '')}")
-        print(f"    Aspect: {r.actual.get('aspect', '')}")
-        print(f"    Form: {r.actual.get('surface_lexical_unit', '')}")
-        print(f"    Type: {r.actual.get('unit_type', '')}")
-    print("=" * 70 + "\n")
+        lines.append(f"\n  [{r.uid}] {r.word}")
+        lines.append(f"    Sentence: \"{r.sentence[:80]}{'...' if len(r.sentence) > 80 else ''}\"")
+        lines.append(f"    Lemma: {r.actual.get('lemma', '')}")
+        lines.append(f"    POS: {r.actual.get('part_of_speech', '')}")
+        lines.append(f"    Aspect: {r.actual.get('aspect', '')}")
+        lines.append(f"    Form: {r.actual.get('surface_lexical_unit', '')}")
+        lines.append(f"    Type: {r.actual.get('unit_type', '')}")
+    lines.append(RULE + "\n")
+
+    # Written in one go so concurrent runs' reports don't interleave
+    print("\n".join(lines))
+
+
+def evaluate_configuration(
+    runtime_id: str,
+    model_id: str,
+    language: str,
+    prompt_id: Optional[str],
+) -> Optional[EvalRun]:
+    """Run a single configuration without saving it, reporting (rather than raising) failures."""
+    print(f"\n>>> Evaluating: model={model_id}, lang={language}, prompt={prompt_id or 'default'}")
+    try:
+        return run_evaluation(
+            runtime_id=runtime_id,
+            model_id=model_id,
+            language=language,
+            prompt_id=prompt_id,
+            save_results=False,
+        )
+    except Exception as e:
+        print(f"  ERROR ({model_id}, {language}, prompt={prompt_id or 'default'}): {e}")
+        return None
+
+
+def run_configurations(
+    configurations: List[Tuple[str, str, Optional[str]]],
+    session_dir: Path,
+    runtime_id: str = ChatCompletionLUI.id,
+) -> List[EvalRun]:
+    """Run (model, language, prompt) configurations concurrently; runs keep the given order."""
+    all_runs = []
+    session_path = session_dir / SESSION_RUNS_FILENAME
+
+    # Each configuration is an independent, latency-bound chain of API calls; finished
+    # runs are appended to the one session file as they are consumed
+    with open(session_path, "a", encoding="utf-8") as session_file, \
+            ThreadPoolExecutor(max_workers=MAX_CONCURRENT_RUNS) as executor:
+        futures = [
+            executor.submit(evaluate_configuration, runtime_id, model_id, language, prompt_id)
+            for model_id, language, prompt_id in configurations
+        ]
+        for future in futures:
+            eval_run = future.result()
+            if eval_run is not None:
+                all_runs.append(eval_run)
+                append_eval_run(eval_run, session_file)
+                print_summary(eval_run)
+
+    print(f"Runs saved to: {session_path}")
+    return all_runs
 
 
 def run_matrix_evaluation(
     models: List[str],
     languages: List[str],
     prompt_ids: Optional[List[str]] = None,
+    runtime_id: str = ChatCompletionLUI.id,
 ):
     """Run evaluation across multiple models, languages, and prompts."""
     prompt_ids = prompt_ids or [None]  # Default prompt
 
     # Create session directory for this evaluation run
-    session_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    session_started_at = datetime.now()
+    session_ts = session_started_at.strftime("%Y%m%d_%H%M%S")
     session_dir = RESULTS_DIR / f"session_{session_ts}"
     session_dir.mkdir(parents=True, exist_ok=True)
     print(f"\nResults will be saved to: {session_dir}")
 
-    all_runs = []
-
-    for model_id in models:
-        for language in languages:
-            for prompt_id in prompt_ids:
-                print(f"\n>>> Evaluating: model={model_id}, lang={language}, prompt={prompt_id or 'default'}")
-                try:
-                    eval_run = run_evaluation(
-                        model_id=model_id,
-                        language=language,
-                        prompt_id=prompt_id,
-                        session_dir=session_dir,
-                    )
-                    all_runs.append(eval_run)
-                    print_summary(eval_run)
-                except Exception as e:
-                    print(f"  ERROR: {e}")
+    configurations = list(product(models, languages, prompt_ids))
+    all_runs = run_configurations(configurations, session_dir, runtime_id)
 
     # Print comparison table
     if len(all_runs) > 1:
         print_comparison_table(all_runs)
         print_side_by_side_comparison(all_runs)
-        save_comparison_summary(all_runs, session_dir)
+        save_comparison_summary(all_runs, session_dir, session_started_at)
 
     print(f"\nResults saved to: {session_dir}")
     return all_runs
 
 
+def format_table_row(cells) -> str:
+    """Left-align each cell to its comparison table column width."""
+    return " ".join(cell.ljust(width) for cell, width in zip(cells, COMPARISON_TABLE_WIDTHS))
+
+
 def print_comparison_table(runs: List[EvalRun]):
     """Print comparison table of all runs."""
     print("\n" + "=" * 70)
     print("COMPARISON TABLE")
     print("=" * 70)
-    print(f"{'Model':<25} {'Lang':<6} {'Prompt':<20} {'Cases':<8} {'Time':<8}")
+    print(format_table_row(COMPARISON_TABLE_HEADER))
     print("-" * 70)
     for r in runs:
         prompt = r.prompt_id or "(default)"
-        print(f"{r.model_id:<25} {r.language:<6} {prompt:<20} {r.total_cases:<8} {r.duration_seconds:>6.2f}s")
+        print(format_table_row((r.model_id, r.language, prompt, str(r.total_cases), f"{r.duration_seconds:6.2f}s")))
     print("=" * 70 + "\n")
 
 
 def print_side_by_side_comparison(runs: List[EvalRun]):
-    """Print side-by-side comparison of results for each input across all configurations."""
+    """
+    Print side-by-side comparison of results for each input across all configurations.
+    Skipped when stdout is not a terminal (the full results are on disk) unless
+    LUI_FORCE_PRINT=1 is set.
+    """
     if not runs:
         return
+    if not full_reports_enabled():
+        print("\nSide-by-side comparison skipped (stdout is not a terminal; set LUI_FORCE_PRINT=1 to print it)")
+        return
 
-    # Group runs by language to compare same inputs
-    from collections import defaultdict
-    runs_by_lang = defaultdict(list)
+    # Group runs by language to compare same inputs (seeded in first-seen language order)
+    runs_by_lang = {run.language: [] for run in runs}
     for run in runs:
         runs_by_lang[run.language].append(run)
 
-    print("\n" + "=" * 140)
-    print("SIDE-BY-SIDE COMPARISON (by input)")
-    print("=" * 140)
+    lines = [
+        "\n" + WIDE_RULE,
+        "SIDE-BY-SIDE COMPARISON (by input)",
+        WIDE_RULE,
+    ]
 
     for language, lang_runs in runs_by_lang.items():
         if len(lang_runs) < 2:
             continue
 
-        print(f"\n{'─' * 140}")
-        print(f"  Language: {language}")
-        print(f"{'─' * 140}")
+        lines.append(f"\n{WIDE_THIN_RULE}")
+        lines.append(f"  Language: {language}")
+        lines.append(WIDE_THIN_RULE)
+
+        # Labels are constant per run, so format them once per language
+        labels = [f"{run.model_id}|{run.prompt_id or 'default'}" for run in lang_runs]
+        config_labels = [f"{run.model_id[:20]}, {run.prompt_id or 'default'}" for run in lang_runs]
 
-        # Get all UIDs from first run (assuming same inputs across runs)
+        # Index every result by (uid, configuration) in one pass
         first_run = lang_runs[0]
-        results_by_uid = {r.uid: {} for r in first_run.results}
+        results_by_key = {}
 
-        for run in lang_runs:
-            label = f"{run.model_id}|{run.prompt_id or 'default'}"
+        for run, label in zip(lang_runs, labels):
             for r in run.results:
-                if r.uid in results_by_uid:
-                    results_by_uid[r.uid][label] = r
+                results_by_key[(r.uid, label)] = r
 
-        # Print each input with all its results
+        # Print each input with all its results (inputs taken from the first run)
         for result in first_run.results:
             uid = result.uid
-            print(f"\n  ┌─ {result.word} [{uid}]")
-            print(f"  │  \"{result.sentence[:100]}{'...' if len(result.sentence) > 100 else ''}\"")
-            print(f"  │")
+            lines.append(f"\n  ┌─ {result.word} [{uid}]")
+            lines.append(f"  │  \"{result.sentence[:100]}{'...' if len(result.sentence) > 100 else ''}\"")
+            lines.append("  │")
 
-            for run in lang_runs:
-                label = f"{run.model_id}|{run.prompt_id or 'default'}"
-                r = results_by_uid[uid].get(label)
+            for label, config_label in zip(labels, config_labels):
+                r = results_by_key.get((uid, label))
                 if r:
-                    model_short = run.model_id[:20]
-                    prompt_short = run.prompt_id or "default"
-                    config_label = f"{model_short}, {prompt_short}"
                     actual = r.actual
-                    print(f"  │  ({config_label:30}): lemma={actual.get('lemma', '')[:20]} | pos={actual.get('part_of_speech', '')} | form={actual.get('surface_lexical_unit', '')[:25]}")
+                    lines.append(f"  │  ({config_label:30}): lemma={actual.get('lemma', '')[:20]} | pos={actual.get('part_of_speech', '')} | form={actual.get('surface_lexical_unit', '')[:25]}")
 
-            print(f"  └{'─' * 120}")
+            lines.append(f"  └{INPUT_CLOSING_RULE}")
 
-    print("\n" + "=" * 140 + "\n")
+    lines.append("\n" + WIDE_RULE + "\n")
+    print("\n".join(lines))
 
 
-def save_comparison_summary(runs: List[EvalRun], session_dir: Path):
-    """Save comparison summary to session directory."""
+def save_comparison_summary(runs: List[EvalRun], session_dir: Path, session_started_at: Optional[datetime] = None):
+    """Save comparison summary to session directory, stamped with the session start time."""
     summary = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": (session_started_at or datetime.now()).isoformat(),
         "total_runs": len(runs),
         "runs": [
             {
@@ -327,21 +450,22 @@ def save_comparison_summary(runs: List[EvalRun], session_dir: Path):
     print(f"Summary saved to: {filepath}")
 
 
-def discover_languages() -> List[str]:
-    """Discover available languages from corpus file."""
+@lru_cache(maxsize=None)
+def discover_languages() -> Tuple[str, ...]:
+    """Discover available languages from corpus file (scanned once per session)."""
     corpus_path = FIXTURES_DIR / "lui_test_corpus.jsonl"
     if not corpus_path.exists():
-        return []
+        return ()
 
     languages = set()
     with open(corpus_path, "r", encoding="utf-8") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            # json.loads tolerates the trailing newline, so only blank lines need skipping
+            if line.isspace():
                 continue
             data = json.loads(line)
             languages.add(data["language"])
-    return sorted(languages)
+    return tuple(sorted(languages))
 
 
 def prompt_selection(items: List[str], item_type: str, allow_all: bool = True) -> List[str]:
@@ -361,17 +485,17 @@ def prompt_selection(items: List[str], item_type: str, allow_all: bool = True) -
             return []
         if choice == 'a' and allow_all:
             return items
-        try:
-            indices = [int(x.strip()) - 1 for x in choice.split(',')]
-            selected = [items[i] for i in indices if 0 <= i < len(items)]
-            if selected:
-                return selected
-            print("Invalid selection, try again.")
-        except (ValueError, IndexError):
+        if not SELECTION_RE.fullmatch(choice):
             print("Invalid input, try again.")
+            continue
+        indices = [int(x) - 1 for x in choice.split(',')]
+        selected = [items[i] for i in indices if 0 <= i < len(items)]
+        if selected:
+            return selected
+        print("Invalid selection, try again.")
 
 
-def interactive_evaluation():
+def interactive_evaluation(runtime_id: str = ChatCompletionLUI.id):
     """Run evaluation with interactive configuration selection."""
     print("\n" + "=" * 60)
     print("LUI EVALUATION HARNESS - Interactive Mode")
@@ -383,7 +507,7 @@ def interactive_evaluation():
         print("No corpus files found in fixtures/")
         return
 
-    languages = prompt_selection(available_langs, "languages")
+    languages = prompt_selection(list(available_langs), "languages")
     if not languages:
         print("Cancelled.")
         return
@@ -414,6 +538,7 @@ def interactive_evaluation():
     print(f"Languages: {', '.join(languages)}")
     print(f"Models: {', '.join(selected_models)}")
     print(f"Prompts: {', '.join(selected_prompt_names)}")
+    print(f"Runtime: {runtime_id}")
 
     confirm = input("\nProceed with evaluation? (y/n): ").strip().lower()
     if confirm != 'y':
@@ -421,34 +546,20 @@ def interactive_evaluation():
         return
 
     # Create session directory for this evaluation run
-    session_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    session_started_at = datetime.now()
+    session_ts = session_started_at.strftime("%Y%m%d_%H%M%S")
     session_dir = RESULTS_DIR / f"session_{session_ts}"
     session_dir.mkdir(parents=True, exist_ok=True)
     print(f"\nResults will be saved to: {session_dir}")
 
     # Run evaluations
-    all_runs = []
-    for model_id in selected_models:
-        for language in languages:
-            for prompt_id in selected_prompts:
-                prompt_name = prompt_id or "default"
-                print(f"\n>>> Evaluating: model={model_id}, lang={language}, prompt={prompt_name}")
-                try:
-                    eval_run = run_evaluation(
-                        model_id=model_id,
-                        language=language,
-                        prompt_id=prompt_id,
-                        session_dir=session_dir,
-                    )
-                    all_runs.append(eval_run)
-                    print_summary(eval_run)
-                except Exception as e:
-                    print(f"  ERROR: {e}")
+    configurations = list(product(selected_models, languages, selected_prompts))
+    all_runs = run_configurations(configurations, session_dir, runtime_id)
 
     if len(all_runs) > 1:
         print_comparison_table(all_runs)
         print_side_by_side_comparison(all_runs)
-        save_comparison_summary(all_runs, session_dir)
+        save_comparison_summary(all_runs, session_dir, session_started_at)
 
     print(f"\nCompleted {len(all_runs)} evaluation run(s).")
     print(f"Results saved to: {session_dir}")
@@ -467,7 +578,7 @@ def test_single_evaluation():
     print_summary(eval_run)
 
 
-def test_matrix_evaluation():
+def test_matrix_evaluation(runtime_id: str = ChatCompletionLUI.id):
     """Run matrix evaluation across multiple configurations."""
     # Discover available LUI prompts
     lui_prompts = list_prompts("lui")
@@ -482,12 +593,15 @@ def test_matrix_evaluation():
         models=model_ids,
         languages=["pl"],
         prompt_ids=[None] + [p for p in lui_prompts if "pl" in p],  # Default + Polish-specific
+        runtime_id=runtime_id,
     )
 
 
 if __name__ == "__main__":
-    import sys
+    bootstrap_all()
+    # --batch submits each run as one Batch API job: cheaper, but results can take hours
+    runtime_id = ChatCompletionLUIBatch.id if "--batch" in sys.argv[1:] else ChatCompletionLUI.id
     if len(sys.argv) > 1 and sys.argv[1] == "matrix":
-        test_matrix_evaluation()
+        test_matrix_evaluation(runtime_id)
     else:
-        interactive_evaluation()
+        interactive_evaluation(runtime_id)
@@ -6,82 +6,106 @@ Since the Polish hybrid runtime hasn't been implemented yet, this test uses the
 ChatCompletionLUI runtime but includes test cases from the original Polish hybrid tests.
 """
 
-from kindle_to_anki.core.bootstrap import bootstrap_all
+import re
+
+import pytest
+
 from kindle_to_anki.anki.anki_note import AnkiNote
 from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
-from kindle_to_anki.tasks.lui.runtime_chat_completion import ChatCompletionLUI
 from kindle_to_anki.tasks.lui.provider import LUIProvider
 from kindle_to_anki.tasks.lui.schema import LUIInput, LUIOutput
 
-bootstrap_all()
 
+# Test cases from the original Polish hybrid tests
+TEST_CASES = [
+    {
+        'word': 'uczy',
+        'sentence': 'Dziecko szybko uczy się nowych słów.',
+        'expected_lemma': 'uczyć się',
+        'expected_surface_lexical_unit': 'uczy się',
+        'expected_pos': 'verb',
+        'expected_aspect': 'impf'
+    },
+    {
+        'word': 'uczy',
+        'sentence': 'Nauczyciel uczy dzieci matematyki.',
+        'expected_lemma': 'uczyć',
+        'expected_surface_lexical_unit': 'uczy',
+        'expected_pos': 'verb',
+        'expected_aspect': 'impf'
+    },
+    {
+        'word': 'zatrzymał',
+        'sentence': 'Samochód nagle zatrzymał się na środku drogi.',
+        'expected_lemma': 'zatrzymać się',
+        'expected_surface_lexical_unit': 'zatrzymał się',
+        'expected_pos': 'verb',
+        'expected_aspect': 'perf'
+    },
+    {
+        'word': 'Otworzył',
+        'sentence': 'Otworzył drzwi bez pukania.',
+        'expected_lemma': 'otworzyć',
+        'expected_surface_lexical_unit': 'Otworzył',
+        'expected_pos': 'verb',
+        'expected_aspect': 'perf'
+    },
+    {
+        'word': 'zawzięcie',
+        'sentence': 'Który walił zawzięcie różdżką w blat ławki.',
+        'expected_lemma': 'zawzięcie',
+        'expected_surface_lexical_unit': 'zawzięcie',
+        'expected_pos': 'adverb',
+        'expected_aspect': ''
+    }
+]
+
+# AnkiNote attributes checked by test_polish_hybrid_cases
+CHECKED_FIELDS = ('expression', 'surface_lexical_unit', 'part_of_speech', 'aspect', 'unit_type')
+
+# Polish reflexive particle as a whole word (so a lemma merely containing the letters does not count)
+REFLEXIVE_RE = re.compile(r"\bsię\b")
+
+# Expected values per case, aligned with CHECKED_FIELDS and built once at import.
+# The expected unit_type is "reflexive" whenever się appears in the expected lemma.
+EXPECTED_VALUES = [
+    (
+        tc['expected_lemma'],
+        tc['expected_surface_lexical_unit'],
+        tc['expected_pos'],
+        tc['expected_aspect'],
+        "reflexive" if REFLEXIVE_RE.search(tc['expected_lemma']) else "lemma",
+    )
+    for tc in TEST_CASES
+]
 
-def test_polish_hybrid_cases():
-    """Test Polish-specific cases using the new LUI provider pattern."""
 
-    # Test cases from the original Polish hybrid tests
-    test_cases = [
-        {
-            'word': 'uczy',
-            'sentence': 'Dziecko szybko uczy się nowych słów.',
-            'expected_lemma': 'uczyć się',
-            'expected_surface_lexical_unit': 'uczy się',
-            'expected_pos': 'verb',
-            'expected_aspect': 'impf'
-        },
-        {
-            'word': 'uczy',
-            'sentence': 'Nauczyciel uczy dzieci matematyki.',
-            'expected_lemma': 'uczyć',
-            'expected_surface_lexical_unit': 'uczy',
-            'expected_pos': 'verb',
-            'expected_aspect': 'impf'
-        },
-        {
-            'word': 'zatrzymał',
-            'sentence': 'Samochód nagle zatrzymał się na środku drogi.',
-            'expected_lemma': 'zatrzymać się',
-            'expected_surface_lexical_unit': 'zatrzymał się',
-            'expected_pos': 'verb',
-            'expected_aspect': 'perf'
-        },
-        {
-            'word': 'Otworzył',
-            'sentence': 'Otworzył drzwi bez pukania.',
-            'expected_lemma': 'otworzyć',
-            'expected_surface_lexical_unit': 'Otworzył',
-            'expected_pos': 'verb',
-            'expected_aspect': 'perf'
-        },
-        {
-            'word': 'zawzięcie',
-            'sentence': 'Który walił zawzięcie różdżką w blat ławki.',
-            'expected_lemma': 'zawzięcie',
-            'expected_surface_lexical_unit': 'zawzięcie',
-            'expected_pos': 'adverb',
-            'expected_aspect': ''
-        }
-    ]
+# Cases also sent straight to the runtime, bypassing the provider (reflexive verbs and an adverb)
+DIRECT_RUNTIME_CASES = (0, 2, 4)
+
+
+@pytest.fixture(scope="module")
+def identified_notes(lui_runtime):
+    """Run LUI once over every test case so each parametrized case only inspects its note."""
 
     # Create AnkiNote objects from test cases
-    notes = []
-    for i, test_case in enumerate(test_cases):
-        note = AnkiNote(
+    notes = [
+        AnkiNote(
             word=test_case['word'],
             usage=test_case['sentence'],
             language="pl",
-            uid=f"test_pl_hybrid_{i + 1}",
+            uid=f"test_pl_hybrid_{i}",
             book_name="Test Book",
-            position=f"loc_{i + 1}"
+            position=f"loc_{i}"
         )
-        notes.append(note)
+        for i, test_case in enumerate(TEST_CASES, 1)
+    ]
 
-    # Setup runtime and config
-    runtime = ChatCompletionLUI()
+    # Setup config
     runtime_config = RuntimeConfig(model_id="gpt-5.1", batch_size=30, source_language_code="pl", target_language_code="en")
 
     # Setup the provider
-    runtimes = {"chat_completion_lui": runtime}
+    runtimes = {"chat_completion_lui": lui_runtime}
     provider = LUIProvider(runtimes=runtimes)
 
     print("\n=== Testing Polish LUI Cases with Provider ===")
@@ -95,85 +119,95 @@ def test_polish_hybrid_cases():
         use_test_cache=True
     )
 
-    # Validate results
-    for i, test_case in enumerate(test_cases):
-        note = notes[i]
-
-        # Determine expected unit_type based on whether się appears in the expected lemma
-        expected_unit_type = "reflexive" if "się" in test_case['expected_lemma'] else "lemma"
+    return notes
 
-        print(f"\n--- Test Case {i + 1}: {test_case['word']} ---")
-        print(f"Sentence: {test_case['sentence']}")
-        print(f"Expected: lemma='{test_case['expected_lemma']}', pos='{test_case['expected_pos']}', aspect='{test_case['expected_aspect']}'")
-        print(f"Actual:   lemma='{note.expression}', pos='{note.part_of_speech}', aspect='{note.aspect}'")
-        print(f"Expected unit_type: '{expected_unit_type}', Actual: '{note.unit_type}'")
 
-        # Check results (for now just log, since LLM results may vary)
-        if test_case['expected_lemma'] == note.expression:
-            print("✓ LEMMA MATCH")
-        else:
-            print("✗ LEMMA MISMATCH") 
-
-        if test_case['expected_pos'] == note.part_of_speech:
-            print("✓ POS MATCH")
-        else:
-            print("✗ POS MISMATCH")
+@pytest.mark.parametrize("case_index", range(len(TEST_CASES)), ids=[tc['word'] for tc in TEST_CASES])
+def test_polish_hybrid_cases(case_index, identified_notes):
+    """Test Polish-specific cases using the new LUI provider pattern."""
+    test_case = TEST_CASES[case_index]
+    note = identified_notes[case_index]
+
+    # Compare the precomputed expected row against the note's values field by field
+    expected_values = EXPECTED_VALUES[case_index]
+    actual_values = tuple(getattr(note, field) for field in CHECKED_FIELDS)
+    mismatched = [
+        field
+        for field, expected_value, actual_value in zip(CHECKED_FIELDS, expected_values, actual_values)
+        if actual_value != expected_value
+    ]
+    expected = dict(zip(CHECKED_FIELDS, expected_values))
+    actual = dict(zip(CHECKED_FIELDS, actual_values))
+
+    # Collect the report so it is written in one go
+    lines = [
+        f"\n--- Test Case {case_index + 1}: {test_case['word']} ---",
+        f"Sentence: {test_case['sentence']}",
+        f"Expected: {expected}",
+        f"Actual:   {actual}",
+    ]
 
-        if test_case['expected_aspect'] == note.aspect:
-            print("✓ ASPECT MATCH") 
-        else:
-            print("✗ ASPECT MISMATCH")
+    # Check results (for now just log, since LLM results may vary)
+    if mismatched:
+        lines.extend(f"✗ {field.upper()} MISMATCH" for field in mismatched)
+    else:
+        lines.append("✓ ALL FIELDS MATCH")
 
-        if expected_unit_type == note.unit_type:
-            print("✓ UNIT_TYPE MATCH")
-        else:
-            print("✗ UNIT_TYPE MISMATCH")
+    print("\n".join(lines))
 
 
-def test_direct_runtime_polish():
+def test_direct_runtime_polish(lui_runtime):
     """Test the ChatCompletionLUI runtime directly with Polish examples."""
 
-    runtime = ChatCompletionLUI()
     runtime_config = RuntimeConfig(model_id="gpt-5.1", batch_size=30, source_language_code="pl", target_language_code="en")
 
-    # Create LUIInput objects for Polish testing
+    # Create LUIInput objects for Polish testing from the shared test cases
     polish_inputs = [
         LUIInput(
-            uid="pl_test_1",
-            word="uczy", 
-            sentence="Dziecko szybko uczy się nowych słów."
-        ),
-        LUIInput(
-            uid="pl_test_2",
-            word="zatrzymał",
-            sentence="Samochód nagle zatrzymał się na środku drogi."
-        ),
-        LUIInput(
-            uid="pl_test_3",
-            word="zawzięcie",
-            sentence="Który walił zawzięcie różdżką w blat ławki."
+            uid=f"pl_test_{n}",
+            word=TEST_CASES[case_index]['word'],
+            sentence=TEST_CASES[case_index]['sentence']
         )
+        for n, case_index in enumerate(DIRECT_RUNTIME_CASES, 1)
     ]
 
     print("\n=== Testing Direct Runtime Usage with Polish ===")
 
-    outputs = runtime.identify(
+    outputs = lui_runtime.identify(
         polish_inputs,
         runtime_config=runtime_config,
         ignore_cache=False,
         use_test_cache=True
     )
 
+    # Collect the report so it is written in one go
+    lines = []
     for lui_input, lui_output in zip(polish_inputs, outputs):
-        print(f"\nInput - Word: {lui_input.word}")
-        print(f"        Sentence: {lui_input.sentence}")
-        print(f"Output - Lemma: {lui_output.lemma}")
-        print(f"         POS: {lui_output.part_of_speech}")
-        print(f"         Aspect: {lui_output.aspect}")
-        print(f"         Surface Lexical Unit: {lui_output.surface_lexical_unit}")
-        print(f"         Unit Type: {lui_output.unit_type}")
+        lines.extend([
+            f"\nInput - Word: {lui_input.word}",
+            f"        Sentence: {lui_input.sentence}",
+            f"Output - Lemma: {lui_output.lemma}",
+            f"         POS: {lui_output.part_of_speech}",
+            f"         Aspect: {lui_output.aspect}",
+            f"         Surface Lexical Unit: {lui_output.surface_lexical_unit}",
+            f"         Unit Type: {lui_output.unit_type}",
+        ])
+
+    # Per-field match counts against the shared expectations, in CHECKED_FIELDS order
+    actual_rows = [
+        (o.lemma, o.surface_lexical_unit, o.part_of_speech, o.aspect, o.unit_type)
+        for o in outputs
+    ]
+    expected_rows = [EXPECTED_VALUES[case_index] for case_index in DIRECT_RUNTIME_CASES]
+    match_counts = [
+        sum(actual_row[i] == expected_row[i] for actual_row, expected_row in zip(actual_rows, expected_rows))
+        for i in range(len(CHECKED_FIELDS))
+    ]
+    summary = ", ".join(f"{field} {count}/{len(outputs)}" for field, count in zip(CHECKED_FIELDS, match_counts))
+    lines.append(f"\nMatches: {summary}")
+
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
-    test_polish_hybrid_cases()
-    test_direct_runtime_polish()
+    raise SystemExit(pytest.main([__file__, "-s"]))
@@ -4,18 +4,18 @@ Test for the new ChatCompletionLUI runtime system.
 This replaces the old test_lui_llm.py with the new structured approach.
 """
 
+from collections import defaultdict
 from datetime import datetime
-from kindle_to_anki.core.bootstrap import bootstrap_all
+
+import pytest
+
 from kindle_to_anki.anki.anki_note import AnkiNote
 from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
-from kindle_to_anki.tasks.lui.runtime_chat_completion import ChatCompletionLUI
 from kindle_to_anki.tasks.lui.provider import LUIProvider
 from kindle_to_anki.tasks.lui.schema import LUIInput, LUIOutput
 
-bootstrap_all()
 
-
-def test_runtime_chat_completion():
+def test_runtime_chat_completion(lui_runtime):
     """Test the new ChatCompletionLUI runtime."""
 
     # Example usage and testing
@@ -52,49 +52,49 @@ def test_runtime_chat_completion():
         )
     ]
 
-    # Setup runtime and config
-    runtime = ChatCompletionLUI()
-
     # Setup the provider
-    runtimes = {"chat_completion_lui": runtime}
+    runtimes = {"chat_completion_lui": lui_runtime}
     provider = LUIProvider(runtimes=runtimes)
 
+    # Group notes by language in a single pass
+    notes_by_language = defaultdict(list)
+    for note in test_notes:
+        notes_by_language[note.source_language].append(note)
+
     # Test with different languages
-    for lang_code in ["pl", "es", "de"]:
-        lang_notes = [note for note in test_notes if note.source_language == lang_code]
-
-        if lang_notes:
-            print(f"\n=== Testing {lang_code} using Provider ===")
-
-            # Update runtime config for this language
-            runtime_config = RuntimeConfig(model_id="gpt-5.1", batch_size=30, source_language_code=lang_code, target_language_code="en")
-
-            # Test via provider
-            provider.identify(
-                notes=lang_notes,
-                runtime_choice="chat_completion_lui",
-                runtime_config=runtime_config,
-                ignore_cache=False,
-                use_test_cache=True
-            )
-
-            for note in lang_notes:
-                print(f"Word: {note.source_word}")
-                print(f"Sentence: {note.source_usage}")
-                print(f"Lemma: {note.expression}")
-                print(f"POS: {note.part_of_speech}")
-                print(f"Aspect: {note.aspect}")
-                print(f"Surface Lexical Unit: {note.surface_lexical_unit}")
-                print(f"Unit Type: {note.unit_type}")
-                print()
-
-
-def test_runtime_direct():
-    """Test the ChatCompletionLUI runtime directly."""
+    for lang_code, lang_notes in notes_by_language.items():
+        print(f"\n=== Testing {lang_code} using Provider ===")
+
+        # Update runtime config for this language
+        runtime_config = RuntimeConfig(model_id="gpt-5.1", batch_size=30, source_language_code=lang_code, target_language_code="en")
+
+        # Test via provider
+        provider.identify(
+            notes=lang_notes,
+            runtime_choice="chat_completion_lui",
+            runtime_config=runtime_config,
+            ignore_cache=False,
+            use_test_cache=True
+        )
 
-    # Test direct runtime usage
-    runtime = ChatCompletionLUI()
-    runtime_config = RuntimeConfig(model_id="gpt-5.1", batch_size=30)
+        # Collect the report so it is written in one go
+        lines = []
+        for note in lang_notes:
+            lines.extend([
+                f"Word: {note.source_word}",
+                f"Sentence: {note.source_usage}",
+                f"Lemma: {note.expression}",
+                f"POS: {note.part_of_speech}",
+                f"Aspect: {note.aspect}",
+                f"Surface Lexical Unit: {note.surface_lexical_unit}",
+                f"Unit Type: {note.unit_type}",
+                "",
+            ])
+        print("\n".join(lines))
+
+
+def test_runtime_direct(lui_runtime):
+    """Test the ChatCompletionLUI runtime directly."""
 
     # Create LUIInput objects for testing
     lui_inputs = [
@@ -115,36 +115,43 @@ def test_runtime_direct():
     # Test Polish
     pl_inputs = [lui_inputs[0]]
     pl_config = RuntimeConfig(model_id="gpt-5.1", batch_size=30, source_language_code="pl", target_language_code="en")
-    pl_outputs = runtime.identify(
+    pl_outputs = lui_runtime.identify(
         pl_inputs,
         runtime_config=pl_config,
         ignore_cache=False,
         use_test_cache=True
     )
 
+    lines = []
     for lui_input, lui_output in zip(pl_inputs, pl_outputs):
-        print(f"Input - UID: {lui_input.uid}, Word: {lui_input.word}")
-        print(f"Output - Lemma: {lui_output.lemma}, POS: {lui_output.part_of_speech}")
-        print(f"         Aspect: {lui_output.aspect}, Unit Type: {lui_output.unit_type}")
-        print()
+        lines.extend([
+            f"Input - UID: {lui_input.uid}, Word: {lui_input.word}",
+            f"Output - Lemma: {lui_output.lemma}, POS: {lui_output.part_of_speech}",
+            f"         Aspect: {lui_output.aspect}, Unit Type: {lui_output.unit_type}",
+            "",
+        ])
+    print("\n".join(lines))
 
     # Test Spanish
     es_inputs = [lui_inputs[1]]
     es_config = RuntimeConfig(model_id="gpt-5.1", batch_size=30, source_language_code="es", target_language_code="en")
-    es_outputs = runtime.identify(
+    es_outputs = lui_runtime.identify(
         es_inputs,
         runtime_config=es_config,
         ignore_cache=False,
         use_test_cache=True
     )
 
+    lines = []
     for lui_input, lui_output in zip(es_inputs, es_outputs):
-        print(f"Input - UID: {lui_input.uid}, Word: {lui_input.word}")
-        print(f"Output - Lemma: {lui_output.lemma}, POS: {lui_output.part_of_speech}")
-        print(f"         Aspect: {lui_output.aspect}, Unit Type: {lui_output.unit_type}")
-        print()
+        lines.extend([
+            f"Input - UID: {lui_input.uid}, Word: {lui_input.word}",
+            f"Output - Lemma: {lui_output.lemma}, POS: {lui_output.part_of_speech}",
+            f"         Aspect: {lui_output.aspect}, Unit Type: {lui_output.unit_type}",
+            "",
+        ])
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
-    test_runtime_chat_completion()
-    test_runtime_direct()
+    raise SystemExit(pytest.main([__file__, "-s"]))
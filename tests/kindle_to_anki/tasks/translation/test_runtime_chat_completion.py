@@ -4,18 +4,18 @@ Test for the new ChatCompletionTranslation runtime system.
 This replaces the old test_translator_llm.py with the new structured approach.
 """
 
+import json
 from datetime import datetime
-from kindle_to_anki.core.bootstrap import bootstrap_all
+
+import pytest
+
 from kindle_to_anki.anki.anki_note import AnkiNote
 from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
-from kindle_to_anki.tasks.translation.runtime_chat_completion import ChatCompletionTranslation
 from kindle_to_anki.tasks.translation.provider import TranslationProvider
 from kindle_to_anki.tasks.translation.schema import TranslationInput, TranslationOutput
 
-bootstrap_all()
-
 
-def test_runtime_chat_completion():
+def test_runtime_chat_completion(translation_runtime):
     """Test the new ChatCompletionTranslation runtime."""
 
     # Example usage and testing
@@ -42,12 +42,11 @@ def test_runtime_chat_completion():
         )
     ]
 
-    # Setup runtime and config
-    runtime = ChatCompletionTranslation()
+    # Setup config
     runtime_config = RuntimeConfig(model_id="gpt-5.1", batch_size=30, source_language_code="pl", target_language_code="en")
 
     # Setup the provider
-    runtimes = {"chat_completion_translation": runtime}
+    runtimes = {"chat_completion_translation": translation_runtime}
     provider = TranslationProvider(runtimes=runtimes)
 
     # Test translation via provider
@@ -67,7 +66,7 @@ def test_runtime_chat_completion():
         print()
 
 
-def test_direct_runtime_usage():
+def test_direct_runtime_usage(translation_runtime):
     """Test using the runtime directly with TranslationInput/Output schemas."""
 
     # Create translation inputs
@@ -82,13 +81,12 @@ def test_direct_runtime_usage():
         )
     ]
 
-    # Setup runtime and config
-    runtime = ChatCompletionTranslation()
+    # Setup config
     runtime_config = RuntimeConfig(model_id="gpt-5.1", batch_size=30, source_language_code="pl", target_language_code="en")
 
     # Test direct translation
     print("Testing direct runtime usage...")
-    translation_outputs = runtime.translate(
+    translation_outputs = translation_runtime.translate(
         translation_inputs=translation_inputs,
         runtime_config=runtime_config,
         ignore_cache=False,
@@ -103,5 +101,18 @@ def test_direct_runtime_usage():
         print()
 
 
-test_runtime_chat_completion()
-test_direct_runtime_usage()
+def test_items_json_round_trips(translation_runtime):
+    """Packed items JSON parses back to the same uid/sentence items, quotes and newlines included."""
+    translation_inputs = [
+        TranslationInput(uid="test-uid-1", context='Powiedział: "Nie wiem".'),
+        TranslationInput(uid="test-uid-2", context="Pierwsza linia.\nDruga linia."),
+    ]
+
+    items_json = translation_runtime._build_items_json(translation_inputs)
+
+    assert json.loads(items_json) == [{"uid": i.uid, "sentence": i.context} for i in translation_inputs]
+    assert items_json.count("\n") == len(translation_inputs) + 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
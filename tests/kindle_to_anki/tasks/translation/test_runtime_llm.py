@@ -3,16 +3,14 @@
 Integration test for LLM-based translation runtime.
 """
 
-from kindle_to_anki.core.bootstrap import bootstrap_all
-from kindle_to_anki.tasks.translation.runtime_chat_completion import ChatCompletionTranslation
+import pytest
+
 from kindle_to_anki.tasks.translation.schema import TranslationInput
 from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
 from kindle_to_anki.anki.anki_note import AnkiNote
 
-bootstrap_all()
-
 
-def test_translation_runtime_llm():
+def test_translation_runtime_llm(translation_runtime):
     """Test LLM-based translation runtime."""
 
     # Create test translation inputs
@@ -29,13 +27,11 @@ def test_translation_runtime_llm():
 
     print(f"Testing translation runtime with {len(translation_inputs)} inputs...")
 
-    # Create runtime and config
-    runtime = ChatCompletionTranslation()
     runtime_config = RuntimeConfig(model_id="gpt-5-mini", batch_size=2, source_language_code="pl", target_language_code="en")
 
     # Test translation
     try:
-        outputs = runtime.translate(
+        outputs = translation_runtime.translate(
             translation_inputs,
             runtime_config=runtime_config,
             use_test_cache=True,
@@ -60,4 +56,4 @@ def test_translation_runtime_llm():
 
 
 if __name__ == "__main__":
-    test_translation_runtime_llm()
+    raise SystemExit(pytest.main([__file__, "-s"]))
@@ -5,27 +5,53 @@ Results are saved to eval_results/ and summarized to console.
 """
 
 import json
+import re
 import time
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+import pytest
 
 from kindle_to_anki.core.bootstrap import bootstrap_all
 from kindle_to_anki.core.runtimes.runtime_config import RuntimeConfig
 from kindle_to_anki.core.prompts import list_prompts
 from kindle_to_anki.tasks.wsd.runtime_chat_completion import ChatCompletionWSD
+from kindle_to_anki.tasks.wsd.runtime_chat_completion_batch import ChatCompletionWSDBatch
 from kindle_to_anki.tasks.wsd.schema import WSDInput
 
-bootstrap_all()
-
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 RESULTS_DIR = Path(__file__).parent / "eval_results"
+# Matrix sessions append every run, one JSON line each, to this file in the session directory
+SESSION_RUNS_FILENAME = "_runs.jsonl"
+
+# Runtimes selectable by runtime_id; the batch runtime trades latency for cheaper calls.
+# Runtimes are stateless, so a single instance of each is shared by every evaluation.
+RUNTIMES = {
+    ChatCompletionWSD.id: ChatCompletionWSD(),
+    ChatCompletionWSDBatch.id: ChatCompletionWSDBatch(),
+}
 
 MODELS = ["gpt-5.1", "gpt-5-mini", "gemini-2.5-flash"]
 
+# Upper bound on evaluation runs in flight at once, to stay within provider rate limits
+MAX_CONCURRENT_RUNS = 8
+
+# A prompt_selection answer: comma-separated item numbers
+SELECTION_PATTERN = re.compile(r"^\s*\d+\s*(?:,\s*\d+\s*)*$")
+
+# Success bars indexed by int(success_rate * SUCCESS_BAR_WIDTH)
+SUCCESS_BAR_WIDTH = 20
+SUCCESS_BARS = tuple("█" * filled + "░" * (SUCCESS_BAR_WIDTH - filled) for filled in range(SUCCESS_BAR_WIDTH + 1))
+
+# One comparison table row: model, source, target, prompt, success rate, cases, duration
+COMPARISON_ROW_FORMAT = "{:<25} {:<5} {:<5} {:<15} {:>8.1%}    {:<8} {:>6.2f}s"
 
-@dataclass
+
+@dataclass(slots=True)
 class TestCase:
     uid: str
     word: str
@@ -36,7 +62,7 @@ class TestCase:
     target_lang: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalResult:
     uid: str
     word: str
@@ -48,7 +74,7 @@ class EvalResult:
     has_output: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalRun:
     timestamp: str
     runtime_id: str
@@ -64,30 +90,41 @@ class EvalRun:
     results: List[EvalResult]
 
 
-def discover_languages() -> List[str]:
-    """Discover available languages from corpus files."""
-    languages = []
-    for corpus_file in FIXTURES_DIR.glob("wsd_corpus_*.jsonl"):
-        lang = corpus_file.stem.replace("wsd_corpus_", "")
-        languages.append(lang)
-    return sorted(languages)
+@lru_cache(maxsize=None)
+def discover_languages() -> Tuple[str, ...]:
+    """Discover available languages from corpus files (scanned once per session)."""
+    return tuple(sorted(corpus_file.stem.replace("wsd_corpus_", "") for corpus_file in FIXTURES_DIR.glob("wsd_corpus_*.jsonl")))
 
 
-def load_test_corpus(source_lang: str) -> List[TestCase]:
-    """Load test cases from JSONL corpus file for a source language."""
+@lru_cache(maxsize=None)
+def load_test_corpus(source_lang: str) -> Tuple[TestCase, ...]:
+    """
+    Load test cases from JSONL corpus file for a source language.
+    Parsed once per language: every model/prompt run reads the same corpus.
+    """
     corpus_path = FIXTURES_DIR / f"wsd_corpus_{source_lang}.jsonl"
     if not corpus_path.exists():
-        return []
+        return ()
+
+    # Read the corpus in one call and split once; json.loads decodes UTF-8 bytes itself
+    return tuple(TestCase(**json.loads(line)) for line in corpus_path.read_bytes().splitlines() if line.strip())
+
 
-    cases = []
-    with open(corpus_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            data = json.loads(line)
-            cases.append(TestCase(**data))
-    return cases
+@lru_cache(maxsize=None)
+def corpus_target_langs(source_lang: str) -> Tuple[str, ...]:
+    """Sorted target languages present in the corpus for a source language."""
+    return tuple(sorted({tc.target_lang for tc in load_test_corpus(source_lang)}))
+
+
+@lru_cache(maxsize=None)
+def load_wsd_inputs(source_lang: str, target_lang: str) -> Tuple[Tuple[TestCase, ...], Tuple[WSDInput, ...]]:
+    """Test cases for a language pair and their WSD inputs, built once and reused by every model/prompt run."""
+    test_cases = tuple(tc for tc in load_test_corpus(source_lang) if tc.target_lang == target_lang)
+    wsd_inputs = tuple(
+        WSDInput(uid=tc.uid, word=tc.word, lemma=tc.lemma, pos=tc.pos, sentence=tc.sentence)
+        for tc in test_cases
+    )
+    return test_cases, wsd_inputs
 
 
 def run_evaluation(
@@ -97,18 +134,16 @@ def run_evaluation(
     prompt_id: Optional[str] = None,
     save_results: bool = True,
     session_dir: Optional[Path] = None,
+    runtime_id: str = ChatCompletionWSD.id,
 ) -> EvalRun:
     """Run WSD evaluation for a specific configuration."""
 
     # Load test cases for source language, filter by target language
-    all_cases = load_test_corpus(source_lang)
-    test_cases = [tc for tc in all_cases if tc.target_lang == target_lang]
+    test_cases, wsd_inputs = load_wsd_inputs(source_lang, target_lang)
 
     if not test_cases:
         raise ValueError(f"No test cases found for {source_lang} -> {target_lang}")
 
-    # Setup runtime
-    runtime = ChatCompletionWSD()
     runtime_config = RuntimeConfig(
         model_id=model_id,
         batch_size=30,
@@ -117,27 +152,15 @@ def run_evaluation(
         prompt_id=prompt_id,
     )
 
-    # Create inputs
-    wsd_inputs = [
-        WSDInput(
-            uid=tc.uid,
-            word=tc.word,
-            lemma=tc.lemma,
-            pos=tc.pos,
-            sentence=tc.sentence
-        )
-        for tc in test_cases
-    ]
-
     # Run disambiguation
-    start_time = time.time()
-    wsd_outputs = runtime.disambiguate(
-        wsd_inputs,
+    start_time = time.perf_counter()
+    wsd_outputs = RUNTIMES[runtime_id].disambiguate(
+        list(wsd_inputs),
         runtime_config=runtime_config,
         ignore_cache=False,
         use_test_cache=True,
     )
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start_time
 
     # Evaluate results
     eval_results = []
@@ -162,7 +185,7 @@ def run_evaluation(
     total = len(test_cases)
     eval_run = EvalRun(
         timestamp=datetime.now().isoformat(),
-        runtime_id="chat_completion_wsd",
+        runtime_id=runtime_id,
         model_id=model_id,
         prompt_id=prompt_id,
         source_lang=source_lang,
@@ -181,6 +204,13 @@ def run_evaluation(
     return eval_run
 
 
+def encode_dataclass(obj):
+    """json default hook: serialize dataclass instances as a shallow dict of their fields."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def save_eval_run(eval_run: EvalRun, session_dir: Optional[Path] = None):
     """Save evaluation run to JSON file."""
     output_dir = session_dir if session_dir else RESULTS_DIR
@@ -191,49 +221,131 @@ def save_eval_run(eval_run: EvalRun, session_dir: Optional[Path] = None):
 
     filepath = output_dir / filename
 
-    data = asdict(eval_run)
-
+    # Encode dataclasses field by field as they are reached, without an asdict() deep copy.
+    # Per-run files are written compact; only the session summary is indented for reading.
     with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        json.dump(eval_run, f, ensure_ascii=False, default=encode_dataclass)
 
     print(f"Results saved to: {filepath}")
 
 
+def append_eval_run(eval_run: EvalRun, session_file):
+    """Append evaluation run as one compact JSON line to the open session file."""
+    json.dump(eval_run, session_file, ensure_ascii=False, default=encode_dataclass)
+    session_file.write("\n")
+
+
 def print_summary(eval_run: EvalRun, compact: bool = False):
     """Print evaluation summary to console."""
     config_label = f"{eval_run.model_id} | {eval_run.prompt_id or 'default'}"
 
-    print("\n" + "=" * 80)
-    print(f"WSD EVALUATION SUMMARY  [{config_label}]")
-    print("=" * 80)
-    print(f"Runtime:     {eval_run.runtime_id}")
-    print(f"Model:       {eval_run.model_id}")
-    print(f"Prompt:      {eval_run.prompt_id or '(default)'}")
-    print(f"Languages:   {eval_run.source_lang} -> {eval_run.target_lang}")
-    print(f"Duration:    {eval_run.duration_seconds:.2f}s")
-    print("-" * 80)
-    bar = "█" * int(eval_run.success_rate * 20) + "░" * (20 - int(eval_run.success_rate * 20))
-    print(f"SUCCESS:     {eval_run.successful}/{eval_run.total_cases} ({eval_run.success_rate:.1%}) {bar}")
-    print("-" * 80)
+    lines = [
+        "\n" + "=" * 80,
+        f"WSD EVALUATION SUMMARY  [{config_label}]",
+        "=" * 80,
+        f"Runtime:     {eval_run.runtime_id}",
+        f"Model:       {eval_run.model_id}",
+        f"Prompt:      {eval_run.prompt_id or '(default)'}",
+        f"Languages:   {eval_run.source_lang} -> {eval_run.target_lang}",
+        f"Duration:    {eval_run.duration_seconds:.2f}s",
+        "-" * 80,
+    ]
+    bar = SUCCESS_BARS[int(eval_run.success_rate * SUCCESS_BAR_WIDTH)]
+    lines.append(f"SUCCESS:     {eval_run.successful}/{eval_run.total_cases} ({eval_run.success_rate:.1%}) {bar}")
+    lines.append("-" * 80)
 
     if not compact:
         # Show all results with definitions
-        print("\nRESULTS:")
+        lines.append("\nRESULTS:")
         for r in eval_run.results:
             status = "✓" if r.has_output else "✗"
-            print(f"\n  {status} [{r.uid}] {r.word} ({r.lemma})")
-            print(f"    Sentence: \"{r.sentence[:60]}{'...' if len(r.sentence) > 60 else ''}\"")
-            print(f"    Definition: {r.definition if r.definition else '(empty)'}")
+            lines.append(f"\n  {status} [{r.uid}] {r.word} ({r.lemma})")
+            lines.append(f"    Sentence: \"{r.sentence[:60]}{'...' if len(r.sentence) > 60 else ''}\"")
+            lines.append(f"    Definition: {r.definition if r.definition else '(empty)'}")
 
-    print("=" * 80 + "\n")
+    lines.append("=" * 80 + "\n")
+    print("\n".join(lines))
+
+
+def evaluate_configuration(
+    runtime_id: str,
+    model_id: str,
+    source_lang: str,
+    target_lang: str,
+    prompt_id: Optional[str],
+    session_dir: Path,
+) -> Optional[EvalRun]:
+    """Run one configuration; errors are reported and yield None so other runs continue."""
+    print(f"\n>>> Evaluating: model={model_id}, {source_lang}->{target_lang}, prompt={prompt_id or 'default'}")
+    try:
+        return run_evaluation(
+            model_id=model_id,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            prompt_id=prompt_id,
+            session_dir=session_dir,
+            runtime_id=runtime_id,
+        )
+    except Exception as e:
+        print(f"  ERROR ({model_id}, {source_lang}->{target_lang}, prompt={prompt_id or 'default'}): {e}")
+        return None
+
+
+def format_progress(index: int, configurations: List[Tuple[str, str, str, Optional[str]]], eval_run: Optional[EvalRun]) -> str:
+    """One-line outcome of a finished configuration."""
+    model_id, source_lang, target_lang, prompt_id = configurations[index]
+    label = f"{model_id} {source_lang}->{target_lang} {prompt_id or '(default)'}"
+    if eval_run is None:
+        return f"{label} failed"
+    return f"{label} {eval_run.success_rate:.1%} in {eval_run.duration_seconds:.1f}s"
+
+
+def run_configurations(
+    configurations: List[Tuple[str, str, str, Optional[str]]],
+    session_dir: Path,
+    runtime_id: str = ChatCompletionWSD.id,
+    verbose: bool = False,
+) -> List[EvalRun]:
+    """
+    Run (model, source, target, prompt) configurations concurrently; runs keep the given order.
+    Each run is reported and appended in full to the session's _runs.jsonl as soon as it
+    completes, so an interrupted session keeps every finished run. Completed runs get a one-line
+    progress message; verbose adds the full per-case summary, which is otherwise only on disk.
+    """
+    runs_by_index = {}
+    session_path = session_dir / SESSION_RUNS_FILENAME
+
+    # Each configuration is an independent, latency-bound chain of API calls
+    done = 0
+    with open(session_path, "a", encoding="utf-8") as session_file, \
+            ThreadPoolExecutor(max_workers=MAX_CONCURRENT_RUNS) as executor:
+        futures = {
+            executor.submit(evaluate_configuration, runtime_id, model_id, source_lang, target_lang, prompt_id, session_dir): index
+            for index, (model_id, source_lang, target_lang, prompt_id) in enumerate(configurations)
+        }
+        # Completed runs are handled here, on one thread, so output from concurrent runs does not interleave
+        for future in as_completed(futures):
+            eval_run = future.result()
+            if eval_run is not None:
+                runs_by_index[futures[future]] = eval_run
+                append_eval_run(eval_run, session_file)
+                if verbose:
+                    print_summary(eval_run)
+            done += 1
+            print(f"[{done}/{len(futures)}] {format_progress(futures[future], configurations, eval_run)}")
+
+    print(f"Runs saved to: {session_path}")
+    return [runs_by_index[index] for index in sorted(runs_by_index)]
 
 
 def run_matrix_evaluation(
     models: List[str],
     source_langs: Optional[List[str]] = None,
     prompt_ids: Optional[List[str]] = None,
+    runtime_id: str = ChatCompletionWSD.id,
+    verbose: bool = False,
 ):
-    """Run evaluation across multiple models, languages, and prompts."""
+    """Run evaluation across multiple models, languages, and prompts; verbose prints every run's full summary."""
     prompt_ids = prompt_ids or [None]
 
     # Discover languages if not specified
@@ -241,39 +353,25 @@ def run_matrix_evaluation(
         source_langs = discover_languages()
 
     # Create session directory for this evaluation run
-    session_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    session_started_at = datetime.now()
+    session_ts = session_started_at.strftime("%Y%m%d_%H%M%S")
     session_dir = RESULTS_DIR / f"session_{session_ts}"
     session_dir.mkdir(parents=True, exist_ok=True)
     print(f"\nResults will be saved to: {session_dir}")
 
-    all_runs = []
-
+    configurations = []
     for model_id in models:
         for source_lang in source_langs:
-            # Load corpus to find target languages for this source
-            test_cases = load_test_corpus(source_lang)
-            target_langs = list(set(tc.target_lang for tc in test_cases))
-
-            for target_lang in target_langs:
+            for target_lang in corpus_target_langs(source_lang):
                 for prompt_id in prompt_ids:
-                    print(f"\n>>> Evaluating: model={model_id}, {source_lang}->{target_lang}, prompt={prompt_id or 'default'}")
-                    try:
-                        eval_run = run_evaluation(
-                            model_id=model_id,
-                            source_lang=source_lang,
-                            target_lang=target_lang,
-                            prompt_id=prompt_id,
-                            session_dir=session_dir,
-                        )
-                        all_runs.append(eval_run)
-                        print_summary(eval_run)
-                    except Exception as e:
-                        print(f"  ERROR: {e}")
+                    configurations.append((model_id, source_lang, target_lang, prompt_id))
+
+    all_runs = run_configurations(configurations, session_dir, runtime_id, verbose)
 
     if len(all_runs) > 1:
         print_comparison_table(all_runs)
         print_side_by_side_comparison(all_runs)
-        save_comparison_summary(all_runs, session_dir)
+        save_comparison_summary(all_runs, session_dir, session_started_at)
 
     print(f"\nResults saved to: {session_dir}")
     return all_runs
@@ -281,36 +379,42 @@ def run_matrix_evaluation(
 
 def print_comparison_table(runs: List[EvalRun]):
     """Print comparison table of all runs."""
-    print("\n" + "=" * 100)
-    print("COMPARISON TABLE")
-    print("=" * 100)
-    print(f"{'Model':<25} {'Src':<5} {'Tgt':<5} {'Prompt':<15} {'Success':<12} {'Cases':<8} {'Time':<8}")
-    print("-" * 100)
-    for r in runs:
-        prompt = r.prompt_id or "(default)"
-        print(f"{r.model_id:<25} {r.source_lang:<5} {r.target_lang:<5} {prompt:<15} "
-              f"{r.success_rate:>8.1%}    {r.total_cases:<8} {r.duration_seconds:>6.2f}s")
-    print("=" * 100 + "\n")
-
-
-def save_comparison_summary(runs: List[EvalRun], session_dir: Path):
-    """Save comparison summary to session directory."""
+    lines = [
+        "\n" + "=" * 100,
+        "COMPARISON TABLE",
+        "=" * 100,
+        f"{'Model':<25} {'Src':<5} {'Tgt':<5} {'Prompt':<15} {'Success':<12} {'Cases':<8} {'Time':<8}",
+        "-" * 100,
+    ]
+    lines.extend(
+        COMPARISON_ROW_FORMAT.format(r.model_id, r.source_lang, r.target_lang, r.prompt_id or "(default)",
+                                     r.success_rate, r.total_cases, r.duration_seconds)
+        for r in runs
+    )
+    lines.append("=" * 100 + "\n")
+    print("\n".join(lines))
+
+
+def run_summary(r: EvalRun) -> dict:
+    """Headline figures of one run, without per-case results."""
+    return {
+        "model_id": r.model_id,
+        "source_lang": r.source_lang,
+        "target_lang": r.target_lang,
+        "prompt_id": r.prompt_id,
+        "success_rate": r.success_rate,
+        "total_cases": r.total_cases,
+        "successful": r.successful,
+        "duration_seconds": r.duration_seconds,
+    }
+
+
+def save_comparison_summary(runs: List[EvalRun], session_dir: Path, session_started_at: Optional[datetime] = None):
+    """Save comparison summary to session directory, stamped with the session start time."""
     summary = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": (session_started_at or datetime.now()).isoformat(),
         "total_runs": len(runs),
-        "runs": [
-            {
-                "model_id": r.model_id,
-                "source_lang": r.source_lang,
-                "target_lang": r.target_lang,
-                "prompt_id": r.prompt_id,
-                "success_rate": r.success_rate,
-                "total_cases": r.total_cases,
-                "successful": r.successful,
-                "duration_seconds": r.duration_seconds,
-            }
-            for r in runs
-        ],
+        "runs": [run_summary(r) for r in runs],
     }
 
     filepath = session_dir / "_summary.json"
@@ -331,17 +435,18 @@ def print_side_by_side_comparison(runs: List[EvalRun]):
         key = (run.source_lang, run.target_lang)
         runs_by_lang[key].append(run)
 
-    print("\n" + "=" * 140)
-    print("SIDE-BY-SIDE COMPARISON (by input)")
-    print("=" * 140)
+    lines = []
+    lines.append("\n" + "=" * 140)
+    lines.append("SIDE-BY-SIDE COMPARISON (by input)")
+    lines.append("=" * 140)
 
     for (source_lang, target_lang), lang_runs in runs_by_lang.items():
         if len(lang_runs) < 2:
             continue
 
-        print(f"\n{'─' * 140}")
-        print(f"  {source_lang} → {target_lang}")
-        print(f"{'─' * 140}")
+        lines.append(f"\n{'─' * 140}")
+        lines.append(f"  {source_lang} → {target_lang}")
+        lines.append(f"{'─' * 140}")
 
         # Build config labels
         config_labels = []
@@ -363,9 +468,9 @@ def print_side_by_side_comparison(runs: List[EvalRun]):
         # Print each input with all its results
         for result in first_run.results:
             uid = result.uid
-            print(f"\n  ┌─ {result.word} ({result.lemma}) [{uid}]")
-            print(f"  │  \"{result.sentence[:100]}{'...' if len(result.sentence) > 100 else ''}\"")
-            print(f"  │")
+            lines.append(f"\n  ┌─ {result.word} ({result.lemma}) [{uid}]")
+            lines.append(f"  │  \"{result.sentence[:100]}{'...' if len(result.sentence) > 100 else ''}\"")
+            lines.append(f"  │")
 
             for run in lang_runs:
                 label = f"{run.model_id}|{run.prompt_id or 'default'}"
@@ -379,11 +484,12 @@ def print_side_by_side_comparison(runs: List[EvalRun]):
                     model_short = run.model_id[:20]
                     prompt_short = run.prompt_id or "default"
                     config_label = f"{model_short}, {prompt_short}"
-                    print(f"  │  {status} ({config_label:30}): {definition}")
+                    lines.append(f"  │  {status} ({config_label:30}): {definition}")
 
-            print(f"  └{'─' * 120}")
+            lines.append(f"  └{'─' * 120}")
 
-    print("\n" + "=" * 140 + "\n")
+    lines.append("\n" + "=" * 140 + "\n")
+    print("\n".join(lines))
 
 
 def prompt_selection(items: List[str], item_type: str, allow_all: bool = True) -> List[str]:
@@ -403,17 +509,16 @@ def prompt_selection(items: List[str], item_type: str, allow_all: bool = True) -
             return []
         if choice == 'a' and allow_all:
             return items
-        try:
-            indices = [int(x.strip()) - 1 for x in choice.split(',')]
-            selected = [items[i] for i in indices if 0 <= i < len(items)]
-            if selected:
-                return selected
-            print("Invalid selection, try again.")
-        except (ValueError, IndexError):
+        if not SELECTION_PATTERN.match(choice):
             print("Invalid input, try again.")
+            continue
+        selected = [items[int(x) - 1] for x in choice.split(',') if 0 < int(x) <= len(items)]
+        if selected:
+            return selected
+        print("Invalid selection, try again.")
 
 
-def interactive_evaluation():
+def interactive_evaluation(runtime_id: str = ChatCompletionWSD.id):
     """Run evaluation with interactive configuration selection."""
     print("\n" + "=" * 60)
     print("WSD EVALUATION HARNESS - Interactive Mode")
@@ -431,11 +536,7 @@ def interactive_evaluation():
         return
 
     # Step 2: Discover and select target languages from selected corpora
-    all_target_langs = set()
-    for source_lang in source_langs:
-        test_cases = load_test_corpus(source_lang)
-        for tc in test_cases:
-            all_target_langs.add(tc.target_lang)
+    all_target_langs = frozenset().union(*(corpus_target_langs(source_lang) for source_lang in source_langs))
 
     target_langs = prompt_selection(sorted(all_target_langs), "target language")
     if not target_langs:
@@ -467,6 +568,7 @@ def interactive_evaluation():
     print(f"Target languages: {', '.join(target_langs)}")
     print(f"Models: {', '.join(selected_models)}")
     print(f"Prompts: {', '.join(selected_prompt_names)}")
+    print(f"Runtime: {runtime_id}")
 
     confirm = input("\nProceed with evaluation? (y/n): ").strip().lower()
     if confirm != 'y':
@@ -474,43 +576,31 @@ def interactive_evaluation():
         return
 
     # Create session directory for this evaluation run
-    session_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    session_started_at = datetime.now()
+    session_ts = session_started_at.strftime("%Y%m%d_%H%M%S")
     session_dir = RESULTS_DIR / f"session_{session_ts}"
     session_dir.mkdir(parents=True, exist_ok=True)
     print(f"\nResults will be saved to: {session_dir}")
 
     # Run evaluations
-    all_runs = []
+    configurations = []
     for model_id in selected_models:
         for source_lang in source_langs:
-            test_cases = load_test_corpus(source_lang)
-            corpus_target_langs = set(tc.target_lang for tc in test_cases)
-
             for target_lang in target_langs:
-                if target_lang not in corpus_target_langs:
+                if target_lang not in corpus_target_langs(source_lang):
                     continue
 
                 for prompt_id in selected_prompts:
-                    prompt_name = prompt_id or "default"
-                    print(f"\n>>> Evaluating: model={model_id}, {source_lang}->{target_lang}, prompt={prompt_name}")
-                    try:
-                        eval_run = run_evaluation(
-                            model_id=model_id,
-                            source_lang=source_lang,
-                            target_lang=target_lang,
-                            prompt_id=prompt_id,
-                            session_dir=session_dir,
-                        )
-                        all_runs.append(eval_run)
-                        print_summary(eval_run)
-                    except Exception as e:
-                        print(f"  ERROR: {e}")
+                    configurations.append((model_id, source_lang, target_lang, prompt_id))
+
+    # Interactive sessions are small; show each run in full as before
+    all_runs = run_configurations(configurations, session_dir, runtime_id, verbose=True)
 
     if len(all_runs) > 1:
         print_comparison_table(all_runs)
         print_side_by_side_comparison(all_runs)
         # Save comparison table to session directory
-        save_comparison_summary(all_runs, session_dir)
+        save_comparison_summary(all_runs, session_dir, session_started_at)
 
     print(f"\nCompleted {len(all_runs)} evaluation run(s).")
     print(f"Results saved to: {session_dir}")
@@ -518,17 +608,19 @@ def interactive_evaluation():
 
 # === CLI Entry Points ===
 
-def test_single_evaluation():
-    """Quick test with default settings."""
+@pytest.mark.parametrize("model_id", MODELS)
+def test_single_evaluation(model_id):
+    """Quick test with default settings, one independent case per model."""
     eval_run = run_evaluation(
-        model_id="gpt-5.1",
+        model_id=model_id,
         source_lang="pl",
         target_lang="en",
     )
     print_summary(eval_run)
 
 
-def test_matrix_evaluation():
+@pytest.mark.compare
+def test_matrix_evaluation(runtime_id: str = ChatCompletionWSD.id):
     """Run matrix evaluation across multiple configurations."""
     wsd_prompts = list_prompts("wsd")
     print(f"Available WSD prompts: {wsd_prompts}")
@@ -537,12 +629,16 @@ def test_matrix_evaluation():
         models=MODELS,
         source_langs=None,  # Auto-discover all languages
         prompt_ids=[None] + wsd_prompts,
+        runtime_id=runtime_id,
     )
 
 
 if __name__ == "__main__":
     import sys
+    bootstrap_all()
+    # --batch submits each run as one Batch API job: cheaper, but results can take hours
+    runtime_id = ChatCompletionWSDBatch.id if "--batch" in sys.argv[1:] else ChatCompletionWSD.id
     if len(sys.argv) > 1 and sys.argv[1] == "matrix":
-        test_matrix_evaluation()
+        test_matrix_evaluation(runtime_id)
     else:
-        interactive_evaluation()
+        interactive_evaluation(runtime_id)